@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+AFK Simulation - Fast-forward the mascot through hours of AFK behavior, headless
+
+Runs a DesktopMascot on a virtual clock (core.virtual_time) with a seeded
+random generator under the offscreen Qt platform, so a day of AFK behavior
+takes tens of seconds (timer callbacks still cost real time; 24 h took 14 s
+here) and the same seed always plays out the same way. Prints the behavior trace (AFK picks
+and state changes with their virtual time), how long was spent in each
+state, and the timer, object and memory counts at the end.
+
+Without the heart bullet sprites no shot can hit, so a showdown would never
+end and its shooting and sliding timers would speed up to every 50 and 10
+ms for the rest of the run. The simulation then wins each showdown after
+SHOWDOWN_CAP_MS of shooting (marked "sim" in the trace).
+
+Usage: python benchmarks/afk_simulation.py [hours] [seed] [--trace]
+       (--trace prints every trace entry instead of the first and last 20)
+"""
+
+import os
+import sys
+import gc
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEvent, qInstallMessageHandler
+from PyQt5.QtGui import QCursor
+
+from core.mascot import DesktopMascot
+from core.state_machine import MascotState
+from core.virtual_time import create_virtual_runtime
+from utils import log
+
+CHUNK_MS = 60000          # Let Qt process posted events once per virtual minute
+START_TIME = 1700000000.0 # Fixed virtual epoch so runs are reproducible
+TRACE_PREVIEW = 20
+SHOWDOWN_CAP_MS = 60000   # Virtual ms a sprite-less showdown shoots before the simulation wins it
+HEART_BULLET_ANIMATION = 'gun_spr_heart_yellow_shot'
+
+
+class DiscardOutput:
+    """Swallows anything the mascot prints (and Qt's warnings) during the run, counting the lines."""
+
+    def __init__(self):
+        self.lines = 0
+        self.qt_messages = 0
+
+    def write(self, text):
+        self.lines += text.count('\n')
+
+    def flush(self):
+        pass
+
+    def on_qt_message(self, message_type, context, message):
+        self.qt_messages += 1
+
+
+def format_time(ms):
+    seconds = int(ms // 1000)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def get_memory_counts():
+    counts = {'python_blocks': sys.getallocatedblocks()}
+    try:
+        import resource
+        counts['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+    return counts
+
+
+def run(hours, seed, full_trace=False):
+    app = QApplication.instance() or QApplication(sys.argv)
+    runtime = create_virtual_runtime(seed, START_TIME)
+    clock = runtime.clock
+    timers = runtime.timers
+
+    trace = []
+    state_time = {}
+    current = {'state': MascotState.IDLE, 'since': 0.0}
+
+    output = DiscardOutput()
+    log.get_logger().configure(console=False, file=False)  # Count log messages, don't write them
+    real_stdout = sys.stdout
+    sys.stdout = output
+    qInstallMessageHandler(output.on_qt_message)
+    try:
+        mascot = DesktopMascot(runtime)
+        mascot.show()
+        screen = app.primaryScreen().geometry()
+        QCursor.setPos(screen.center())
+
+        # Without bullet sprites a showdown can't end by itself: win it after SHOWDOWN_CAP_MS
+        showdown_cap = None
+        if not mascot.animation_loader.get_animation(HEART_BULLET_ANIMATION):
+            showdown_cap = runtime.create_timer(name='afk_simulation.showdown_cap')
+            showdown_cap.setSingleShot(True)
+
+            def win_showdown():
+                if mascot.state.state is MascotState.SHOWDOWN and mascot.showdown_phase == 'shooting':
+                    trace.append((clock.now_ms, 'sim', 'showdown won (no bullet sprites)'))
+                    mascot.start_showdown_victory_sequence()
+            showdown_cap.timeout.connect(win_showdown)
+
+        # Record state changes and AFK picks
+        def on_state_entered():
+            state = mascot.state.state
+            state_time[current['state']] = state_time.get(current['state'], 0.0) + clock.now_ms - current['since']
+            current['state'] = state
+            current['since'] = clock.now_ms
+            trace.append((clock.now_ms, 'state', state.value))
+            if showdown_cap is not None and state is MascotState.SHOWDOWN:
+                showdown_cap.start(SHOWDOWN_CAP_MS)
+        mascot.state.on_enter(list(MascotState), on_state_entered)
+
+        def traced(name, handler):
+            def run_behavior():
+                trace.append((clock.now_ms, 'afk', name))
+                handler()
+            return run_behavior
+        for behavior in mascot.logic.afk_behaviors.behaviors:
+            behavior.handler = traced(behavior.name, behavior.handler)
+
+        objects_before = len(gc.get_objects())
+        started = time.perf_counter()
+        remaining = hours * 3600 * 1000
+        while remaining > 0:
+            step = min(CHUNK_MS, remaining)
+            timers.advance(step)
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+            app.processEvents()
+            remaining -= step
+        elapsed = time.perf_counter() - started
+        state_time[current['state']] = state_time.get(current['state'], 0.0) + clock.now_ms - current['since']
+    finally:
+        sys.stdout = real_stdout
+        qInstallMessageHandler(None)
+
+    gc.collect()
+    total_ms = hours * 3600 * 1000
+
+    print(f"AFK simulation: {hours}h virtual in {elapsed:.1f}s real ({total_ms / 1000 / max(elapsed, 1e-9):.0f}x), seed {seed}")
+    print(f"\nBehavior trace ({len(trace)} entries)")
+    entries = trace if full_trace or len(trace) <= 2 * TRACE_PREVIEW else trace[:TRACE_PREVIEW] + [None] + trace[-TRACE_PREVIEW:]
+    for entry in entries:
+        if entry is None:
+            print("  ...")
+            continue
+        at, kind, name = entry
+        print(f"  {format_time(at)}  {kind:<5} {name}")
+
+    picks = {}
+    for _, kind, name in trace:
+        if kind == 'afk':
+            picks[name] = picks.get(name, 0) + 1
+    print("\nAFK picks")
+    for name, count in sorted(picks.items(), key=lambda item: -item[1]):
+        print(f"  {name:<20} {count:>6}")
+
+    print("\nTime per state")
+    for state, ms in sorted(state_time.items(), key=lambda item: -item[1]):
+        print(f"  {state.value:<22} {format_time(ms):>9}  {ms / total_ms * 100:5.1f}%")
+
+    print("\nCounts")
+    print(f"  timers:          {timers.get_stats()}")
+    print(f"  scheduler:       {mascot.logic.scheduler.get_stats()}")
+    print(f"  input snapshot:  {runtime.snapshot.get_stats()}")
+    print(f"  state changes:   {mascot.state.transition_count}")
+    print(f"  python objects:  {len(gc.get_objects())} (after startup: {objects_before})")
+    print(f"  top-level widgets: {len(app.topLevelWidgets())}")
+    print(f"  memory:          {get_memory_counts()}")
+    print(f"  log messages:    {log.get_logger().get_stats()}")
+    print(f"  output lines:    {output.lines} (Qt messages: {output.qt_messages})")
+
+    if runtime.metrics.enabled:
+        print(f"\nBehavior costs (CPU of the {runtime.metrics.behaviors.cpu_source.replace('_', ' ')}, "
+              f"rates per virtual second)")
+        print(f"  {'behavior':<28} {'runs':>5} {'active':>9} {'cpu ms/run':>11} {'wakeups/s':>10} {'fps':>6}")
+        costs = runtime.metrics.behaviors.snapshot()
+        for name, cost in sorted(costs.items(), key=lambda item: -item[1]['cpu_ms']):
+            print(f"  {name:<28} {cost['runs']:>5} {format_time(cost['seconds'] * 1000):>9} "
+                  f"{cost['cpu_ms_per_run']:>11.1f} {cost['wakeups_per_second']:>10.1f} {cost['fps']:>6.1f}")
+
+        print("\nTimer callbacks (cost is real time, lateness virtual)")
+        for line in runtime.metrics.format_table(10):
+            print(f"  {line}")
+
+
+def main():
+    if '-h' in sys.argv or '--help' in sys.argv:
+        print(__doc__.strip())
+        return
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+    hours = float(args[0]) if args else 24
+    seed = int(args[1]) if len(args) > 1 else 1
+    run(hours, seed, full_trace='--trace' in sys.argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Follow Benchmark - Replays a cursor trace through the old follow-mouse rule and the pursuit controller
+
+Both followers chase the same cursor trace on a virtual clock. The old rule
+ticks every 50 ms, moves straight at the cursor and faces whichever axis is
+bigger; the PursuitController steers towards a predicted target, keeps its
+facing until the other axis clearly leads and picks its own tick interval.
+Catching the cursor starts the usual 10 s dance before following resumes.
+Prints ticks and animation restarts per second of following (and how many
+of those restarts were flips back to the facing before within 0.5 s),
+catches, the time spent in the follower code and the cost of the whole
+tick: the follower, moving a frameless sprite window like the mascot's,
+showing the new animation's first frame when the facing changes and
+letting Qt process the resulting events (moves, repaints). Without PyQt5
+(or with --no-widget) only the follower code is timed.
+
+A trace is a CSV file of "t_ms,x,y" lines. Record one from the real cursor
+with --record (move the mouse around while it runs); without a file a
+seeded, human-like trace is generated (eased moves between random points,
+slow drifts, pauses and hand jitter). Without a file --traces generated
+traces (seeds --seed, --seed + 1, ...) are replayed and added up: whether
+one catch comes a little earlier changes everything after it, so catch
+times from a single trace are mostly noise.
+
+Usage: python benchmarks/follow_benchmark.py [trace.csv] [--seconds N] [--seed N] [--traces N] [--no-widget]
+       python benchmarks/follow_benchmark.py --record trace.csv [--seconds N]
+"""
+
+import os
+import sys
+import math
+import time
+import random
+from bisect import bisect_right
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.pursuit import PursuitController
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+SAMPLE_MS = 16               # Trace sample rate when generating or recording
+CATCH_DISTANCE = 50          # Same as follow_mouse
+DANCE_MS = 10000             # Timed dance after a catch
+VELOCITY_WINDOW = 0.2        # Same as the InputSnapshot default
+FLIP_MS = 500                # A facing change undone within this long counts as a flip
+WALK, RUN, SUPER_RUN = 120, 240, 480  # px/s (the old 6/12/24 px per 50 ms tick)
+
+
+# Traces
+def generate_trace(seconds, seed):
+    """Eased moves between random points, slow drifts and pauses with a little jitter, sampled every SAMPLE_MS."""
+    rng = random.Random(seed)
+    trace = []
+    t = 0.0
+    x, y = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
+    end = seconds * 1000
+    while t < end:
+        # Pause with hand jitter
+        pause = rng.uniform(200, 1500)
+        stop = min(end, t + pause)
+        while t < stop:
+            trace.append((t, x + rng.gauss(0, 1.5), y + rng.gauss(0, 1.5)))
+            t += SAMPLE_MS
+        if rng.random() < 0.4:
+            # Slow drift (reading, nudging a selection) in a random direction
+            angle = rng.uniform(0, 2 * math.pi)
+            drift_speed = rng.uniform(30, 150) / 1000
+            stop = min(end, t + rng.uniform(1000, 3000))
+            while t < stop:
+                x = min(SCREEN_WIDTH, max(0, x + math.cos(angle) * drift_speed * SAMPLE_MS))
+                y = min(SCREEN_HEIGHT, max(0, y + math.sin(angle) * drift_speed * SAMPLE_MS))
+                trace.append((t, x + rng.gauss(0, 1.5), y + rng.gauss(0, 1.5)))
+                t += SAMPLE_MS
+            continue
+        # Eased move to a new point (diagonals included)
+        target_x, target_y = rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+        duration = rng.uniform(300, 1200)
+        start_t, start_x, start_y = t, x, y
+        while t < min(end, start_t + duration):
+            p = (t - start_t) / duration
+            ease = p * p * (3 - 2 * p)
+            trace.append((t, start_x + (target_x - start_x) * ease, start_y + (target_y - start_y) * ease))
+            t += SAMPLE_MS
+        x, y = target_x, target_y
+    return trace
+
+
+def load_trace(path):
+    trace = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] not in '0123456789.-':
+                continue
+            t, x, y = line.split(',')[:3]
+            trace.append((float(t), float(x), float(y)))
+    return trace
+
+
+def record_trace(path, seconds):
+    """Sample the real cursor every SAMPLE_MS for seconds and write it as a trace."""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer, QElapsedTimer
+    from PyQt5.QtGui import QCursor
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    samples = []
+    clock = QElapsedTimer()
+    clock.start()
+
+    def sample():
+        pos = QCursor.pos()
+        samples.append((clock.elapsed(), pos.x(), pos.y()))
+        if clock.elapsed() >= seconds * 1000:
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(sample)
+    timer.start(SAMPLE_MS)
+    print(f"Recording the cursor for {seconds}s - move the mouse around")
+    app.exec_()
+    with open(path, 'w') as f:
+        f.write("t_ms,x,y\n")
+        for t, x, y in samples:
+            f.write(f"{t},{x},{y}\n")
+    print(f"Wrote {len(samples)} samples to {path}")
+
+
+class TraceCursor:
+    """Cursor position at any time of a trace, and the velocity estimate the snapshot would give."""
+
+    def __init__(self, trace):
+        self.trace = trace
+        self.times = [t for t, _, _ in trace]
+        self.history = deque(maxlen=16)
+
+    def position(self, t_ms):
+        i = bisect_right(self.times, t_ms)
+        if i == 0:
+            return self.trace[0][1:]
+        if i == len(self.trace):
+            return self.trace[-1][1:]
+        t0, x0, y0 = self.trace[i - 1]
+        t1, x1, y1 = self.trace[i]
+        p = (t_ms - t0) / (t1 - t0) if t1 > t0 else 0.0
+        return x0 + (x1 - x0) * p, y0 + (y1 - y0) * p
+
+    def sample(self, t_ms):
+        """Read the cursor like InputSnapshot.cursor_pos(), keeping its history."""
+        x, y = self.position(t_ms)
+        x, y = int(x), int(y)
+        self.history.append((t_ms / 1000, x, y))
+        return x, y
+
+    def velocity(self):
+        if len(self.history) < 2:
+            return 0.0, 0.0
+        now, x, y = self.history[-1]
+        for sample_t, sample_x, sample_y in self.history:
+            if now - sample_t <= VELOCITY_WINDOW:
+                break
+        if sample_t >= now:
+            return 0.0, 0.0
+        return (x - sample_x) / (now - sample_t), (y - sample_y) / (now - sample_t)
+
+
+class SpriteWindow:
+    """A frameless, translucent sprite window like the mascot's, moved and repainted as follow_mouse does."""
+
+    SIZE = 128
+
+    def __init__(self):
+        from PyQt5.QtWidgets import QApplication, QWidget
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QPixmap, QColor
+        from core.sprite_view import SpriteView
+
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.window = QWidget()
+        self.window.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.window.setAttribute(Qt.WA_TranslucentBackground)
+        self.window.resize(self.SIZE, self.SIZE)
+        self.view = SpriteView(self.window)
+        self.view.resize(self.SIZE, self.SIZE)
+        # One first frame per facing, as start_animation() would show
+        self.frames = {}
+        for index, direction in enumerate(('left', 'right', 'up', 'down')):
+            pixmap = QPixmap(self.SIZE, self.SIZE)
+            pixmap.fill(QColor(60 * index, 120, 200, 200))
+            self.frames[direction] = pixmap
+        self.view.setPixmap(self.frames['right'])
+        self.window.show()
+        self.app.processEvents()
+
+    def show(self, x, y, direction, restarted):
+        if restarted:
+            self.view.setPixmap(self.frames[direction])
+        self.window.move(x, y)
+        self.app.processEvents()
+
+    def close(self):
+        self.window.close()
+        self.app.processEvents()
+
+
+# Followers
+class LegacyFollower:
+    """follow_mouse as it was: 50 ms ticks, straight at the cursor, facing the bigger axis."""
+
+    name = 'fixed 50 ms'
+
+    def start(self):
+        pass
+
+    def tick(self, x, y, cursor, velocity, speed, dt):
+        dx, dy = cursor[0] - x, cursor[1] - y
+        distance = math.hypot(dx, dy)
+        if abs(dx) > abs(dy):
+            direction = 'right' if dx > 0 else 'left'
+        else:
+            direction = 'down' if dy > 0 else 'up'
+        step = speed * 0.05
+        if distance > 0:
+            x += int(dx / distance * step)
+            y += int(dy / distance * step)
+        return x, y, direction, 50
+
+
+class PursuitFollower:
+    name = 'pursuit'
+
+    def __init__(self):
+        self.controller = PursuitController()
+
+    def start(self):
+        self.controller.reset()
+
+    def tick(self, x, y, cursor, velocity, speed, dt):
+        return self.controller.step(x, y, cursor[0], cursor[1], velocity[0], velocity[1], speed, dt)
+
+
+def run(follower, trace, window=None):
+    cursor = TraceCursor(trace)
+    end = trace[-1][0]
+    x, y = 100, SCREEN_HEIGHT - 200
+    t = 0.0
+    follow_start = 0.0
+    last_tick = None
+    direction = None
+    previous_direction, changed_at = None, None
+    stats = {'ticks': 0, 'restarts': 0, 'flips': 0, 'catches': 0, 'following_ms': 0.0, 'catch_ms': [],
+             'cpu': 0.0, 'tick_cpu': 0.0}
+    follower.start()
+
+    while t < end:
+        position = cursor.sample(t)
+        if math.hypot(position[0] - x, position[1] - y) < CATCH_DISTANCE:
+            # Caught it: dance, then start following again
+            stats['catches'] += 1
+            stats['catch_ms'].append(t - follow_start)
+            stats['following_ms'] += t - follow_start
+            t += DANCE_MS
+            follow_start, last_tick, direction, previous_direction = t, None, None, None
+            follower.start()
+            continue
+
+        elapsed = (t - follow_start) / 1000
+        speed = SUPER_RUN if elapsed > 20 else RUN if elapsed > 10 else WALK
+        dt = min(0.25, (t - last_tick) / 1000) if last_tick is not None else 0.05
+        last_tick = t
+
+        started = time.perf_counter()
+        x, y, new_direction, interval = follower.tick(x, y, position, cursor.velocity(), speed, dt)
+        stepped = time.perf_counter()
+        restarted = new_direction != direction
+        if window is not None:
+            window.show(x, y, new_direction, restarted)
+        stats['cpu'] += stepped - started
+        stats['tick_cpu'] += time.perf_counter() - started
+
+        stats['ticks'] += 1
+        if restarted:
+            if direction is not None:
+                stats['restarts'] += 1
+                if new_direction == previous_direction and t - changed_at < FLIP_MS:
+                    stats['flips'] += 1
+            previous_direction, direction, changed_at = direction, new_direction, t
+        t += interval
+
+    if t - follow_start > 0 and follow_start < end:
+        stats['following_ms'] += min(t, end) - follow_start
+    return stats
+
+
+def report(name, stats, window):
+    seconds = max(stats['following_ms'] / 1000, 1e-9)
+    catch = sum(stats['catch_ms']) / len(stats['catch_ms']) / 1000 if stats['catch_ms'] else float('nan')
+    tick = f"{stats['tick_cpu'] / seconds * 1e6:>14.1f}" if window else f"{'-':>14}"
+    print(f"  {name:<12} {stats['ticks'] / seconds:>8.1f} {stats['restarts'] / seconds:>11.2f} {stats['flips'] / seconds:>8.2f} "
+          f"{stats['catches']:>8} {catch:>10.1f} {stats['cpu'] / seconds * 1e6:>14.1f} {tick}")
+
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name, default):
+        if name in args:
+            value = args[args.index(name) + 1]
+            del args[args.index(name):args.index(name) + 2]
+            return value
+        return default
+
+    use_widget = '--no-widget' not in args
+    if not use_widget:
+        args.remove('--no-widget')
+    seconds = float(option('--seconds', 300))
+    seed = int(option('--seed', 1))
+    trace_count = int(option('--traces', 8))
+    record_path = option('--record', None)
+    if record_path:
+        record_trace(record_path, seconds)
+        return
+
+    if args:
+        traces = [load_trace(args[0])]
+        source = args[0]
+    else:
+        traces = [generate_trace(seconds, seed + index) for index in range(trace_count)]
+        source = f"generated, seeds {seed}-{seed + trace_count - 1}" if trace_count > 1 else f"generated, seed {seed}"
+    print(f"Follow benchmark: {sum(len(trace) for trace in traces)} samples, "
+          f"{sum(trace[-1][0] for trace in traces) / 1000:.0f}s ({source})")
+    window = None
+    if use_widget:
+        try:
+            window = SpriteWindow()
+        except ImportError:
+            print("  (PyQt5 not available: timing the follower code only)")
+    print(f"  {'follower':<12} {'ticks/s':>8} {'restarts/s':>11} {'flips/s':>8} {'catches':>8} {'catch (s)':>10} "
+          f"{'follower us/s':>14} {'tick us/s':>14}")
+    for follower in (LegacyFollower(), PursuitFollower()):
+        total = None
+        for trace in traces:
+            stats = run(follower, trace, window)
+            if total is None:
+                total = stats
+            else:
+                for key, value in stats.items():
+                    total[key] += value
+        report(follower.name, total, window)
+    if window is not None:
+        window.close()
+
+
+if __name__ == "__main__":
+    main()
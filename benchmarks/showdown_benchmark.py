@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Showdown Benchmark - Per-step cost of the showdown bullet simulation
+
+Compares the vectorized ShowdownSimulation step with the old per-bullet
+update (one Python call per bullet doing its own move, sqrt hit test and
+screen-bound check) for 10, 100 and 1000 simultaneous bullets.
+
+Usage: python benchmarks/showdown_benchmark.py [steps]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.showdown_sim import ShowdownSimulation
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+BOUNDS = (-100, -100, SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100)
+HIT_RADIUS = 30
+FRAME_COUNT = 6
+BULLET_SIZE = 32
+
+
+class ScalarBullet:
+    """Per-bullet state as the old timer-per-bullet code kept it."""
+
+    def __init__(self, x, y, move_x, move_y, speed, max_distance):
+        self.x = x
+        self.y = y
+        self.move_x = move_x
+        self.move_y = move_y
+        self.speed = speed
+        self.move_distance = 0.0
+        self.max_distance = max_distance
+        self.animation_frame = 0
+        self.alive = True
+
+
+def update_scalar_bullet(bullet, cursor_x, cursor_y, screen_width, screen_height):
+    """The old per-bullet timer callback, minus the widget calls."""
+    if bullet.animation_frame < FRAME_COUNT - 1:
+        bullet.animation_frame += 1
+    bullet.x += bullet.move_x
+    bullet.y += bullet.move_y
+    bullet.move_distance += bullet.speed
+
+    center_x = int(bullet.x) + BULLET_SIZE // 2
+    center_y = int(bullet.y) + BULLET_SIZE // 2
+    hit_distance = ((center_x - cursor_x)**2 + (center_y - cursor_y)**2)**0.5
+    if hit_distance <= HIT_RADIUS:
+        bullet.alive = False
+        return
+    if (bullet.move_distance > bullet.max_distance or
+        bullet.x < -100 or bullet.x > screen_width + 100 or
+        bullet.y < -100 or bullet.y > screen_height + 100):
+        bullet.alive = False
+
+
+def make_shots(count, rng):
+    """Random bullets fired from the bottom of the screen, aimed away from the cursor."""
+    shots = []
+    for _ in range(count):
+        x = rng.uniform(0, SCREEN_WIDTH)
+        y = SCREEN_HEIGHT - 100
+        dx = rng.uniform(-1, 1)
+        dy = -1.0
+        length = (dx * dx + dy * dy) ** 0.5
+        speed = 8 * rng.uniform(1, 4)
+        # Effectively unlimited range so every bullet stays alive for the whole run
+        shots.append((x, y, dx / length * speed * 0.01, dy / length * speed * 0.01, speed, 1e9))
+    return shots
+
+
+def bench_vectorized(shots, steps):
+    sim = ShowdownSimulation(capacity=len(shots))
+    for x, y, move_x, move_y, speed, max_distance in shots:
+        sim.spawn(x, y, move_x, move_y, max_distance, BULLET_SIZE, BULLET_SIZE, FRAME_COUNT)
+    start = time.perf_counter()
+    for _ in range(steps):
+        sim.step((-10000, -10000), (-10000, -10000), BOUNDS, HIT_RADIUS)
+    elapsed = time.perf_counter() - start
+    return elapsed, sim.active_count()
+
+
+def bench_scalar(shots, steps):
+    bullets = [ScalarBullet(*shot) for shot in shots]
+    start = time.perf_counter()
+    for _ in range(steps):
+        for bullet in bullets:
+            if bullet.alive:
+                update_scalar_bullet(bullet, -10000, -10000, SCREEN_WIDTH, SCREEN_HEIGHT)
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(1 for bullet in bullets if bullet.alive)
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(42)
+
+    print(f"Showdown simulation benchmark ({steps} steps per run)")
+    print(f"{'bullets':>8} {'per-bullet us/step':>20} {'vectorized us/step':>20} {'speedup':>8}")
+    for count in (10, 100, 1000):
+        shots = make_shots(count, rng)
+        scalar_time, scalar_alive = bench_scalar(shots, steps)
+        vector_time, vector_alive = bench_vectorized(shots, steps)
+        if scalar_alive != vector_alive:
+            print(f"Warning: {count} bullets ended with {scalar_alive} (per-bullet) vs {vector_alive} (vectorized) alive")
+        scalar_us = scalar_time / steps * 1e6
+        vector_us = vector_time / steps * 1e6
+        print(f"{count:>8} {scalar_us:>20.1f} {vector_us:>20.1f} {scalar_us / vector_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
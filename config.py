@@ -18,9 +18,15 @@ BEHAVIOR_SETTINGS = {
     'idle_action_min_interval': 3000,  # minimum time between random actions (ms)
     'idle_action_max_interval': 8000,  # maximum time between random actions (ms)
     'mouse_follow_speed': 3,           # pixels per update when following mouse
-    'mouse_follow_update_rate': 50,    # milliseconds between position updates
+    'mouse_follow_update_rate': 50,    # milliseconds between position updates (near or fast cursor)
+    'mouse_follow_max_interval': 120,  # milliseconds between position updates (far, still cursor)
+    'mouse_follow_direction_hysteresis': 0.3,  # how far the other axis must lead before the facing turns
     'mouse_proximity_threshold': 100,  # pixels - distance to consider mouse "near"
+    'mouse_proximity_hysteresis': 20,  # pixels past a zone's radius before the mouse counts as having left
     'mouse_idle_threshold': 5000,      # milliseconds of no movement to consider mouse idle
+    'mouse_poll_min_interval': 100,    # cursor poll interval while the mouse moves (ms)
+    'mouse_poll_max_interval': 3200,   # cursor poll interval after backing off while it stays still (ms)
+    'enable_proximity_reactions': False,  # nod/pose when the mouse comes near an idle mascot (interrupts idle poses and AFK sitting)
     'reaction_probability': 0.3,       # probability of reacting when mouse is near
     'idle_sequence_trigger_time': 5000,  # time before starting dance sequence (ms)
     'dance_sequence_duration': 60000,   # duration of dance sequence (ms)
@@ -45,7 +51,8 @@ WINDOW_SETTINGS = {
     'default_width': 64,   # default sprite width
     'default_height': 64,  # default sprite height
     'always_on_top': True, # keep mascot on top of other windows
-    'transparent_background': True
+    'transparent_background': True,
+    'overlay_compositor': False  # draw bullets and memes in one overlay window per screen
 }
 
 # Size scaling settings
@@ -60,15 +67,46 @@ PERFORMANCE_SETTINGS = {
     'max_action_history': 5,           # number of recent actions to remember
     'animation_cache_size': 50,        # maximum number of animations to cache
     'low_resource_mode': False,        # enable for better performance on low-end systems
-    'reduce_animation_quality': False  # reduce animation quality for performance
+    'reduce_animation_quality': False, # reduce animation quality for performance
+    'showdown_tick_ms': 30,            # showdown bullet update interval (hits stay exact at longer ticks)
+    'cursor_sample_interval': 10,      # readers within this many ms share one cursor sample
+    'cursor_history_size': 16,         # cursor samples kept for velocity estimates
+    'cursor_velocity_window': 200,     # ms of cursor history the velocity estimate spans
+    'enable_metrics': True             # measure every timer callback (cost, lateness, dropped frames)
 }
 
 # Debug settings
 DEBUG_SETTINGS = {
     'enable_debug_output': False,      # print debug information
-    'show_animation_info': False,      # show current animation info
+    'show_animation_info': False,      # show the performance HUD (animation, fps, frame cost, ...) next to the mascot
+    'hud_refresh_interval': 1000,      # ms between performance HUD refreshes
     'log_mouse_events': False,         # log mouse interaction events
-    'log_behavior_changes': False      # log behavior state changes
+    'log_behavior_changes': False,     # log behavior state changes
+    'log_level': 'INFO',               # DEBUG, INFO, WARNING or ERROR (DEBUG when enable_debug_output is on)
+    'log_category_levels': {},         # per-category overrides, e.g. {'showdown': 'DEBUG'}
+    'log_rate_limit': 5,               # messages per second from one call site before the rest are counted
+    'log_to_console': True,            # write to stdout when there is one
+    'log_to_file': True,               # write to mascot.log in the config directory
+    'log_file_max_bytes': 1048576,     # rotate mascot.log at this size
+    'log_file_backups': 3,             # rotated files kept
+    'log_buffer_size': 4096,           # messages buffered for the writer thread before the oldest are dropped
+    'log_flush_interval': 250,         # ms the writer thread waits to batch a burst
+    'trace_buffer_size': 200000,       # trace events kept while recording (the oldest are dropped)
+    'trace_on_startup': False,         # record a trace from startup (to include sprite loading)
+    'profile_top_n': 25,               # functions listed in the log when profiling stops
+    'profile_sort': 'cumulative',      # pstats sort key for that list ('cumulative', 'tottime', ...)
+    'sampling_on_startup': False,      # run the sampling profiler from startup
+    'sampling_interval': 10,           # ms between samples of the GUI thread's stack
+    'sampling_max_overhead': 0.01,     # share of time sampling may take before the interval backs off
+    'sampling_max_stacks': 20000,      # distinct stacks kept (later new ones are only counted)
+    'sampling_max_depth': 64,          # frames kept per stack (outermost dropped)
+    'watchdog_enabled': False,         # detect the GUI thread blocking the event loop (also in the tray's Diagnostics menu; adds wakeups)
+    'watchdog_heartbeat_interval': 100, # ms between GUI thread heartbeats
+    'watchdog_threshold': 250,         # ms a heartbeat may be overdue before it counts as a stall
+    'watchdog_stack_depth': 12,        # innermost frames of the GUI thread's stack kept per stall
+    'memory_trace_on_startup': False,  # start tracemalloc at startup instead of at the first memory snapshot
+    'memory_trace_frames': 1,          # frames of traceback tracemalloc keeps per allocation
+    'memory_diff_top_n': 15            # classes and allocation sites listed in a memory snapshot diff
 }
 
 # Character interaction settings
@@ -93,6 +131,13 @@ AFK_BEHAVIOR_SETTINGS = {
     'enable_whale_mail': True      # enable whale mail delivery
 }
 
+# Incremented by update_setting() so caches built from settings know when to rebuild
+_settings_version = 0
+
+def get_settings_version():
+    """Get a counter that changes whenever a setting is updated."""
+    return _settings_version
+
 def get_setting(category, key, default=None):
     """Get a configuration setting by category and key."""
     categories = {
@@ -125,7 +170,9 @@ def update_setting(category, key, value):
     }
     
     if category in categories:
+        global _settings_version
         categories[category][key] = value
+        _settings_version += 1
         return True
     return False
 
@@ -5,24 +5,39 @@ Animation Loader - Handles loading and managing sprite animations
 
 import os
 import glob
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPixmap, QImage
 from utils.path_helper import get_sprites_path
+from utils import log, trace
 import config
 
 class AnimationLoader:
     """Loads and manages sprite animations from the assets directory."""
     
+    # Maximum number of (scale, devicePixelRatio) variants kept per animation
+    MAX_SCALED_VARIANTS = 4
+    
     def __init__(self):
         self.animations = {}
         self.categories = {}
+        
+        # Scaled frame cache counters (see get_cache_stats)
+        self.scaled_frame_hits = 0
+        self.scaled_frame_misses = 0
+        self.scaled_frame_bytes = 0
+        self.source_frame_bytes = None
+        
         self.load_all_animations()
+        
+        if log.is_enabled('animation', log.INFO):
+            self.report_dirty_rect_savings()
     
     def load_all_animations(self):
         """Load all animations from the sprites directory."""
         sprites_path = get_sprites_path()
         
         if not os.path.exists(sprites_path):
-            print(f"Warning: Sprites directory not found at {sprites_path}")
+            log.warning('animation', "Sprites directory not found at %s", sprites_path)
             return
         
         # Scan all subdirectories in sprites folder
@@ -38,23 +53,24 @@ class AnimationLoader:
             # Check if this is a simple animation directory or has subdirectories
             subdirs = [d for d in os.listdir(category_path) if os.path.isdir(os.path.join(category_path, d))]
             
-            if subdirs:
-                # Has subdirectories (like walking/up, walking/down, etc.)
-                for subdir in subdirs:
-                    subdir_path = os.path.join(category_path, subdir)
-                    animation_name = f"{category_name}_{subdir}"
-                    self.load_animation_from_directory(animation_name, subdir_path)
-                    self.categories[category_name].append(animation_name)
+            with trace.span('load_sprites', 'sprites', category=category_name):
+                if subdirs:
+                    # Has subdirectories (like walking/up, walking/down, etc.)
+                    for subdir in subdirs:
+                        subdir_path = os.path.join(category_path, subdir)
+                        animation_name = f"{category_name}_{subdir}"
+                        self.load_animation_from_directory(animation_name, subdir_path)
+                        self.categories[category_name].append(animation_name)
                 
-                # Also check for standalone PNG files in the same directory
-                self.load_standalone_images(category_name, category_path)
-            else:
-                # Direct animation directory - check for special cases like gun sprites
-                if category_name == 'gun':
-                    self.load_gun_animations(category_name, category_path)
+                    # Also check for standalone PNG files in the same directory
+                    self.load_standalone_images(category_name, category_path)
                 else:
-                    self.load_animation_from_directory(category_name, category_path)
-                    self.categories[category_name].append(category_name)
+                    # Direct animation directory - check for special cases like gun sprites
+                    if category_name == 'gun':
+                        self.load_gun_animations(category_name, category_path)
+                    else:
+                        self.load_animation_from_directory(category_name, category_path)
+                        self.categories[category_name].append(category_name)
     
     def load_standalone_images(self, category_name, directory_path):
         """Load standalone PNG files as single-frame animations."""
@@ -74,11 +90,7 @@ class AnimationLoader:
             if not pixmap.isNull():
                 frame_rate = self.get_frame_rate_for_animation(animation_name)
                 
-                self.animations[animation_name] = {
-                    'frames': [pixmap],
-                    'frame_rate': frame_rate,
-                    'loop': True
-                }
+                self.animations[animation_name] = self.build_animation([pixmap], frame_rate)
                 
                 # Add to category
                 self.categories[category_name].append(animation_name)
@@ -109,11 +121,7 @@ class AnimationLoader:
             # Determine frame rate based on animation type
             frame_rate = self.get_frame_rate_for_animation(animation_name)
             
-            self.animations[animation_name] = {
-                'frames': frames,
-                'frame_rate': frame_rate,
-                'loop': True
-            }
+            self.animations[animation_name] = self.build_animation(frames, frame_rate)
     
     def load_gun_animations(self, category_name, directory_path):
         """Load gun animations, separating different sprite types."""
@@ -169,17 +177,131 @@ class AnimationLoader:
                 animation_name = f"{category_name}_{anim_type}"
                 frame_rate = self.get_frame_rate_for_animation(animation_name)
                 
-                self.animations[animation_name] = {
-                    'frames': frames,
-                    'frame_rate': frame_rate,
-                    'loop': True
-                }
+                self.animations[animation_name] = self.build_animation(frames, frame_rate)
                 
                 # Add to category
                 if category_name not in self.categories:
                     self.categories[category_name] = []
                 self.categories[category_name].append(animation_name)
     
+    def build_animation(self, frames, frame_rate, loop=True):
+        """Build an animation entry, precomputing the changed area between frames."""
+        return {
+            'frames': frames,
+            'frame_rate': frame_rate,
+            'loop': loop,
+            'dirty_rects': self.compute_dirty_rects(frames)
+        }
+    
+    def compute_dirty_rects(self, frames):
+        """Compute the changed rectangle for each frame transition.
+        
+        dirty_rects[i] is the area (in source pixels) that changes when going
+        from frame i - 1 to frame i; dirty_rects[0] covers the loop back from
+        the last frame to the first. An empty QRect means nothing changes.
+        """
+        if len(frames) < 2:
+            return [QRect()] * len(frames)
+        
+        images = [frame.toImage().convertToFormat(QImage.Format_ARGB32) for frame in frames]
+        return [self.changed_rect(images[i - 1], images[i]) for i in range(len(images))]
+    
+    def changed_rect(self, previous_image, image):
+        """Get the bounding rectangle of the pixels that differ between two images."""
+        if previous_image.size() != image.size():
+            # Frame size changed, the whole (larger) frame has to be repainted
+            return QRect(0, 0, max(previous_image.width(), image.width()),
+                         max(previous_image.height(), image.height()))
+        
+        width = image.width()
+        top = bottom = None
+        left = width
+        right = -1
+        
+        for y in range(image.height()):
+            previous_row = self.scanline_bytes(previous_image, y, width)
+            row = self.scanline_bytes(image, y, width)
+            if previous_row == row:
+                continue
+            
+            if top is None:
+                top = y
+            bottom = y
+            
+            # Narrow down the differing columns (4 bytes per ARGB32 pixel)
+            first = self.first_difference(previous_row, row) // 4
+            last = (len(row) - 1 - self.first_difference(previous_row[::-1], row[::-1])) // 4
+            left = min(left, first)
+            right = max(right, last)
+        
+        if top is None:
+            return QRect()
+        return QRect(left, top, right - left + 1, bottom - top + 1)
+    
+    def scanline_bytes(self, image, y, width):
+        """Get the raw ARGB32 bytes of one image row."""
+        line = image.constScanLine(y)
+        line.setsize(width * 4)
+        return bytes(line)
+    
+    def first_difference(self, a, b):
+        """Find the index of the first differing byte of two equal-length rows.
+        
+        Uses a binary search over prefix comparisons so the work stays in C.
+        """
+        low, high = 0, len(a)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if a[:middle] == b[:middle]:
+                low = middle
+            else:
+                high = middle
+        return low
+    
+    def get_scaled_dirty_rect(self, animation, frame_index, scale=1.0):
+        """Get the changed area for a frame transition in logical display pixels.
+        
+        Returns None when the change is unknown (e.g. ad-hoc animations built
+        at runtime), meaning the whole sprite should be repainted.
+        """
+        dirty_rects = animation.get('dirty_rects')
+        if not dirty_rects or frame_index >= len(dirty_rects):
+            return None
+        
+        rect = dirty_rects[frame_index]
+        if rect.isEmpty() or scale == 1.0:
+            return QRect(rect)
+        
+        # Grow by one scaled pixel to cover smoothing bleed from neighbouring pixels
+        margin = int(scale) + 1
+        return QRect(int(rect.x() * scale) - margin, int(rect.y() * scale) - margin,
+                     int(rect.width() * scale) + 2 * margin, int(rect.height() * scale) + 2 * margin)
+    
+    def get_dirty_rect_stats(self, animation_name):
+        """Get how many pixels per loop are repainted with and without dirty rectangles."""
+        animation = self.get_animation(animation_name)
+        if not animation or not animation.get('dirty_rects'):
+            return None
+        
+        full_pixels = sum(frame.width() * frame.height() for frame in animation['frames'])
+        dirty_pixels = sum(rect.width() * rect.height() for rect in animation['dirty_rects'])
+        return {
+            'full_pixels': full_pixels,
+            'dirty_pixels': dirty_pixels,
+            'saved_ratio': 1.0 - (dirty_pixels / full_pixels) if full_pixels else 0.0
+        }
+    
+    def report_dirty_rect_savings(self):
+        """Log the repainted-pixel savings of every animation (as one message, which the rate limit lets through)."""
+        lines = []
+        for animation_name in sorted(self.animations):
+            stats = self.get_dirty_rect_stats(animation_name)
+            if stats:
+                lines.append(f"  {animation_name}: {stats['dirty_pixels']}/{stats['full_pixels']} px per loop "
+                             f"({stats['saved_ratio'] * 100:.1f}% saved)")
+        if lines:
+            log.info('animation', "Dirty rectangle savings:\n%s", '\n'.join(lines))
+    
     def natural_sort_key(self, filename):
         """Generate a key for natural sorting of filenames."""
         import re
@@ -205,6 +327,71 @@ class AnimationLoader:
         else:
             return config.get_setting('animation', 'default_frame_rate', 150)
     
+    def get_scaled_frame(self, animation, frame_index, scale=1.0, device_pixel_ratio=1.0):
+        """Get a frame scaled for display at the physical resolution of a screen.
+        
+        The frame is scaled once by scale * device_pixel_ratio and tagged with
+        setDevicePixelRatio, so Qt draws it 1:1 on high-DPI screens instead of
+        scaling it a second time. Results are cached on the animation dict,
+        keyed by (scale, device_pixel_ratio).
+        """
+        frames = animation['frames']
+        cache = animation.setdefault('scaled_frames', {})
+        key = (scale, device_pixel_ratio)
+        
+        scaled_frames = cache.get(key)
+        if scaled_frames is None:
+            # Drop the oldest variant when the cache is full (dicts keep insertion order)
+            if len(cache) >= self.MAX_SCALED_VARIANTS:
+                evicted = cache.pop(next(iter(cache)))
+                self.scaled_frame_bytes -= sum(self.pixmap_bytes(each) for each in evicted if each is not None)
+            scaled_frames = [None] * len(frames)
+            cache[key] = scaled_frames
+        
+        pixmap = scaled_frames[frame_index]
+        if pixmap is not None:
+            self.scaled_frame_hits += 1
+        else:
+            self.scaled_frame_misses += 1
+            source = frames[frame_index]
+            physical_scale = scale * device_pixel_ratio
+            with trace.span('scale_frame', 'sprites', frame=frame_index, scale=physical_scale):
+                if physical_scale != 1.0:
+                    pixmap = source.scaled(source.size() * physical_scale, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                else:
+                    pixmap = QPixmap(source)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            scaled_frames[frame_index] = pixmap
+            self.scaled_frame_bytes += self.pixmap_bytes(pixmap)
+        
+        return pixmap
+    
+    def clear_scaled_frames(self):
+        """Drop all cached scaled frames (e.g. after a screen configuration change)."""
+        for animation in self.animations.values():
+            animation.pop('scaled_frames', None)
+        self.scaled_frame_bytes = 0
+    
+    def pixmap_bytes(self, pixmap):
+        """Approximate memory held by a pixmap's pixels."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    
+    def get_cache_stats(self):
+        """Get scaled frame cache hits and misses and the memory used by source and scaled frames."""
+        if self.source_frame_bytes is None:
+            # Source frames never change after loading, so they are only counted once
+            self.source_frame_bytes = sum(self.pixmap_bytes(frame)
+                                          for animation in self.animations.values()
+                                          for frame in animation['frames'])
+        lookups = self.scaled_frame_hits + self.scaled_frame_misses
+        return {
+            'hits': self.scaled_frame_hits,
+            'misses': self.scaled_frame_misses,
+            'hit_rate': self.scaled_frame_hits / lookups if lookups else 0.0,
+            'source_bytes': self.source_frame_bytes,
+            'scaled_bytes': self.scaled_frame_bytes
+        }
+    
     def get_animation(self, animation_name):
         """Get a specific animation by name."""
         return self.animations.get(animation_name)
@@ -242,6 +429,7 @@ class AnimationLoader:
                 'name': animation_name,
                 'frame_count': len(animation['frames']),
                 'frame_rate': animation['frame_rate'],
-                'loops': animation['loop']
+                'loops': animation['loop'],
+                'repaint_savings': self.get_dirty_rect_stats(animation_name)
             }
         return None
\ No newline at end of file
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Behavior Registry - Weighted behavior selection with a cached alias table
+"""
+
+import config
+
+class Behavior:
+    """A selectable behavior: its handler, base weight and optional enable setting."""
+
+    def __init__(self, name, handler, weight, setting_key=None):
+        self.name = name
+        self.handler = handler  # Callable run when picked, or None for entries that are only selected
+        self.weight = weight
+        self.setting_key = setting_key  # Key in the registry's settings category, None = always enabled
+
+
+class HistoryCounter:
+    """Fixed-size history of recent picks with a running count per name."""
+
+    def __init__(self, size):
+        self.size = max(1, size)
+        self.ring = [None] * self.size
+        self.counts = {}
+        self.index = 0
+        self.version = 0  # Incremented on every change
+
+    def add(self, name):
+        """Record a pick, forgetting the oldest one once the history is full."""
+        oldest = self.ring[self.index]
+        if oldest is not None:
+            self.counts[oldest] -= 1
+        self.ring[self.index] = name
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.index = (self.index + 1) % self.size
+        self.version += 1
+
+    def count(self, name):
+        return self.counts.get(name, 0)
+
+    def clear(self):
+        self.ring = [None] * self.size
+        self.counts = {}
+        self.index = 0
+        self.version += 1
+
+    def recent(self):
+        """Get the history oldest first."""
+        ordered = self.ring[self.index:] + self.ring[:self.index]
+        return [name for name in ordered if name is not None]
+
+
+class AliasTable:
+    """Walker/Vose alias table: draws a weighted index in constant time."""
+
+    def __init__(self, weights):
+        count = len(weights)
+        self.count = count
+        self.probability = [0.0] * count
+        self.alias = [0] * count
+        total = float(sum(weights))
+        if count == 0 or total <= 0:
+            self.count = 0
+            return
+
+        scaled = [weight * count / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Leftovers are 1.0 up to rounding error
+        for i in large + small:
+            self.probability[i] = 1.0
+
+    def sample(self, rng):
+        """Draw an index: one column pick and one coin flip, whatever the weights are."""
+        column = int(rng.random() * self.count)
+        if column == self.count:
+            column -= 1
+        return column if rng.random() < self.probability[column] else self.alias[column]
+
+
+class BehaviorRegistry:
+    """Behaviors with handlers, weights and enable flags, sampled through a cached alias table.
+
+    The alias table only covers enabled behaviors and is rebuilt when a
+    weight changes, when config.update_setting() is called (tracked with the
+    config settings version) or when the pick history changes. With a
+    history, each behavior's weight is reduced by history_penalty per recent
+    pick (never below 1). Between rebuilds a selection is two random numbers
+    and two list lookups.
+    """
+
+    def __init__(self, settings_category=None, history_size=0, history_penalty=0):
+        self.settings_category = settings_category
+        self.behaviors = []
+        self.by_name = {}
+        self.fallback = None
+
+        self.history = HistoryCounter(history_size) if history_size else None
+        self.history_penalty = history_penalty
+
+        # Cache state
+        self.table = None
+        self.active = []
+        self.settings_version = None
+        self.history_version = None
+        self.rebuild_count = 0
+
+    def register(self, name, handler, weight, setting_key=None):
+        behavior = Behavior(name, handler, weight, setting_key)
+        self.behaviors.append(behavior)
+        self.by_name[name] = behavior
+        self.invalidate()
+        return behavior
+
+    def set_fallback(self, name):
+        """Behavior to use when every behavior is disabled."""
+        self.fallback = self.by_name[name]
+        self.invalidate()
+
+    def set_weight(self, name, weight):
+        self.by_name[name].weight = weight
+        self.invalidate()
+
+    def invalidate(self):
+        """Force a table rebuild on the next selection."""
+        self.table = None
+
+    def is_enabled(self, behavior):
+        if behavior.setting_key is None or self.settings_category is None:
+            return True
+        return config.get_setting(self.settings_category, behavior.setting_key, True)
+
+    def effective_weight(self, behavior):
+        weight = behavior.weight
+        if self.history and self.history_penalty:
+            weight = max(1, weight - self.history.count(behavior.name) * self.history_penalty)
+        return weight
+
+    def rebuild(self):
+        """Rebuild the alias table from the enabled behaviors and current history."""
+        self.active = [behavior for behavior in self.behaviors if self.is_enabled(behavior)]
+        if not self.active and self.fallback:
+            self.active = [self.fallback]
+        self.table = AliasTable([self.effective_weight(behavior) for behavior in self.active])
+        self.settings_version = config.get_settings_version()
+        self.history_version = self.history.version if self.history else None
+        self.rebuild_count += 1
+
+    def is_stale(self):
+        return (self.table is None or
+                self.settings_version != config.get_settings_version() or
+                (self.history is not None and self.history_version != self.history.version))
+
+    def select(self, rng):
+        """Pick a behavior (or None if nothing can be picked)."""
+        if self.is_stale():
+            self.rebuild()
+        if not self.table.count:
+            return None
+        return self.active[self.table.sample(rng)]
+
+    def record(self, name):
+        """Add a pick to the history (affects later selections when a penalty is set)."""
+        if self.history:
+            self.history.add(name)
+
+    def get_probabilities(self):
+        """Get each enabled behavior's current selection probability."""
+        if self.is_stale():
+            self.rebuild()
+        weights = [self.effective_weight(behavior) for behavior in self.active]
+        total = float(sum(weights)) or 1.0
+        return {behavior.name: weight / total for behavior, weight in zip(self.active, weights)}
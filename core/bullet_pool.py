@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Bullet Pool - Recycles showdown bullet sprites and timers between shots
+"""
+
+from .runtime import get_default_runtime
+
+class BulletActor:
+    """A reusable bullet: its sprite widget, its timer and its per-shot state."""
+
+    def __init__(self, widget, timer):
+        self.widget = widget
+        self.timer = timer
+
+        # Per-shot state, reset by BulletPool.acquire()
+        self.in_use = False
+        self.x = 0.0
+        self.y = 0.0
+        self.move_x = 0.0
+        self.move_y = 0.0
+        self.speed = 0.0
+        self.move_distance = 0.0
+        self.max_distance = 0.0
+        self.animation_frame = 0
+        self.animation_complete = False
+        self.lingering = False
+        self.slot = -1  # Entity slot when stepped by ShowdownSimulation
+        self.started_at = 0.0        # perf_counter() time the shot was fired
+        self.frame_interval = 0      # ms per animation frame
+        self.cursor_sample = None    # (time, x, y) of the last cursor sample
+
+        # Scaled frames for the scale/devicePixelRatio the bullet was last used with
+        self.frames = None
+        self.frames_key = None
+
+    def reset(self):
+        """Reset the per-shot state before the bullet is fired again."""
+        self.x = 0.0
+        self.y = 0.0
+        self.move_x = 0.0
+        self.move_y = 0.0
+        self.speed = 0.0
+        self.move_distance = 0.0
+        self.max_distance = 0.0
+        self.animation_frame = 0
+        self.animation_complete = False
+        self.lingering = False
+        self.slot = -1
+        self.started_at = 0.0
+        self.frame_interval = 0
+        self.cursor_sample = None
+
+
+class BulletPool:
+    """Preallocated, growable pool of bullet actors.
+
+    Each actor's timer is connected to the tick handler once, when the actor
+    is allocated, so firing a recycled bullet creates no widgets, timers or
+    closures. Without a tick handler actors get no timer at all (their bullets
+    are stepped by a shared simulation instead).
+
+    Counters: hits (shots served from the free list), misses (shots that had
+    to grow the pool) and allocations (actors created in total).
+    """
+
+    def __init__(self, create_widget, tick_handler, initial_size=0, runtime=None):
+        self.create_widget = create_widget
+        self.tick_handler = tick_handler
+        self.runtime = runtime or get_default_runtime()
+
+        self.free = []
+        self.active = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.allocations = 0
+
+        self.preallocate(initial_size)
+
+    def allocate(self):
+        """Create a new actor with its widget and a timer wired to the tick handler."""
+        widget = self.create_widget()
+        timer = self.runtime.create_timer() if self.tick_handler else None
+        actor = BulletActor(widget, timer)
+        if timer:
+            timer.timeout.connect(lambda: self.tick_handler(actor))
+        self.allocations += 1
+        return actor
+
+    def preallocate(self, count):
+        """Grow the free list to hold at least count actors."""
+        while len(self.free) < count:
+            self.free.append(self.allocate())
+
+    def acquire(self):
+        """Get a bullet actor ready to be fired."""
+        if self.free:
+            actor = self.free.pop()
+            self.hits += 1
+        else:
+            actor = self.allocate()
+            self.misses += 1
+
+        actor.reset()
+        actor.in_use = True
+        self.active.add(actor)
+        return actor
+
+    def release(self, actor):
+        """Stop and hide a bullet and return it to the free list."""
+        if not actor.in_use:
+            return
+        actor.in_use = False
+        if actor.timer:
+            actor.timer.stop()
+        try:
+            actor.widget.hide()
+        except RuntimeError:
+            # Widget was destroyed behind our back, drop the actor instead of recycling it
+            self.active.discard(actor)
+            return
+        self.active.discard(actor)
+        self.free.append(actor)
+
+    def release_all(self):
+        """Return every active bullet to the pool."""
+        for actor in list(self.active):
+            self.release(actor)
+
+    def clear(self):
+        """Release and destroy every actor in the pool."""
+        self.release_all()
+        for actor in self.free:
+            if actor.timer:
+                actor.timer.stop()
+            try:
+                actor.widget.deleteLater()
+            except RuntimeError:
+                pass
+        self.free = []
+
+    def get_stats(self):
+        """Get pool counters."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'allocations': self.allocations,
+            'active': len(self.active),
+            'free': len(self.free)
+        }
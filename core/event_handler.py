@@ -3,8 +3,9 @@
 Event Handler - Manages user interactions and input events
 """
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
-from PyQt5.QtGui import QCursor
+import config
+from PyQt5.QtCore import QObject, pyqtSignal
+from .runtime import get_default_runtime
 
 class EventHandler(QObject):
     """Handles various events and user interactions for the mascot."""
@@ -12,29 +13,49 @@ class EventHandler(QObject):
     # Signals
     mouse_idle = pyqtSignal()  # Emitted when mouse hasn't moved for a while
     mouse_active = pyqtSignal()  # Emitted when mouse becomes active
+    zone_entered = pyqtSignal(str)  # Emitted with the zone name when the cursor comes within its radius
+    zone_left = pyqtSignal(str)  # Emitted with the zone name when the cursor moves past its radius plus hysteresis
     
-    def __init__(self, mascot):
+    def __init__(self, mascot, runtime=None):
         super().__init__()
         self.mascot = mascot
+        self.runtime = runtime or get_default_runtime()
+        self.snapshot = self.runtime.snapshot
         
         # Mouse tracking
-        self.last_mouse_pos = QCursor.pos()
-        self.mouse_idle_timer = QTimer()
+        self.last_mouse_pos = self.snapshot.cursor_pos()
+        self.mouse_idle_timer = self.runtime.create_timer()
         self.mouse_idle_timer.timeout.connect(self.on_mouse_idle)
         self.mouse_idle_timer.setSingleShot(True)
         
-        # Mouse position check timer
-        self.mouse_check_timer = QTimer()
+        # Mouse position check timer: polls every min interval while the cursor moves and
+        # backs off (doubling up to the max interval) while it stays still
+        self.min_poll_interval = config.get_setting('behavior', 'mouse_poll_min_interval', 100)
+        self.max_poll_interval = config.get_setting('behavior', 'mouse_poll_max_interval', 3200)
+        self.poll_interval = self.min_poll_interval
+        self.poll_count = 0
+        self.mouse_check_timer = self.runtime.create_timer()
+        self.mouse_check_timer.setSingleShot(True)
         self.mouse_check_timer.timeout.connect(self.check_mouse_movement)
-        self.mouse_check_timer.start(100)  # Check every 100ms
+        self.mouse_check_timer.start(self.poll_interval)
+        self.is_tracking = True
         
         # State tracking
         self.is_mouse_idle = False
-        self.mouse_idle_threshold = 5000  # 5 seconds of no movement
+        self.mouse_idle_threshold = config.get_setting('behavior', 'mouse_idle_threshold', 5000)
+        
+        # Proximity zones around the mascot's center: name -> [enter radius², leave radius², inside]
+        # Re-evaluated when the cursor moves (seen by the poll) or the mascot moves
+        self.zones = {}
+        self.zone_hysteresis = config.get_setting('behavior', 'mouse_proximity_hysteresis', 20)
+        self.register_zone('touch', 50)
+        self.register_zone('near', config.get_setting('behavior', 'mouse_proximity_threshold', 100))
+        self.register_zone('far', 200)
         
     def check_mouse_movement(self):
         """Check if the mouse has moved and update idle state."""
-        current_pos = QCursor.pos()
+        current_pos = self.snapshot.cursor_pos()
+        self.poll_count += 1
         
         if current_pos != self.last_mouse_pos:
             # Mouse moved
@@ -47,6 +68,16 @@ class EventHandler(QObject):
             # Reset idle timer
             self.mouse_idle_timer.stop()
             self.mouse_idle_timer.start(self.mouse_idle_threshold)
+            
+            # Poll quickly again while the cursor is moving
+            self.poll_interval = self.min_poll_interval
+            self.update_zones()
+        else:
+            # Still cursor: back off exponentially
+            self.poll_interval = min(self.poll_interval * 2, self.max_poll_interval)
+        
+        if self.is_tracking:
+            self.mouse_check_timer.start(self.poll_interval)
     
     def on_mouse_idle(self):
         """Called when mouse has been idle for the threshold time."""
@@ -54,25 +85,59 @@ class EventHandler(QObject):
             self.is_mouse_idle = True
             self.mouse_idle.emit()
     
-    def is_mouse_near_mascot(self, threshold=100):
-        """Check if the mouse cursor is near the mascot."""
-        mouse_pos = QCursor.pos()
-        mascot_pos = self.mascot.pos()
-        mascot_center = mascot_pos + self.mascot.rect().center()
+    def register_zone(self, name, radius, hysteresis=None):
+        """Track whether the cursor is within radius pixels of the mascot's center.
         
-        distance = ((mouse_pos.x() - mascot_center.x())**2 + 
-                   (mouse_pos.y() - mascot_center.y())**2)**0.5
+        zone_entered(name) is emitted when the cursor comes within radius and
+        zone_left(name) once it is more than radius + hysteresis away, so a
+        cursor resting on the edge doesn't flicker in and out.
+        """
+        if hysteresis is None:
+            hysteresis = self.zone_hysteresis
+        inside = name in self.zones and self.zones[name][2]
+        self.zones[name] = [radius * radius, (radius + hysteresis) ** 2, inside]
+    
+    def unregister_zone(self, name):
+        self.zones.pop(name, None)
+    
+    def is_in_zone(self, name):
+        """Whether the cursor was inside the zone at the last update."""
+        zone = self.zones.get(name)
+        return zone is not None and zone[2]
+    
+    def get_mouse_offset(self, sample=True):
+        """Get (dx, dy) from the mascot's center to the cursor (sample=False reuses the last cursor sample)."""
+        mouse_pos = self.snapshot.cursor_pos() if sample else self.snapshot.last_cursor_pos()
+        mascot_center = self.mascot.pos() + self.mascot.rect().center()
+        return mouse_pos.x() - mascot_center.x(), mouse_pos.y() - mascot_center.y()
+    
+    def update_zones(self):
+        """Compare the cursor's squared distance with every zone and emit the crossings.
         
-        return distance <= threshold
+        Uses the last cursor sample: cursor movement is picked up by the poll,
+        which updates the zones itself, so mascot moves don't resample it.
+        """
+        if not self.zones:
+            return
+        dx, dy = self.get_mouse_offset(sample=False)
+        distance_sq = dx * dx + dy * dy
+        for name, zone in list(self.zones.items()):
+            enter_sq, leave_sq, inside = zone
+            if not inside and distance_sq <= enter_sq:
+                zone[2] = True
+                self.zone_entered.emit(name)
+            elif inside and distance_sq > leave_sq:
+                zone[2] = False
+                self.zone_left.emit(name)
+    
+    def is_mouse_near_mascot(self, threshold=100):
+        """Check if the mouse cursor is near the mascot."""
+        dx, dy = self.get_mouse_offset()
+        return dx * dx + dy * dy <= threshold * threshold
     
     def get_mouse_direction_from_mascot(self):
         """Get the direction of the mouse relative to the mascot."""
-        mouse_pos = QCursor.pos()
-        mascot_pos = self.mascot.pos()
-        mascot_center = mascot_pos + self.mascot.rect().center()
-        
-        dx = mouse_pos.x() - mascot_center.x()
-        dy = mouse_pos.y() - mascot_center.y()
+        dx, dy = self.get_mouse_offset()
         
         # Determine primary direction
         if abs(dx) > abs(dy):
@@ -82,22 +147,19 @@ class EventHandler(QObject):
     
     def get_distance_to_mouse(self):
         """Get the distance from mascot to mouse cursor."""
-        mouse_pos = QCursor.pos()
-        mascot_pos = self.mascot.pos()
-        mascot_center = mascot_pos + self.mascot.rect().center()
-        
-        dx = mouse_pos.x() - mascot_center.x()
-        dy = mouse_pos.y() - mascot_center.y()
-        
-        return (dx**2 + dy**2)**0.5
+        dx, dy = self.get_mouse_offset()
+        return (dx * dx + dy * dy) ** 0.5
     
     def start_mouse_tracking(self):
         """Start tracking mouse movement."""
+        self.is_tracking = True
         if not self.mouse_check_timer.isActive():
-            self.mouse_check_timer.start(100)
+            self.poll_interval = self.min_poll_interval
+            self.mouse_check_timer.start(self.poll_interval)
     
     def stop_mouse_tracking(self):
         """Stop tracking mouse movement."""
+        self.is_tracking = False
         self.mouse_check_timer.stop()
         self.mouse_idle_timer.stop()
     
@@ -115,4 +177,8 @@ class EventHandler(QObject):
         self.mouse_idle_timer.start(self.mouse_idle_threshold)
         if self.is_mouse_idle:
             self.is_mouse_idle = False
-            self.mouse_active.emit()
\ No newline at end of file
+            self.mouse_active.emit()
+    
+    def get_poll_stats(self):
+        """Get the cursor poll count and current poll interval (ms)."""
+        return {'polls': self.poll_count, 'interval': self.poll_interval}
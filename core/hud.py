@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Performance HUD - Small panel next to the mascot showing what it draws and what that costs
+"""
+
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QPixmap, QPainter, QColor, QFont, QFontMetrics, QStaticText
+import config
+
+class PerformanceHud:
+    """Text panel beside the mascot (DEBUG_SETTINGS['show_animation_info']).
+
+    Shows the current animation and frame, the effective frame rate, the
+    cost of updating and painting a frame, active timers, live sprite
+    widgets, the scaled frame cache hit rate and the memory held by frames.
+
+    It refreshes at a low rate (hud_refresh_interval) from counters the
+    mascot, sprite view, frame cache and timer factory keep anyway, and
+    renders its text into a pixmap only when the text changed, keeping each
+    line's layout (QStaticText) until that line changes; following the
+    mascot just moves the pixmap. The panel is a sprite widget like a
+    bullet (an overlay actor in overlay mode) and ignores the mouse.
+    """
+
+    MARGIN = 6    # px between the mascot and the panel
+    PADDING = 4   # px around the text
+
+    def __init__(self, mascot, runtime):
+        self.mascot = mascot
+        self.runtime = runtime
+        self.widget = mascot.create_sprite_widget(z=100)
+        if isinstance(self.widget, QWidget):
+            self.widget.setWindowFlags(self.widget.windowFlags() | Qt.WindowTransparentForInput)
+            self.widget.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.font = QFont('monospace', 8)
+        self.font.setStyleHint(QFont.TypeWriter)
+
+        self.text = None
+        self.lines = []   # (text, QStaticText) per line
+        self.renders = 0  # Times the text changed and was drawn again
+        self.last_sample = None
+
+        self.timer = runtime.create_timer(name='PerformanceHud.refresh')
+        self.timer.timeout.connect(self.refresh)
+
+    # Showing
+    def start(self):
+        self.last_sample = self.sample()
+        self.refresh()
+        self.timer.start(config.get_setting('debug', 'hud_refresh_interval', 1000))
+
+    def stop(self):
+        self.timer.stop()
+        self.widget.hide()
+
+    def is_active(self):
+        return self.timer.isActive()
+
+    def close(self):
+        self.stop()
+        self.widget.deleteLater()
+
+    # Measuring
+    def sample(self):
+        """Read the mascot's running counters."""
+        view = self.mascot.sprite_label
+        return (self.runtime.clock.perf_counter(), self.mascot.sprite_updates, self.mascot.sprite_update_time,
+                view.paint_count, view.paint_time)
+
+    def build_text(self):
+        mascot = self.mascot
+        current = self.sample()
+        previous, self.last_sample = self.last_sample, current
+        elapsed = current[0] - previous[0]
+        updates = current[1] - previous[1]
+        paints = current[3] - previous[3]
+
+        animation = mascot.current_animation
+        if animation and animation['frames']:
+            frame_rate = animation.get('frame_rate', 150)
+            animation_line = f"{mascot.current_animation_name} {mascot.current_frame + 1}/{len(animation['frames'])}"
+            target_fps = 1000 / frame_rate if frame_rate else 0.0
+        else:
+            animation_line = "(no animation)"
+            target_fps = 0.0
+        fps = updates / elapsed if elapsed > 0 else 0.0
+        update_us = (current[2] - previous[2]) / updates * 1e6 if updates else 0.0
+        paint_us = (current[4] - previous[4]) / paints * 1e6 if paints else 0.0
+
+        timers = self.runtime.timers.get_stats()
+        pools = (getattr(mascot, 'heart_bullet_pool', None), getattr(mascot, 'strong_bullet_pool', None))
+        bullets = sum(pool.get_stats()['active'] for pool in pools if pool is not None)
+        memes = 1 if mascot.meme_image_label is not None else 0
+        windows = len(QApplication.topLevelWidgets())
+        cache = mascot.animation_loader.get_cache_stats()
+        frame_mb = (cache['source_bytes'] + cache['scaled_bytes']) / (1024 * 1024)
+
+        return '\n'.join([
+            f"anim    {animation_line}",
+            f"fps     {fps:.1f} / {target_fps:.1f}",
+            f"frame   {update_us:.0f} us update  {paint_us:.0f} us paint",
+            f"timers  {timers.get('active', 0)} active / {timers.get('alive', timers.get('created', 0))}",
+            f"widgets {windows} windows  {bullets} bullets  {memes} meme",
+            f"cache   {cache['hit_rate'] * 100:.1f}% hit  {frame_mb:.1f} MB frames"
+        ])
+
+    # Drawing
+    def refresh(self):
+        if not self.mascot.isVisible():
+            self.widget.hide()
+            return
+        text = self.build_text()
+        if text != self.text:
+            self.text = text
+            self.render(text)
+        self.follow()
+        self.widget.show()
+
+    def render(self, text):
+        """Draw the text into the panel's pixmap (only when it changed)."""
+        metrics = QFontMetrics(self.font)
+        lines = text.split('\n')
+        self.lines = self.lines[:len(lines)]
+        for index, line in enumerate(lines):
+            if index < len(self.lines) and self.lines[index][0] == line:
+                continue
+            static_text = QStaticText(line)
+            static_text.prepare(font=self.font)
+            if index < len(self.lines):
+                self.lines[index] = (line, static_text)
+            else:
+                self.lines.append((line, static_text))
+        width = max(metrics.horizontalAdvance(line) for line in lines) + self.PADDING * 2
+        height = metrics.lineSpacing() * len(lines) + self.PADDING * 2
+        ratio = self.mascot.devicePixelRatioF()
+
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 170))
+        painter.drawRoundedRect(QRectF(0, 0, width, height), 4, 4)
+        painter.setFont(self.font)
+        painter.setPen(QColor(230, 255, 230))
+        for index, (line, static_text) in enumerate(self.lines):
+            painter.drawStaticText(self.PADDING, self.PADDING + index * metrics.lineSpacing(), static_text)
+        painter.end()
+
+        self.widget.setPixmap(pixmap)
+        self.widget.resize(width, height)
+        self.renders += 1
+
+    def follow(self):
+        """Place the panel to the right of the mascot, or to the left at the edge of its screen."""
+        if self.text is None:
+            return
+        mascot = self.mascot
+        width = self.widget.width()
+        center = mascot.geometry().center()
+        area = self.mascot.snapshot.available_geometry()
+        for geometry in self.mascot.snapshot.available_geometries():
+            if geometry.contains(center):
+                area = geometry
+                break
+        x = mascot.x() + mascot.width() + self.MARGIN
+        if x + width > area.right():
+            x = mascot.x() - width - self.MARGIN
+        y = min(mascot.y(), area.bottom() - self.widget.height())
+        self.widget.move(x, max(area.top(), y))
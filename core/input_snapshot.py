@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Input Snapshot - Cursor position and screen geometry sampled once per tick and shared by every reader
+"""
+
+from collections import deque
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QCursor
+import config
+
+class InputSnapshot:
+    """Per-tick cache of the cursor position and the screen geometry.
+
+    Within one tick the mascot used to ask Qt for the cursor position from
+    follow_mouse, the sliding and strong bullet updates and the event
+    handler separately, and built a QDesktopWidget every walking step just
+    to read the screen size. The cursor is now sampled at most once per
+    sample interval (so timers firing in the same pass share one sample) and
+    a short history of samples gives a velocity estimate. Screen and
+    available geometry are cached until Qt reports a screen being added or
+    removed or a geometry change.
+
+    The returned QRects are shared: read them, don't modify them.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.sample_interval = config.get_setting('performance', 'cursor_sample_interval', 10) / 1000
+        self.velocity_window = config.get_setting('performance', 'cursor_velocity_window', 200) / 1000
+
+        # Cursor
+        self.cursor = None
+        self.sampled_at = None
+        self.history = deque(maxlen=config.get_setting('performance', 'cursor_history_size', 16))  # (time, x, y)
+
+        # Screens
+        self.screen_rect = None
+        self.available_rect = None
+        self.available_rects = None  # Every screen's available geometry
+        self.watching_screens = False
+        self.screen_listeners = []  # Called after the cached geometry is dropped
+
+        # Stats
+        self.cursor_reads = 0
+        self.cursor_samples = 0
+        self.geometry_refreshes = 0
+
+    # Cursor
+    def cursor_pos(self):
+        """Get the cursor position (QPoint), sampling Qt only if this tick's sample is stale."""
+        self.cursor_reads += 1
+        now = self.clock.perf_counter()
+        if self.cursor is None or now - self.sampled_at >= self.sample_interval:
+            self.cursor = QCursor.pos()
+            self.sampled_at = now
+            self.cursor_samples += 1
+            self.history.append((now, self.cursor.x(), self.cursor.y()))
+        return self.cursor
+
+    def last_cursor_pos(self):
+        """Get the most recent cursor sample without sampling again (for readers that only need it as fresh as the last poll)."""
+        if self.cursor is None:
+            return self.cursor_pos()
+        return self.cursor
+
+    def cursor_velocity(self):
+        """Get the cursor velocity (vx, vy) in pixels per second over the recent samples."""
+        if len(self.history) < 2:
+            return 0.0, 0.0
+        now, x, y = self.history[-1]
+        oldest = None
+        for sample in self.history:
+            if now - sample[0] <= self.velocity_window:
+                oldest = sample
+                break
+        if oldest is None or oldest[0] >= now:
+            return 0.0, 0.0
+        dt = now - oldest[0]
+        return (x - oldest[1]) / dt, (y - oldest[2]) / dt
+
+    # Screens
+    def screen_geometry(self):
+        """Get the primary screen geometry (what QDesktopWidget().screenGeometry() returned)."""
+        if self.screen_rect is None:
+            self.refresh_screens()
+        return self.screen_rect
+
+    def available_geometry(self):
+        """Get the primary screen geometry minus taskbars and docks."""
+        if self.available_rect is None:
+            self.refresh_screens()
+        return self.available_rect
+
+    def available_geometries(self):
+        """Get the available geometry of every screen (for walking across monitors)."""
+        if self.available_rects is None:
+            self.refresh_screens()
+        return self.available_rects
+
+    def refresh_screens(self):
+        self.watch_screens()
+        screen = QApplication.primaryScreen()
+        self.screen_rect = screen.geometry()
+        self.available_rect = screen.availableGeometry()
+        self.available_rects = [each.availableGeometry() for each in QApplication.screens()]
+        self.geometry_refreshes += 1
+
+    def watch_screens(self):
+        """Connect to Qt's screen signals (once) so the cache is dropped when the layout changes."""
+        if self.watching_screens:
+            return
+        app = QApplication.instance()
+        if app is None:
+            return
+        self.watching_screens = True
+        app.screenAdded.connect(self.on_screen_added)
+        app.screenRemoved.connect(self.invalidate_screens)
+        app.primaryScreenChanged.connect(self.invalidate_screens)
+        for screen in app.screens():
+            self.watch_screen(screen)
+
+    def watch_screen(self, screen):
+        screen.geometryChanged.connect(self.invalidate_screens)
+        screen.availableGeometryChanged.connect(self.invalidate_screens)
+
+    def on_screen_added(self, screen):
+        self.watch_screen(screen)
+        self.invalidate_screens()
+
+    def invalidate_screens(self, *args):
+        """Drop the cached geometry; the next read queries Qt again."""
+        self.screen_rect = None
+        self.available_rect = None
+        self.available_rects = None
+        for callback in list(self.screen_listeners):
+            callback()
+
+    def on_screens_changed(self, callback):
+        """Run callback whenever the screen layout or a screen's geometry changes."""
+        self.watch_screens()
+        self.screen_listeners.append(callback)
+
+    def get_stats(self):
+        return {
+            'cursor_reads': self.cursor_reads,
+            'cursor_samples': self.cursor_samples,
+            'geometry_refreshes': self.geometry_refreshes
+        }
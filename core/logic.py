@@ -3,18 +3,35 @@
 Mascot Logic - Handles behavior, random actions, and state management
 """
 
-import random
-import time
 import config
-from PyQt5.QtCore import QObject, QTimer
+from utils import log
+from PyQt5.QtCore import QObject
+from .runtime import get_default_runtime
+from .scheduler import TaskScheduler
+from .behavior_registry import BehaviorRegistry
+from .state_machine import MascotState
+from .walk_region import WalkableRegion
 
 class MascotLogic(QObject):
     """Manages the mascot's behavior logic and decision making."""
     
-    def __init__(self, mascot):
+    # Scopes of delayed follow-ups that go stale when the user interacts or the mode changes
+    BEHAVIOR_SCOPES = ('afk', 'action', 'walking', 'idle_sequence')
+    
+    def __init__(self, mascot, runtime=None):
         super().__init__()
         self.mascot = mascot
         
+        # Clock, timers and random numbers (real ones unless a simulation injects its own)
+        self.runtime = runtime or get_default_runtime()
+        self.clock = self.runtime.clock
+        self.random = self.runtime.random
+        self.snapshot = self.runtime.snapshot
+        
+        # Cancellable delayed callbacks (instead of fire-and-forget QTimer.singleShot)
+        self.scheduler = TaskScheduler(self.runtime)
+        self.walk_stop_task = None
+        
         # Behavior weights for random action selection
         self.action_weights = {
             'sitting': 30,
@@ -28,57 +45,78 @@ class MascotLogic(QObject):
         # State tracking
         self.current_behavior_mode = 'idle'
         self.last_action = None
-        self.action_history = []
         self.max_history = 5
         
+        # Idle actions: recently used categories lose 5 weight per recent use
+        self.actions = BehaviorRegistry(history_size=self.max_history, history_penalty=5)
+        self.action_history = self.actions.history
+        self.action_animations = {}  # Category -> its loaded animations (actions have no handler)
+        
+        # AFK behaviors, each enabled by its afk_behavior setting (walking if all are off)
+        self.afk_behaviors = BehaviorRegistry('afk_behavior')
+        self.afk_behaviors.register('walk', self.perform_random_walk, 15, 'enable_walking')  # Walking/running
+        self.afk_behaviors.register('sit', self.perform_random_sitting, 15, 'enable_sitting')  # Sitting animations
+        self.afk_behaviors.register('dance', self.perform_random_dance, 12, 'enable_dancing')  # Dance animations
+        self.afk_behaviors.register('character', self.perform_random_character_interaction, 10, 'enable_character_interactions')
+        self.afk_behaviors.register('sleep', self.perform_random_sleep, 8, 'enable_sleeping')  # Sleep mode
+        self.afk_behaviors.register('fall', self.perform_random_fall, 6, 'enable_falling')  # Fall mode
+        self.afk_behaviors.register('cart', self.perform_random_cart_ride, 8, 'enable_cart_rides')  # Cart rides
+        self.afk_behaviors.register('follow_mouse', self.perform_random_mouse_follow, 8, 'enable_mouse_following')
+        self.afk_behaviors.register('minigame', self.perform_random_minigame, 10, 'enable_minigames')
+        self.afk_behaviors.register('whale_mail', self.perform_random_whale_mail, 8, 'enable_whale_mail')
+        self.afk_behaviors.set_fallback('walk')
+        
         # New idle sequence tracking
-        self.last_user_interaction = time.time()
+        self.last_user_interaction = self.clock.time()
         self.idle_sequence_state = 'waiting'  # 'waiting', 'dancing', 'walking'
         self.dance_start_time = None
         self.dance_duration = config.get_setting('behavior', 'dance_sequence_duration', 60000)
         self.idle_trigger_time = config.get_setting('behavior', 'idle_sequence_trigger_time', 5000)
         
-        # Persistent dance mode
-        self.eternal_dance_mode = False
-        
-        # Timed dance mode
-        self.timed_dance_mode = False
-        
+        # Dance modes are MascotState.ETERNAL_DANCE and MascotState.TIMED_DANCE
         # Idle mode control - removed
         # self.idle_mode_enabled = False
-        self.timed_dance_timer = QTimer()
+        self.timed_dance_timer = self.runtime.create_timer()
         self.timed_dance_timer.timeout.connect(self.stop_timed_dance)
         self.timed_dance_timer.setSingleShot(True)
+        self.state = mascot.state
+        self.state.own_timer(MascotState.TIMED_DANCE, 'timed_dance', self.timed_dance_timer)
         
         # Enhanced AFK system (default behavior when no modes are active)
         self.random_walking_enabled = True
-        self.random_walking_timer = QTimer()
+        self.random_walking_timer = self.runtime.create_timer()
         self.random_walking_timer.timeout.connect(self.perform_enhanced_afk_behavior)
         self.random_walking_timer.setSingleShot(True)
+        # AFK walking only runs while idle: any other state stops it when entered
+        self.state.on_enter([state for state in MascotState if state is not MascotState.IDLE],
+                            self.stop_random_walking_system)
         self.current_walk_direction = None
+        self.walk_path = []      # Waypoints (window positions) of the current walk, target last
+        self.walk_speed = 2
+        self.walk_region = None  # WalkableRegion, built on first walk
+        self.snapshot.on_screens_changed(self.on_screens_changed)
         self.walk_duration = 0
         self.walk_start_time = None
         self.is_running_mode = False
         
-        # Timers for behavior management
-        self.behavior_timer = QTimer()
-        self.behavior_timer.timeout.connect(self.update_behavior)
+        # React when the cursor comes near (event driven by the event handler's proximity zones)
+        self.mascot.event_handler.zone_entered.connect(self.on_mouse_zone_entered)
         
-        # Timer for idle sequence management
-        self.idle_sequence_timer = QTimer()
-        self.idle_sequence_timer.timeout.connect(self.check_idle_sequence)
-        self.idle_sequence_timer.start(1000)  # Check every second
+        # Timer for idle sequence management: armed for the next idle sequence deadline
+        # (idle trigger or dance end) instead of polling every second
+        self.idle_sequence_timer = self.runtime.create_timer()
+        self.idle_sequence_timer.setSingleShot(True)
+        self.idle_sequence_timer.timeout.connect(self.on_idle_sequence_deadline)
+        self.state.on_enter(MascotState.IDLE, self.arm_idle_sequence_timer)  # A deadline missed while busy fires on return
+        self.arm_idle_sequence_timer()
         
         # Start random walking after a short delay
-        QTimer.singleShot(3000, self.start_random_walking_system)
+        self.scheduler.schedule(3000, self.start_random_walking_system, scope='startup')
         
     def perform_random_action(self):
         """Perform a random idle action based on weights and history."""
-        if self.mascot.is_sleeping or self.mascot.is_following_mouse or self.mascot.is_character_interaction:
-            return
-        
-        # Don't perform random actions during eternal dance mode
-        if self.eternal_dance_mode:
+        # Don't perform random actions during special modes (eternal dance included)
+        if self.state.is_busy():
             return
             
         # Random actions functionality removed with idle mode
@@ -103,29 +141,17 @@ class MascotLogic(QObject):
     
     def perform_random_walk(self):
         """Perform random walking movement with directional animations."""
-        print(f"Random walk triggered! (idle mode removed)")
+        log.debug('walk', "Random walk triggered! (idle mode removed)")
         
         # Don't walk if any special mode is active
-        if (self.mascot.is_sleeping or self.mascot.is_following_mouse or 
-            self.mascot.is_character_interaction or self.eternal_dance_mode or 
-            self.timed_dance_mode or getattr(self.mascot, 'is_falling', False)):
-            print("Random walk blocked by special mode")
+        if self.state.is_busy():
+            log.debug('walk', "Random walk blocked by special mode")
             return
         
         # Idle mode removed - random walking is now always available when no special modes are active
         
-        # Get screen dimensions
-        from PyQt5.QtWidgets import QDesktopWidget
-        desktop = QDesktopWidget()
-        screen_rect = desktop.screenGeometry()
-        
-        # Get current position
-        current_x = self.mascot.x()
-        current_y = self.mascot.y()
-        
         # Check if we should switch to running mode (after 10 seconds of cumulative walking)
-        import time
-        current_time = time.time()
+        current_time = self.clock.time()
         
         # Initialize walking session timer if not set
         if not hasattr(self, 'walking_session_start_time') or self.walking_session_start_time is None:
@@ -136,251 +162,166 @@ class MascotLogic(QObject):
         walking_session_duration = current_time - self.walking_session_start_time
         if walking_session_duration > 10:
             self.is_running_mode = True
-            print(f"Switching to running mode after {walking_session_duration:.1f} seconds of walking!")
+            log.debug('walk', "Switching to running mode after %.1f seconds of walking!", walking_session_duration)
         else:
-            print(f"Walking session duration: {walking_session_duration:.1f} seconds (need 10s for running mode)")
-        
-        # Define possible directions and their animations
-        directions = {
-            'left': {'animation': 'walking_spr_pl_run_left' if self.is_running_mode else 'walking_spr_pl_left', 'dx': -4 if self.is_running_mode else -2, 'dy': 0},
-            'right': {'animation': 'walking_spr_pl_run_right' if self.is_running_mode else 'walking_spr_pl_right', 'dx': 4 if self.is_running_mode else 2, 'dy': 0},
-            'up': {'animation': 'walking_spr_pl_run_up' if self.is_running_mode else 'walking_spr_pl_up', 'dx': 0, 'dy': -4 if self.is_running_mode else -2},
-            'down': {'animation': 'walking_spr_pl_run_down' if self.is_running_mode else 'walking_spr_pl_down', 'dx': 0, 'dy': 4 if self.is_running_mode else 2}
-        }
-        
-        # Filter directions to avoid going off screen
-        valid_directions = []
-        margin = 50  # Keep some margin from screen edges
-        
-        for direction, data in directions.items():
-            new_x = current_x + (data['dx'] * 50)  # Predict position after 50 steps
-            new_y = current_y + (data['dy'] * 50)
-            
-            if (margin <= new_x <= screen_rect.width() - self.mascot.width() - margin and
-                margin <= new_y <= screen_rect.height() - self.mascot.height() - margin):
-                valid_directions.append(direction)
-        
-        # If no valid directions, move to center and try again
-        if not valid_directions:
-            center_x = (screen_rect.width() - self.mascot.width()) // 2
-            center_y = (screen_rect.height() - self.mascot.height()) // 2
-            self.mascot.move(center_x, center_y)
-            # Reset walking session timer when repositioning
-            self.walking_session_start_time = None
-            self.is_running_mode = False
-            self.random_walking_timer.start(2000)  # Wait 2 seconds before next walk
+            log.debug('walk', "Walking session duration: %.1f seconds (need 10s for running mode)", walking_session_duration)
+        
+        # Pick a reachable target anywhere on the screens and the waypoints leading there
+        region = self.get_walk_region()
+        start = (self.mascot.x(), self.mascot.y())
+        path = []
+        for attempt in range(3):
+            target = region.random_point(self.random)
+            if target is None:
+                break
+            path = region.find_path(start, target)
+            if path:
+                break
+        
+        if not path:
+            # Nowhere to walk (mascot bigger than the screens, or unconnected screens); try again later
+            log.debug('walk', "Random walk: no reachable target")
+            self.random_walking_timer.start(2000)
             return
         
-        # Choose random direction
-        import random
-        chosen_direction = random.choice(valid_directions)
-        direction_data = directions[chosen_direction]
+        self.walk_path = path
+        self.walk_speed = 4 if self.is_running_mode else 2
+        self.current_walk_direction = None
+        self.walk_duration = self.random.randint(3000, 7000)  # Walk/run for 3-7 seconds (or until the target is reached)
+        
+        # Start movement
+        self.start_walking_movement()
         
-        # Start walking/running animation
+        # Schedule next walk
+        self.random_walking_timer.start(self.walk_duration + self.random.randint(1000, 3000))
+    
+    def get_walk_region(self):
+        """Get the walkable region index for the current screens and mascot size (rebuilt only when those change)."""
+        size = (self.mascot.width(), self.mascot.height())
+        if self.walk_region is None or (self.walk_region.width, self.walk_region.height) != size:
+            self.walk_region = WalkableRegion(self.snapshot.available_geometries(), size[0], size[1], margin=20)
+        return self.walk_region
+    
+    def on_screens_changed(self):
+        """Screens were added, removed or resized: rebuild the walk region and stop the current walk."""
+        self.walk_region = None
+        if hasattr(self, 'walking_movement_timer') and self.walking_movement_timer.isActive():
+            self.stop_walking_movement()
+    
+    def start_walk_animation(self, direction):
+        """Start the walking (or running) animation facing direction; returns False if there is none."""
         walking_animations = self.mascot.animation_loader.get_animations_by_category('walking')
-        if walking_animations:
-            # Find the specific directional animation
-            target_animation = direction_data['animation']
-            
-            # Debug: Print what we're looking for
-            print(f"Looking for animation: {target_animation}")
-            print(f"Available animations: {walking_animations}")
-            print(f"Is running mode: {self.is_running_mode}")
-            
-            # Check if the target animation exists in the loaded animations
-            animation_found = False
-            for anim in walking_animations:
-                if target_animation == anim:  # Use exact match instead of 'in'
-                    print(f"Found exact match: {anim}")
-                    self.mascot.start_animation(anim, loop=True)
-                    animation_found = True
-                    break
-            
-            # If exact match not found, try partial match
-            if not animation_found:
-                for anim in walking_animations:
-                    if target_animation in anim:
-                        print(f"Found partial match: {anim}")
-                        self.mascot.start_animation(anim, loop=True)
-                        animation_found = True
-                        break
-            
-            if animation_found:
-                self.current_walk_direction = chosen_direction
-                self.walk_duration = random.randint(3000, 7000)  # Walk/run for 3-7 seconds
-                
-                # Start movement
-                self.start_walking_movement(direction_data['dx'], direction_data['dy'])
-                
-                # Schedule next walk
-                self.random_walking_timer.start(self.walk_duration + random.randint(1000, 3000))
-            else:
-                # Fallback to any walking animation
-                self.mascot.start_animation(random.choice(walking_animations), loop=True)
-                self.random_walking_timer.start(random.randint(3000, 6000))
+        if not walking_animations:
+            return False
+        
+        # Find the specific directional animation
+        if self.is_running_mode:
+            target_animation = f'walking_spr_pl_run_{direction}'
+        else:
+            target_animation = f'walking_spr_pl_{direction}'
+        
+        # Use exact match first, then partial match
+        for anim in walking_animations:
+            if target_animation == anim:
+                self.mascot.start_animation(anim, loop=True)
+                return True
+        for anim in walking_animations:
+            if target_animation in anim:
+                self.mascot.start_animation(anim, loop=True)
+                return True
+        
+        # Fallback to any walking animation
+        self.mascot.start_animation(self.random.choice(walking_animations), loop=True)
+        return True
     
     def perform_enhanced_afk_behavior(self):
         """Enhanced AFK behavior that randomly chooses between various activities."""
-        print("Enhanced AFK behavior triggered!")
+        log.debug('afk', "Enhanced AFK behavior triggered!")
         
         # Check if AFK mode is enabled
-        import config
         if not config.get_setting('afk_behavior', 'afk_mode_enabled', True):
-            print("AFK behavior blocked - AFK mode is disabled")
+            log.info('afk', "AFK behavior blocked - AFK mode is disabled")
             return
         
-        # Don't perform AFK behaviors if any special mode is active
-        if (self.mascot.is_sleeping or self.mascot.is_following_mouse or 
-            self.mascot.is_character_interaction or self.eternal_dance_mode or 
-            self.timed_dance_mode or getattr(self.mascot, 'is_falling', False) or
-            getattr(self.mascot, 'is_dragging', False) or
-            getattr(self.mascot, 'in_hide_seek_sequence', False) or
-            getattr(self.mascot, 'in_showdown_sequence', False) or
-            getattr(self.mascot, 'in_edward_sequence', False)):
-            print("AFK behavior blocked by special mode")
+        # Don't perform AFK behaviors if any special mode is active (or while being dragged)
+        if self.state.is_busy():
+            log.debug('afk', "AFK behavior blocked by special mode")
             return
         
-        import random
-        
-        # Define AFK behavior probabilities (weights) - only include enabled behaviors
-        import config
-        afk_behaviors = {}
-        
-        if config.get_setting('afk_behavior', 'enable_walking', True):
-            afk_behaviors['walk'] = 15  # Walking/running
-        if config.get_setting('afk_behavior', 'enable_sitting', True):
-            afk_behaviors['sit'] = 15   # Sitting animations
-        if config.get_setting('afk_behavior', 'enable_dancing', True):
-            afk_behaviors['dance'] = 12 # Dance animations
-        if config.get_setting('afk_behavior', 'enable_character_interactions', True):
-            afk_behaviors['character'] = 10 # Character interactions
-        if config.get_setting('afk_behavior', 'enable_sleeping', True):
-            afk_behaviors['sleep'] = 8  # Sleep mode
-        if config.get_setting('afk_behavior', 'enable_falling', True):
-            afk_behaviors['fall'] = 6   # Fall mode
-        if config.get_setting('afk_behavior', 'enable_cart_rides', True):
-            afk_behaviors['cart'] = 8   # Cart rides
-        if config.get_setting('afk_behavior', 'enable_mouse_following', True):
-            afk_behaviors['follow_mouse'] = 8 # Follow mouse briefly
-        if config.get_setting('afk_behavior', 'enable_minigames', True):
-            afk_behaviors['minigame'] = 10  # Minigames if available
-        if config.get_setting('afk_behavior', 'enable_whale_mail', True):
-            afk_behaviors['whale_mail'] = 8  # Whale mail delivery
-        
-        # If no behaviors are enabled, fallback to walking
-        if not afk_behaviors:
-            afk_behaviors['walk'] = 15
-        
-        # Create weighted list for random selection
-        weighted_choices = []
-        for behavior, weight in afk_behaviors.items():
-            weighted_choices.extend([behavior] * weight)
-        
-        # Select random behavior
-        chosen_behavior = random.choice(weighted_choices)
-        print(f"Chosen AFK behavior: {chosen_behavior}")
-        
-        # Execute the chosen behavior
-        if chosen_behavior == 'walk':
-            self.perform_random_walk()
-        elif chosen_behavior == 'sit':
-            self.perform_random_sitting()
-        elif chosen_behavior == 'dance':
-            self.perform_random_dance()
-        elif chosen_behavior == 'character':
-            self.perform_random_character_interaction()
-        elif chosen_behavior == 'sleep':
-            self.perform_random_sleep()
-        elif chosen_behavior == 'fall':
-            self.perform_random_fall()
-        elif chosen_behavior == 'cart':
-            self.perform_random_cart_ride()
-        elif chosen_behavior == 'follow_mouse':
-            self.perform_random_mouse_follow()
-        elif chosen_behavior == 'minigame':
-             self.perform_random_minigame()
-        elif chosen_behavior == 'whale_mail':
-            self.perform_random_whale_mail()
+        # Pick an enabled behavior from the cached alias table and run it
+        behavior = self.afk_behaviors.select(self.random)
+        log.info('afk', "Chosen AFK behavior: %s", behavior.name)
+        self.runtime.metrics.behaviors.run(behavior.name, behavior.handler)
     
     def perform_random_sitting(self):
         """Randomly choose and start a sitting animation."""
         sitting_animations = ['sitting_spr_colver_wind', 'sitting_spr_clover_sitting', 
                              'sitting_spr_clover_sit_dark', 'spr_clover_casual']
-        import random
-        chosen_sit = random.choice(sitting_animations)
-        print(f"AFK: Starting sitting animation: {chosen_sit}")
+        chosen_sit = self.random.choice(sitting_animations)
+        log.info('afk', "Starting sitting animation: %s", chosen_sit)
         self.mascot.start_sitting_animation(chosen_sit)
         # Stop sitting after a random duration and resume AFK behaviors
-        QTimer.singleShot(random.randint(8000, 15000), self.stop_afk_sitting)
+        self.scheduler.schedule(self.random.randint(8000, 15000), self.stop_afk_sitting, scope='afk')
     
     def perform_random_dance(self):
         """Start a random dance animation."""
-        print("AFK: Starting dance")
+        log.info('afk', "Starting dance")
         self.start_eternal_dance()
         # Stop dance after some time and return to AFK
-        import random
-        QTimer.singleShot(random.randint(10000, 20000), self.stop_afk_dance)
+        self.scheduler.schedule(self.random.randint(10000, 20000), self.stop_afk_dance, scope='afk')
     
     def stop_afk_dance(self):
         """Stop AFK dance and resume AFK behaviors."""
         self.stop_eternal_dance()
-        import random
-        self.random_walking_timer.start(random.randint(3000, 8000))
+        self.random_walking_timer.start(self.random.randint(3000, 8000))
     
     def perform_random_character_interaction(self):
         """Start a random character interaction."""
         char_interactions = self.mascot.animation_loader.get_animations_by_category('characters_interactions')
         if char_interactions:
-            import random
-            chosen_interaction = random.choice(char_interactions)
-            print(f"AFK: Starting character interaction: {chosen_interaction}")
+            chosen_interaction = self.random.choice(char_interactions)
+            log.info('afk', "Starting character interaction: %s", chosen_interaction)
             self.mascot.start_character_interaction(chosen_interaction)
             # Schedule next AFK behavior after character interaction completes
-            QTimer.singleShot(random.randint(5000, 10000), self.resume_afk_after_character_interaction)
+            self.scheduler.schedule(self.random.randint(5000, 10000), self.resume_afk_after_character_interaction, scope='afk')
         else:
             # Fallback to walking if no character interactions available
             self.perform_random_walk()
     
     def resume_afk_after_character_interaction(self):
         """Resume AFK behaviors after character interaction completion."""
-        print("AFK: Character interaction completed, resuming AFK behaviors")
-        import random
-        self.random_walking_timer.start(random.randint(2000, 5000))
+        log.info('afk', "Character interaction completed, resuming AFK behaviors")
+        self.random_walking_timer.start(self.random.randint(2000, 5000))
     
     def perform_random_sleep(self):
         """Start sleep mode for a random duration."""
-        print("AFK: Going to sleep")
+        log.info('afk', "Going to sleep")
         self.mascot.set_sleep_mode(True, auto_stop=True)
         # Wake up after random time
-        import random
-        QTimer.singleShot(random.randint(8000, 20000), self.wake_from_afk_sleep)
+        self.scheduler.schedule(self.random.randint(8000, 20000), self.wake_from_afk_sleep, scope='afk')
     
     def wake_from_afk_sleep(self):
         """Wake up from AFK sleep and resume AFK behaviors."""
         self.mascot.set_sleep_mode(False, auto_stop=True)
-        import random
-        self.random_walking_timer.start(random.randint(2000, 5000))
+        self.random_walking_timer.start(self.random.randint(2000, 5000))
     
     def perform_random_fall(self):
         """Start fall mode for a random duration."""
-        print("AFK: Starting to fall")
+        log.info('afk', "Starting to fall")
         self.mascot.set_fall_mode(True, auto_stop=True)
         # Stop falling after random time
-        import random
-        QTimer.singleShot(random.randint(5000, 12000), self.stop_afk_fall)
+        self.scheduler.schedule(self.random.randint(5000, 12000), self.stop_afk_fall, scope='afk')
     
     def stop_afk_fall(self):
         """Stop AFK fall and resume AFK behaviors."""
         self.mascot.set_fall_mode(False, auto_stop=True)
-        import random
-        self.random_walking_timer.start(random.randint(2000, 5000))
+        self.random_walking_timer.start(self.random.randint(2000, 5000))
     
     def perform_random_cart_ride(self):
         """Start a random cart ride."""
-        import random
         cart_types = ['normal', 'meme']
-        chosen_cart = random.choice(cart_types)
-        print(f"AFK: Starting {chosen_cart} cart ride")
+        chosen_cart = self.random.choice(cart_types)
+        log.info('afk', "Starting %s cart ride", chosen_cart)
         
         if chosen_cart == 'normal':
             self.mascot.start_cart_movement()
@@ -391,42 +332,36 @@ class MascotLogic(QObject):
     
     def perform_random_mouse_follow(self):
         """Briefly follow the mouse cursor."""
-        print("AFK: Following mouse briefly")
+        log.info('afk', "Following mouse briefly")
         self.mascot.set_follow_mouse(True)
         # Stop following after a longer time to allow reaching the mouse
-        import random
-        QTimer.singleShot(random.randint(15000, 25000), self.stop_afk_mouse_follow)
+        self.scheduler.schedule(self.random.randint(15000, 25000), self.stop_afk_mouse_follow, scope='afk')
     
     def stop_afk_mouse_follow(self):
         """Stop AFK mouse following and resume AFK behaviors."""
         self.mascot.set_follow_mouse(False)
         # Only restart random walking if not in special modes (dance, sleep, etc.)
-        if (self.random_walking_enabled and not self.eternal_dance_mode and 
-            not self.timed_dance_mode and not self.mascot.is_sleeping and 
-            not getattr(self.mascot, 'is_falling', False)):
-            import random
-            self.random_walking_timer.start(random.randint(2000, 5000))
+        if self.random_walking_enabled and not self.state.is_busy():
+            self.random_walking_timer.start(self.random.randint(2000, 5000))
     
     def stop_afk_sitting(self):
         """Stop AFK sitting and resume AFK behaviors."""
-        print("AFK: Stopping sitting animation and resuming AFK behaviors")
+        log.info('afk', "Stopping sitting animation and resuming AFK behaviors")
         # Return to idle state and resume AFK behaviors
         self.return_to_idle()
-        import random
-        self.random_walking_timer.start(random.randint(2000, 5000))
+        self.random_walking_timer.start(self.random.randint(2000, 5000))
     
     def perform_random_minigame(self):
         """Start a random minigame if available."""
         # Check if minigames are available in the mascot
         if hasattr(self.mascot, 'start_hide_and_seek_sequence'):
-            import random
             minigames = ['hide_and_seek']
             # Add showdown if available
             if hasattr(self.mascot, 'start_showdown_sequence'):
                 minigames.append('showdown')
             
-            chosen_game = random.choice(minigames)
-            print(f"AFK: Starting minigame: {chosen_game}")
+            chosen_game = self.random.choice(minigames)
+            log.info('afk', "Starting minigame: %s", chosen_game)
             
             if chosen_game == 'hide_and_seek':
                 self.mascot.start_hide_and_seek_sequence()
@@ -434,60 +369,71 @@ class MascotLogic(QObject):
                 self.mascot.start_showdown_sequence()
             
             # Minigames typically handle their own completion, but add fallback
-            QTimer.singleShot(random.randint(15000, 30000), self.resume_afk_after_minigame)
+            self.scheduler.schedule(self.random.randint(15000, 30000), self.resume_afk_after_minigame, scope='afk')
         else:
             # Fallback to walking if no minigames available
             self.perform_random_walk()
     
     def resume_afk_after_minigame(self):
         """Resume AFK behaviors after minigame completion."""
-        import random
-        self.random_walking_timer.start(random.randint(3000, 8000))
+        self.random_walking_timer.start(self.random.randint(3000, 8000))
     
     def perform_random_whale_mail(self):
         """Start whale mail delivery animation."""
-        print("AFK: Starting whale mail delivery")
+        log.info('afk', "Starting whale mail delivery")
         self.mascot.start_whale_mail_movement()
         # Whale mail handles its own completion and AFK resumption
     
-    def start_walking_movement(self, dx, dy):
-        """Start the actual movement during walking."""
+    def start_walking_movement(self):
+        """Start the actual movement along walk_path."""
         if not hasattr(self, 'walking_movement_timer'):
-            self.walking_movement_timer = QTimer()
+            self.walking_movement_timer = self.runtime.create_timer()
             self.walking_movement_timer.timeout.connect(self.update_walking_position)
         
-        self.walking_dx = dx
-        self.walking_dy = dy
         self.walking_movement_timer.start(50)  # Update position every 50ms
-        
-        # Stop movement after walk duration
-        QTimer.singleShot(self.walk_duration, self.stop_walking_movement)
+        self.update_walk_heading()
+        
+        # Stop movement after walk duration (a previous walk's stop must not cut this one short)
+        if self.walk_stop_task:
+            self.walk_stop_task.cancel()
+        self.walk_stop_task = self.scheduler.schedule(self.walk_duration, self.stop_walking_movement, scope='walking')
+    
+    def update_walk_heading(self):
+        """Turn towards the next waypoint, switching the directional animation if needed."""
+        target_x, target_y = self.walk_path[0]
+        dx = target_x - self.mascot.x()
+        dy = target_y - self.mascot.y()
+        if abs(dx) >= abs(dy):
+            direction = 'right' if dx > 0 else 'left'
+        else:
+            direction = 'down' if dy > 0 else 'up'
+        if direction != self.current_walk_direction:
+            self.current_walk_direction = direction
+            self.start_walk_animation(direction)
     
     def update_walking_position(self):
         """Update mascot position during walking."""
-        if (self.mascot.is_sleeping or self.mascot.is_following_mouse or 
-            self.mascot.is_character_interaction or self.eternal_dance_mode or 
-            self.timed_dance_mode or getattr(self.mascot, 'is_falling', False)):
+        if self.state.is_busy():
             self.stop_walking_movement()
             return
         
-        # Get screen dimensions
-        from PyQt5.QtWidgets import QDesktopWidget
-        desktop = QDesktopWidget()
-        screen_rect = desktop.screenGeometry()
-        
-        # Calculate new position
-        new_x = self.mascot.x() + self.walking_dx
-        new_y = self.mascot.y() + self.walking_dy
-        
-        # Check boundaries
-        margin = 20
-        if (margin <= new_x <= screen_rect.width() - self.mascot.width() - margin and
-            margin <= new_y <= screen_rect.height() - self.mascot.height() - margin):
-            self.mascot.move(new_x, new_y)
+        # Step towards the next waypoint; the path stays inside the walkable region
+        x, y = self.mascot.x(), self.mascot.y()
+        target_x, target_y = self.walk_path[0]
+        dx, dy = target_x - x, target_y - y
+        distance = (dx * dx + dy * dy) ** 0.5
+        
+        if distance <= self.walk_speed:
+            self.mascot.move(target_x, target_y)
+            self.walk_path.pop(0)
+            if not self.walk_path:
+                # Reached the target
+                self.stop_walking_movement()
+                return
+            self.update_walk_heading()
         else:
-            # Hit boundary, stop walking
-            self.stop_walking_movement()
+            self.mascot.move(int(round(x + dx / distance * self.walk_speed)),
+                             int(round(y + dy / distance * self.walk_speed)))
     
     def stop_walking_movement(self):
         """Stop the walking movement."""
@@ -503,13 +449,13 @@ class MascotLogic(QObject):
     
     def start_random_walking_system(self):
         """Start the random walking system."""
-        print(f"Starting random walking system. Enabled: {self.random_walking_enabled}")
+        log.debug('walk', "Starting random walking system. Enabled: %s", self.random_walking_enabled)
         if self.random_walking_enabled:
             # Reset walking session timer when starting
             self.walking_session_start_time = None
             self.is_running_mode = False
-            delay = random.randint(2000, 5000)
-            print(f"Random walking timer started with delay: {delay}ms")
+            delay = self.random.randint(2000, 5000)
+            log.debug('walk', "Random walking timer started with delay: %sms", delay)
             self.random_walking_timer.start(delay)
     
     def stop_random_walking_system(self):
@@ -534,32 +480,19 @@ class MascotLogic(QObject):
     
     def select_weighted_action(self, available_actions):
         """Select an action using weighted random selection, avoiding recent repeats."""
-        # Adjust weights based on recent history
-        adjusted_actions = []
-        
+        # Register newly available categories and keep each one's animations to pick from
         for category, weight, animations in available_actions:
-            # Reduce weight if action was used recently
-            recent_count = self.action_history.count(category)
-            adjusted_weight = max(1, weight - (recent_count * 5))
-            adjusted_actions.append((category, adjusted_weight, animations))
-        
-        # Create weighted list
-        weighted_list = []
-        for category, weight, animations in adjusted_actions:
-            weighted_list.extend([category] * weight)
-        
-        if not weighted_list:
+            self.action_animations[category] = animations
+            action = self.actions.by_name.get(category)
+            if action is None:
+                self.actions.register(category, None, weight)
+            elif action.weight != weight:
+                self.actions.set_weight(category, weight)
+        
+        action = self.actions.select(self.random)
+        if action is None:
             return None
-        
-        # Select random category
-        selected_category = random.choice(weighted_list)
-        
-        # Get animations for selected category
-        for category, _, animations in adjusted_actions:
-            if category == selected_category:
-                return (category, random.choice(animations))
-        
-        return None
+        return (action.name, self.random.choice(self.action_animations[action.name]))
     
     def execute_action(self, action_info):
         """Execute a specific action."""
@@ -579,7 +512,7 @@ class MascotLogic(QObject):
         # Set timer for action duration if not looping
         if not loop:
             duration = self.get_action_duration(category)
-            QTimer.singleShot(duration, self.return_to_idle)
+            self.scheduler.schedule(duration, self.return_to_idle, scope='action')
     
     def should_action_loop(self, category):
         """Determine if an action should loop continuously."""
@@ -603,7 +536,7 @@ class MascotLogic(QObject):
             return None
         
         # Check if mouse is nearby and not idle
-        if (self.mascot.event_handler.is_mouse_near_mascot(200) and 
+        if (self.mascot.event_handler.is_in_zone('far') and 
             not self.mascot.event_handler.is_mouse_idle):
             # Walk towards mouse
             direction = self.mascot.event_handler.get_mouse_direction_from_mascot()
@@ -613,56 +546,45 @@ class MascotLogic(QObject):
                 return direction_animation
         
         # Random direction
-        return random.choice(walking_animations)
+        return self.random.choice(walking_animations)
     
     def update_action_history(self, action):
         """Update the action history to avoid repetition."""
-        self.action_history.append(action)
-        
-        # Keep only recent history
-        if len(self.action_history) > self.max_history:
-            self.action_history.pop(0)
+        category = action[0] if isinstance(action, tuple) else action
+        self.actions.record(category)
     
     def return_to_idle(self):
         """Return mascot to idle state."""
-        if self.mascot.is_sleeping or self.mascot.is_following_mouse:
+        if self.state.is_in(MascotState.SLEEPING, MascotState.FOLLOWING_MOUSE):
             return
         
         # Stop current timers
         self.mascot.idle_timer.stop()
-        self.mascot.mouse_follow_timer.stop()
-        
-        # Reset states
-        self.mascot.is_following_mouse = False
-        self.mascot.is_sleeping = False
         
         # Removed automatic sitting animation - let AFK behavior system handle sitting based on user settings
         # Idle timer functionality removed with idle mode
     
     def on_animation_complete(self):
         """Called when a non-looping animation completes."""
-        # Don't interfere if we're in the middle of Edward sequence
-        if hasattr(self.mascot, 'in_edward_sequence') and self.mascot.in_edward_sequence:
-            return
-        
-        # Check if we're in a hide and seek sequence and should not interfere
-        if hasattr(self.mascot, 'in_hide_seek_sequence') and self.mascot.in_hide_seek_sequence:
+        # Don't interfere with scripted sequences (Edward, hide and seek, showdown, rides, dying):
+        # they move on by themselves
+        if self.state.is_in(MascotState.EDWARD, MascotState.HIDE_SEEK, MascotState.SHOWDOWN,
+                            MascotState.RIDING, MascotState.DYING):
             return
         
-        # Reset character interaction flag if it was set
-        if self.mascot.is_character_interaction:
-            self.mascot.is_character_interaction = False
+        # End the character interaction if one was playing
+        if self.state.leave(MascotState.CHARACTER_INTERACTION):
             # Resume AFK behaviors after character interaction completes
-            import random
-            self.random_walking_timer.start(random.randint(3000, 8000))
+            self.random_walking_timer.start(self.random.randint(3000, 8000))
             return
         
         # Return to idle after animation completes
-        QTimer.singleShot(500, self.return_to_idle)  # Small delay before returning to idle
+        self.scheduler.schedule(500, self.return_to_idle, scope='action')  # Small delay before returning to idle
     
     def set_behavior_mode(self, mode):
         """Set the current behavior mode."""
         self.current_behavior_mode = mode
+        self.cancel_behavior_tasks()
         
         if mode == 'idle':
             self.return_to_idle()
@@ -671,18 +593,20 @@ class MascotLogic(QObject):
         elif mode == 'sleep':
             self.mascot.set_sleep_mode(True)
     
-    def update_behavior(self):
-        """Update behavior based on current mode and conditions."""
-        # Skip behavior updates if in eternal dance or timed dance mode
-        if self.eternal_dance_mode or self.timed_dance_mode:
+    def on_mouse_zone_entered(self, zone):
+        """The cursor came within one of the event handler's proximity zones."""
+        # Off by default: the reaction doesn't hand back to what it interrupts (an AFK sit, an idle pose)
+        if not config.get_setting('behavior', 'enable_proximity_reactions', False):
             return
-            
-        if self.current_behavior_mode == 'idle':
-            # Check for environmental triggers
-            if self.mascot.event_handler.is_mouse_near_mascot(100):
-                # Mouse is nearby, maybe react
-                if random.random() < 0.3:  # 30% chance to react
-                    self.react_to_mouse_proximity()
+        # Only react while idle, and not in the middle of a walk
+        if zone != 'near' or self.state.is_busy() or self.current_behavior_mode != 'idle':
+            return
+        if hasattr(self, 'walking_movement_timer') and self.walking_movement_timer.isActive():
+            return
+        
+        # Mouse is nearby, maybe react
+        if self.random.random() < config.get_setting('behavior', 'reaction_probability', 0.3):
+            self.react_to_mouse_proximity()
     
     def react_to_mouse_proximity(self):
         """React when mouse is near the mascot."""
@@ -696,18 +620,44 @@ class MascotLogic(QObject):
                 available_reactions.extend([(reaction, anim) for anim in animations])
         
         if available_reactions:
-            category, animation = random.choice(available_reactions)
+            category, animation = self.random.choice(available_reactions)
             self.execute_action((category, animation))
     
+    def get_idle_sequence_deadline(self):
+        """Get the clock time the idle sequence next moves on at, or None if it only waits for the user."""
+        if self.idle_sequence_state == 'waiting':
+            return self.last_user_interaction + self.idle_trigger_time / 1000
+        if self.idle_sequence_state == 'dancing' and self.dance_start_time:
+            return self.dance_start_time + self.dance_duration / 1000
+        return None
+    
+    def arm_idle_sequence_timer(self):
+        """Arm the idle sequence timer for the next deadline (fires right away if it has passed)."""
+        deadline = self.get_idle_sequence_deadline()
+        if deadline is None:
+            self.idle_sequence_timer.stop()
+            return
+        delay = max(0, int((deadline - self.clock.time()) * 1000))
+        self.idle_sequence_timer.start(delay)
+    
+    def on_idle_sequence_deadline(self):
+        """Idle sequence deadline reached: advance the sequence, then arm for the next deadline if it moved on."""
+        state_before = self.idle_sequence_state
+        self.check_idle_sequence()
+        # If nothing changed (busy, or the sequence is disabled) the timer stays off until the
+        # user interacts or the mascot returns to IDLE, so a still desktop causes no wakeups
+        if self.idle_sequence_state != state_before:
+            self.arm_idle_sequence_timer()
+    
     def check_idle_sequence(self):
         """Check and manage the idle sequence behavior."""
-        if self.mascot.is_sleeping or self.mascot.is_following_mouse or self.eternal_dance_mode or self.mascot.is_character_interaction:
+        if self.state.is_busy():
             return
         
         # Idle sequence functionality removed with idle mode
         return
         
-        current_time = time.time()
+        current_time = self.clock.time()
         time_since_interaction = (current_time - self.last_user_interaction) * 1000  # Convert to milliseconds
         
         if self.idle_sequence_state == 'waiting':
@@ -730,9 +680,9 @@ class MascotLogic(QObject):
         dancing_animations = self.mascot.animation_loader.get_animations_by_category('dancing')
         if dancing_animations:
             self.idle_sequence_state = 'dancing'
-            self.dance_start_time = time.time()
+            self.dance_start_time = self.clock.time()
             self.mascot.idle_timer.stop()  # Stop normal idle timer
-            self.mascot.start_animation(random.choice(dancing_animations), loop=True)
+            self.mascot.start_animation(self.random.choice(dancing_animations), loop=True)
     
     def start_idle_walking_sequence(self):
         """Start the random walking sequence after dancing."""
@@ -743,7 +693,7 @@ class MascotLogic(QObject):
         # Set up timer for random walking actions
         min_interval = config.get_setting('behavior', 'walking_action_min_interval', 2000)
         max_interval = config.get_setting('behavior', 'walking_action_max_interval', 5000)
-        QTimer.singleShot(random.randint(min_interval, max_interval), self.perform_walking_action)
+        self.scheduler.schedule(self.random.randint(min_interval, max_interval), self.perform_walking_action, scope='idle_sequence')
     
     def perform_walking_action(self):
         """Perform a walking action during idle sequence."""
@@ -752,13 +702,13 @@ class MascotLogic(QObject):
         
         walking_animations = self.mascot.animation_loader.get_animations_by_category('walking')
         if walking_animations:
-            selected_animation = random.choice(walking_animations)
+            selected_animation = self.random.choice(walking_animations)
             self.mascot.start_animation(selected_animation, loop=False)
             
             # Schedule next walking action
             min_interval = config.get_setting('behavior', 'walking_action_min_interval', 2000)
             max_interval = config.get_setting('behavior', 'walking_action_max_interval', 5000)
-            QTimer.singleShot(random.randint(min_interval, max_interval), self.perform_walking_action)
+            self.scheduler.schedule(self.random.randint(min_interval, max_interval), self.perform_walking_action, scope='idle_sequence')
     
     def reset_idle_sequence(self):
         """Reset the idle sequence to waiting state."""
@@ -766,42 +716,55 @@ class MascotLogic(QObject):
         self.dance_start_time = None
         self.return_to_idle()
     
+    def cancel_behavior_tasks(self):
+        """Cancel pending follow-ups of the current behavior so they can't run after a mode change."""
+        self.scheduler.cancel_scopes(self.BEHAVIOR_SCOPES)
+    
     def on_user_interaction(self):
         """Called when user interacts with the mascot."""
+        # Costs from here on are the user's doing, not the interrupted behavior's
+        self.runtime.metrics.behaviors.switch(None)
+        
+        # Pending AFK follow-ups (stop sitting, wake up, ...) belong to the behavior being interrupted
+        self.cancel_behavior_tasks()
+        
         # Auto-stop eternal dance mode when any action is triggered
-        if self.eternal_dance_mode:
+        if self.state.state is MascotState.ETERNAL_DANCE:
             self.stop_eternal_dance()
             return  # Let stop_eternal_dance handle the state reset
         
         # Auto-stop sleep mode when any action is triggered
-        if self.mascot.is_sleeping:
+        if self.state.state is MascotState.SLEEPING:
             self.mascot.set_sleep_mode(False, auto_stop=True)
             return  # Let set_sleep_mode handle the state reset
         
         # Auto-stop fall mode when any action is triggered
-        if getattr(self.mascot, 'is_falling', False):
+        if self.state.state is MascotState.FALLING:
             self.mascot.set_fall_mode(False, auto_stop=True)
             return  # Let set_fall_mode handle the state reset
         
         # Stop random walking when user interactions occur
         self.stop_random_walking_system()
         
-        self.last_user_interaction = time.time()
+        self.last_user_interaction = self.clock.time()
         if self.idle_sequence_state != 'waiting':
             self.reset_idle_sequence()
+        self.arm_idle_sequence_timer()
     
     def start_eternal_dance(self):
         """Start eternal dance mode - mascot will dance continuously."""
         # Auto-stop sleep mode if active
-        if self.mascot.is_sleeping:
+        if self.state.state is MascotState.SLEEPING:
             self.mascot.set_sleep_mode(False, auto_stop=True)
         
         # Auto-stop fall mode if active
-        if getattr(self.mascot, 'is_falling', False):
+        if self.state.state is MascotState.FALLING:
             self.mascot.set_fall_mode(False, auto_stop=True)
         
-        self.eternal_dance_mode = True
-        self.stop_random_walking_system()
+        # Entering the dance state stops random walking
+        if not self.state.transition(MascotState.ETERNAL_DANCE):
+            return
+        self.cancel_behavior_tasks()
         self.reset_idle_sequence()  # Stop any idle sequence
         # Get dancing animations and start one
         dancing_animations = self.mascot.animation_loader.get_animations_by_category('dancing')
@@ -810,18 +773,19 @@ class MascotLogic(QObject):
     
     def stop_eternal_dance(self):
         """Stop eternal dance mode and return to normal behavior."""
-        self.eternal_dance_mode = False
+        self.state.leave(MascotState.ETERNAL_DANCE)
         # Restart random walking if no other special modes are active
-        if (self.random_walking_enabled and not self.timed_dance_mode and 
-            not getattr(self.mascot, 'is_falling', False)):
+        if self.random_walking_enabled and not self.state.is_busy():
             self.start_random_walking_system()
         self.on_user_interaction()  # Reset interaction timer
         self.return_to_idle()
     
     def start_timed_dance(self, duration_ms=60000):
         """Start timed dance mode - mascot will dance for specified duration."""
-        self.timed_dance_mode = True
-        self.stop_random_walking_system()
+        # Entering the dance state stops random walking
+        if not self.state.transition(MascotState.TIMED_DANCE):
+            return
+        self.cancel_behavior_tasks()
         self.reset_idle_sequence()  # Stop any idle sequence
         # Get dancing animations and start one
         dancing_animations = self.mascot.animation_loader.get_animations_by_category('dancing')
@@ -832,17 +796,15 @@ class MascotLogic(QObject):
     
     def stop_timed_dance(self):
         """Stop timed dance mode and return to normal behavior."""
-        self.timed_dance_mode = False
-        self.timed_dance_timer.stop()
+        # Leaving the state stops the timed dance timer
+        self.state.leave(MascotState.TIMED_DANCE)
         # Restart random walking if no other special modes are active
-        if (self.random_walking_enabled and not self.eternal_dance_mode and 
-            not getattr(self.mascot, 'is_falling', False)):
+        if self.random_walking_enabled and not self.state.is_busy():
             self.start_random_walking_system()
         self.on_user_interaction()  # Reset interaction timer
         self.return_to_idle()
         # Schedule next AFK behavior after timed dance completes
-        import random
-        self.random_walking_timer.start(random.randint(2000, 5000))
+        self.random_walking_timer.start(self.random.randint(2000, 5000))
 
     # Idle mode functionality removed
     
@@ -851,10 +813,13 @@ class MascotLogic(QObject):
         return {
             'behavior_mode': self.current_behavior_mode,
             'last_action': self.last_action,
-            'is_sleeping': self.mascot.is_sleeping,
-            'is_following_mouse': self.mascot.is_following_mouse,
+            'state': self.state.get_state_name(),
+            'is_busy': self.state.is_busy(),
+            'is_sleeping': self.state.state is MascotState.SLEEPING,
+            'is_following_mouse': self.state.state is MascotState.FOLLOWING_MOUSE,
             'idle_sequence_state': self.idle_sequence_state,
-            'eternal_dance_mode': self.eternal_dance_mode,
+            'eternal_dance_mode': self.state.state is MascotState.ETERNAL_DANCE,
+            'scheduled_tasks': self.scheduler.get_stats(),
             # idle_mode_enabled removed
             'current_animation': self.mascot.current_animation['frames'][0] if self.mascot.current_animation else None
         }
\ No newline at end of file
@@ -4,9 +4,10 @@ Desktop Mascot - Main mascot window and display logic (Also some animations beca
 """
 
 import os
-import random
 import time
 import config
+from utils import log, trace
+from utils.profiler import SessionProfiler, SamplingProfiler
 import requests
 import json
 from urllib.parse import quote
@@ -17,33 +18,62 @@ try:
 except ImportError:
     WIN32_AVAILABLE = False
 from PyQt5.QtWidgets import QWidget, QLabel, QMenu, QAction, QApplication, QSystemTrayIcon
-from PyQt5.QtCore import Qt, QTimer, QPoint, pyqtSignal, QThread, pyqtSignal as Signal
-from PyQt5.QtGui import QPixmap, QPainter, QCursor, QIcon
+from PyQt5.QtCore import Qt, QPoint, pyqtSignal, QThread, pyqtSignal as Signal
+from PyQt5.QtGui import QPixmap, QPainter, QIcon
 from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
 from .animation_loader import AnimationLoader
 from .event_handler import EventHandler
 from .logic import MascotLogic
 from .settings_dialog import AFKBehaviorSettingsDialog
+from .sprite_view import SpriteView
+from .overlay import OverlayCompositor
+from .bullet_pool import BulletPool
+from .timeline import Timeline
+from .state_machine import MascotState, MascotStateMachine
+from .runtime import get_default_runtime
+from .pursuit import PursuitController
+from .hud import PerformanceHud
+from .watchdog import StallWatchdog
+from .memory import MemoryDiagnostics
+from .showdown_sim import ShowdownSimulation, SIMULATION_STEP_MS, MAX_CATCHUP_STEPS, interpolate_point
 
 class DesktopMascot(QWidget):
     """Main mascot widget that displays on desktop."""
     
-    def __init__(self):
+    def __init__(self, runtime=None):
         super().__init__()
+        # Clock, timers and random numbers (real ones unless a simulation injects its own)
+        self.runtime = runtime or get_default_runtime()
+        self.clock = self.runtime.clock
+        self.random = self.runtime.random
+        self.snapshot = self.runtime.snapshot
+        
+        # What the mascot is doing (sleeping, following the mouse, a minigame, ...)
+        self.state = MascotStateMachine()
+        
         self.animation_loader = AnimationLoader()
-        self.event_handler = EventHandler(self)
-        self.logic = MascotLogic(self)
+        self.event_handler = EventHandler(self, self.runtime)
+        self.logic = MascotLogic(self, self.runtime)
         
         # State variables
         self.current_animation = None
         self.current_animation_name = None
         self.current_frame = 0
-        self.is_following_mouse = False
-        self.is_sleeping = False
-        self.is_falling = False
-        self.is_dragging = False
         self.drag_start_position = QPoint()
-        self.is_character_interaction = False
+        
+        # Frames shown and the time spent preparing them (read by the performance HUD)
+        self.sprite_updates = 0
+        self.sprite_update_time = 0.0
+        self.runtime.metrics.behaviors.frame_counter = lambda: self.sprite_updates
+        self.hud = None
+        self.profiler = SessionProfiler()  # Started and stopped from the tray
+        self.sampler = SamplingProfiler()
+        self.memory = MemoryDiagnostics()  # Snapshots taken from the tray
+        if config.get_setting('debug', 'sampling_on_startup', False):
+            self.sampler.start()
+        
+        # Multi-phase sequence currently playing (see play_timeline)
+        self.active_timeline = None
         
         # Running mode variables
         self.is_running_mode = False
@@ -57,20 +87,52 @@ class DesktopMascot(QWidget):
         self.current_meme_pixmap = None
         self.network_manager = QNetworkAccessManager()
         
+        # Optional overlay compositor: one transparent window per screen for bullets and memes
+        self.overlay_compositor = None
+        if config.get_setting('window', 'overlay_compositor', False):
+            self.overlay_compositor = OverlayCompositor()
+        
         # Timers
-        self.animation_timer = QTimer()
+        self.animation_timer = self.runtime.create_timer()
         self.animation_timer.timeout.connect(self.next_frame)
         
-        self.idle_timer = QTimer()
+        self.idle_timer = self.runtime.create_timer()
         self.idle_timer.timeout.connect(self.logic.perform_random_action)
         
-        self.mouse_follow_timer = QTimer()
+        # Follow-mouse ticks are single-shot: the pursuit controller picks each next interval
+        self.mouse_follow_timer = self.runtime.create_timer()
+        self.mouse_follow_timer.setSingleShot(True)
         self.mouse_follow_timer.timeout.connect(self.follow_mouse)
+        self.pursuit = PursuitController(
+            min_interval=config.get_setting('behavior', 'mouse_follow_update_rate', 50),
+            max_interval=config.get_setting('behavior', 'mouse_follow_max_interval', 120),
+            hysteresis=config.get_setting('behavior', 'mouse_follow_direction_hysteresis', 0.3))
+        self.follow_last_tick = None
+        
+        self.zzz_timer = self.runtime.create_timer()
+        self.zzz_timer.timeout.connect(self.next_zzz_frame)
+        
+        self.hide_seek_detection_timer = self.runtime.create_timer()
+        self.hide_seek_detection_timer.timeout.connect(self.check_visual_timeout)
+        
+        # Each mode's timers stop when the mode ends, sequences also stop their timeline
+        self.state.own_timer(MascotState.FOLLOWING_MOUSE, 'follow', self.mouse_follow_timer)
+        self.state.own_timer(MascotState.SLEEPING, 'zzz', self.zzz_timer)
+        self.state.own_timer(MascotState.HIDE_SEEK, 'detection', self.hide_seek_detection_timer)
+        self.state.on_exit([MascotState.RIDING, MascotState.HIDE_SEEK, MascotState.SHOWDOWN,
+                            MascotState.EDWARD], self.cancel_timeline)
         
         self.init_ui()
         self.init_system_tray()
         self.load_initial_animation()
         
+        # Watch for the GUI thread blocking the event loop (off by default: its heartbeat wakes the GUI thread)
+        self.watchdog = None
+        if config.get_setting('debug', 'watchdog_enabled', False):
+            self.set_watchdog_enabled(True)
+        if config.get_setting('debug', 'show_animation_info', False):
+            self.set_hud_visible(True)
+        
     def init_ui(self):
         """Initialize the UI with transparent background and frameless window."""
         # Window properties for desktop overlay
@@ -88,9 +150,8 @@ class DesktopMascot(QWidget):
         self.resize(64, 64)  # Default sprite size
         self.move(100, 100)  # Initial position
         
-        # Create label for sprite display
-        self.sprite_label = QLabel(self)
-        self.sprite_label.setAlignment(Qt.AlignCenter)
+        # Create view for sprite display (supports partial repaints between frames)
+        self.sprite_label = SpriteView(self)
         
         # Enable mouse tracking
         self.setMouseTracking(True)
@@ -98,7 +159,7 @@ class DesktopMascot(QWidget):
     def init_system_tray(self):
         """Initialize the system tray icon."""
         if not QSystemTrayIcon.isSystemTrayAvailable():
-            print("System tray is not available on this system.")
+            log.info('tray', "System tray is not available on this system.")
             return
         
         # Create system tray icon
@@ -123,6 +184,45 @@ class DesktopMascot(QWidget):
         show_hide_action.triggered.connect(self.toggle_mascot_visibility)
         tray_menu.addAction(show_hide_action)
         
+        # Diagnostics submenu
+        diagnostics_menu = tray_menu.addMenu("Diagnostics")
+        show_metrics_action = QAction("Show Metrics", self)
+        show_metrics_action.triggered.connect(self.show_metrics)
+        diagnostics_menu.addAction(show_metrics_action)
+        save_metrics_action = QAction("Save Metrics (JSON)", self)
+        save_metrics_action.triggered.connect(self.save_metrics)
+        diagnostics_menu.addAction(save_metrics_action)
+        hud_action = QAction("Performance HUD", self)
+        hud_action.setCheckable(True)
+        hud_action.setChecked(config.get_setting('debug', 'show_animation_info', False))
+        hud_action.toggled.connect(self.set_hud_visible)
+        diagnostics_menu.addAction(hud_action)
+        trace_action = QAction("Record Trace", self)
+        trace_action.setCheckable(True)
+        trace_action.setChecked(trace.is_recording())
+        trace_action.toggled.connect(self.set_trace_recording)
+        diagnostics_menu.addAction(trace_action)
+        self.profile_action = QAction("Start Profiling", self)
+        self.profile_action.triggered.connect(self.toggle_profiling)
+        diagnostics_menu.addAction(self.profile_action)
+        self.sampling_action = QAction("Stop Sampling" if self.sampler.is_running() else "Start Sampling", self)
+        self.sampling_action.triggered.connect(self.toggle_sampling)
+        diagnostics_menu.addAction(self.sampling_action)
+        dump_samples_action = QAction("Save Samples", self)
+        dump_samples_action.triggered.connect(self.dump_samples)
+        diagnostics_menu.addAction(dump_samples_action)
+        watchdog_action = QAction("Stall Watchdog", self)
+        watchdog_action.setCheckable(True)
+        watchdog_action.setChecked(config.get_setting('debug', 'watchdog_enabled', False))
+        watchdog_action.toggled.connect(self.set_watchdog_enabled)
+        diagnostics_menu.addAction(watchdog_action)
+        memory_snapshot_action = QAction("Memory Snapshot", self)
+        memory_snapshot_action.triggered.connect(self.take_memory_snapshot)
+        diagnostics_menu.addAction(memory_snapshot_action)
+        reset_memory_action = QAction("Reset Memory Baseline", self)
+        reset_memory_action.triggered.connect(self.memory.reset)
+        diagnostics_menu.addAction(reset_memory_action)
+        
         tray_menu.addSeparator()
         
         # Exit action
@@ -139,7 +239,131 @@ class DesktopMascot(QWidget):
         # Show the tray icon
         self.tray_icon.show()
         
-        print("System tray icon initialized successfully.")
+        log.debug('tray', "System tray icon initialized successfully.")
+    
+    def show_metrics(self):
+        """Log the timer metrics table and show the most expensive callbacks in a tray message."""
+        metrics = self.runtime.metrics
+        if not metrics.enabled:
+            self.tray_icon.showMessage("Clover Metrics", "Metrics are off (performance.enable_metrics).",
+                                       QSystemTrayIcon.Information, 3000)
+            return
+        lines = metrics.format_table()
+        log.info('metrics', "Timer callbacks by total cost:\n%s", '\n'.join(lines))
+        summary = []
+        for name, entry in list(metrics.snapshot()['callbacks'].items())[:4]:
+            summary.append(f"{name.split('.')[-1]}: {entry['calls']} calls, p99 {entry['cost_us']['p99']:.0f}us, "
+                           f"{entry['dropped_frames']} dropped")
+        self.tray_icon.showMessage("Clover Metrics", '\n'.join(summary) or "Nothing measured yet.",
+                                   QSystemTrayIcon.Information, 8000)
+    
+    def save_metrics(self):
+        """Write the timer metrics to metrics.json in the config directory."""
+        try:
+            path = self.runtime.metrics.dump_json()
+        except OSError as e:
+            log.error('metrics', "Could not save metrics: %s", e)
+            return
+        log.info('metrics', "Saved metrics to %s", path)
+        self.tray_icon.showMessage("Clover Metrics", f"Saved to {path}", QSystemTrayIcon.Information, 3000)
+    
+    def set_hud_visible(self, visible):
+        """Show or hide the performance HUD next to the mascot."""
+        config.update_setting('debug', 'show_animation_info', visible)
+        if visible:
+            if self.hud is None:
+                self.hud = PerformanceHud(self, self.runtime)
+            self.hud.start()
+        elif self.hud:
+            self.hud.stop()
+    
+    def set_watchdog_enabled(self, enabled):
+        """Start or stop the GUI thread stall watchdog (real time only)."""
+        config.update_setting('debug', 'watchdog_enabled', enabled)
+        if enabled:
+            if not self.runtime.realtime:
+                return
+            if self.watchdog is None:
+                self.watchdog = StallWatchdog(self.runtime)
+            self.watchdog.start()
+        elif self.watchdog:
+            self.watchdog.stop()
+    
+    def set_trace_recording(self, recording):
+        """Start recording a Chrome/Perfetto trace, or stop and save it to the config directory."""
+        tracer = trace.get_tracer()
+        if recording:
+            tracer.start()
+            log.info('trace', "Recording trace (up to %d events)", tracer.events.maxlen)
+            return
+        if not tracer.recording:
+            return
+        tracer.stop()
+        stats = tracer.get_stats()
+        path = tracer.save_in_background(
+            lambda saved: log.info('trace', "Saved trace to %s (open in ui.perfetto.dev or chrome://tracing)", saved))
+        log.info('trace', "Stopped trace: %d events, %d dropped", stats['events'], stats['dropped'])
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.showMessage("Clover Trace", f"Saving {stats['events']} events to {path}",
+                                       QSystemTrayIcon.Information, 4000)
+    
+    def toggle_profiling(self):
+        """Start cProfile on the GUI thread, or stop it and save the .pstats and flamegraph files."""
+        if not self.profiler.is_running():
+            self.profiler.start()
+            if hasattr(self, 'profile_action'):
+                self.profile_action.setText("Stop Profiling")
+            return
+        try:
+            paths = self.profiler.stop()
+        except OSError as e:
+            log.error('profile', "Could not save profile: %s", e)
+            paths = None
+        if hasattr(self, 'profile_action'):
+            self.profile_action.setText("Start Profiling")
+        if paths and hasattr(self, 'tray_icon'):
+            self.tray_icon.showMessage("Clover Profiler", f"Saved {paths[0]}", QSystemTrayIcon.Information, 4000)
+    
+    def toggle_sampling(self):
+        """Start the sampling profiler on the GUI thread, or stop it and save what it collected."""
+        if not self.sampler.is_running():
+            self.sampler.start()
+            if hasattr(self, 'sampling_action'):
+                self.sampling_action.setText("Stop Sampling")
+            return
+        self.sampler.stop()
+        if hasattr(self, 'sampling_action'):
+            self.sampling_action.setText("Start Sampling")
+        self.dump_samples()
+    
+    def dump_samples(self):
+        """Save the sampling profiler's collapsed stacks so far (it keeps running)."""
+        if not self.sampler.samples:
+            log.info('profile', "No samples to save yet")
+            return
+        try:
+            path = self.sampler.dump()
+        except OSError as e:
+            log.error('profile', "Could not save samples: %s", e)
+            return
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.showMessage("Clover Profiler", f"Saved {path}", QSystemTrayIcon.Information, 4000)
+    
+    def take_memory_snapshot(self):
+        """Take a memory snapshot and log what grew since the first one (the baseline) and the last one."""
+        snapshot, since_start, since_previous = self.memory.take()
+        if since_start is None:
+            log.info('memory', "Memory baseline taken:\n%s", '\n'.join(self.memory.format_census(snapshot)))
+            message = "Baseline taken. Take another snapshot later to see what grew."
+        else:
+            log.info('memory', "Memory since baseline %s", '\n'.join(self.memory.format_diff(since_start)))
+            if since_previous:
+                log.info('memory', "Memory since last snapshot %s", '\n'.join(self.memory.format_diff(since_previous)))
+            growth = [f"{name} {entry['count_diff']:+d}" for name, entry in since_start['census'].items()
+                      if entry['count_diff'] > 0][:5]
+            message = "Since baseline: " + (', '.join(growth) if growth else "no Qt objects added") + " (details in the log)"
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.showMessage("Clover Memory", message, QSystemTrayIcon.Information, 6000)
     
     def on_tray_icon_activated(self, reason):
         """Handle tray icon activation (clicks)."""
@@ -167,6 +391,22 @@ class DesktopMascot(QWidget):
                     2000
                 )
         
+    def create_sprite_widget(self, z=0):
+        """Create a free-floating sprite (bullet, meme image).
+        
+        In overlay mode this is an actor drawn by the overlay compositor;
+        otherwise it is its own frameless, translucent top-level QLabel.
+        """
+        if self.overlay_compositor:
+            return self.overlay_compositor.create_actor(z)
+        
+        sprite = QLabel()
+        sprite.setParent(None)  # Make it a top-level widget
+        sprite.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        sprite.setAttribute(Qt.WA_TranslucentBackground)
+        sprite.setStyleSheet("background: transparent;")
+        return sprite
+    
     def load_initial_animation(self):
         """Load the initial idle animation."""
         sitting_animations = self.animation_loader.get_animations_by_category('sitting')
@@ -189,18 +429,36 @@ class DesktopMascot(QWidget):
         self.current_frame = 0
         self.animation_loop = loop
         
-        # Update sprite size based on first frame
-        if animation['frames']:
-            first_frame = animation['frames'][0]
-            self.resize(first_frame.width(), first_frame.height())
-            self.sprite_label.resize(self.size())
-        
-        # Start animation timer
-        self.animation_timer.start(animation.get('frame_rate', 150))
-        self.update_sprite()
+        with trace.span('start_animation', 'animation', name=animation_name):
+            # Update sprite size based on first frame
+            if animation['frames']:
+                first_frame = animation['frames'][0]
+                self.resize(self.logical_size(first_frame))
+                self.sprite_label.resize(self.size())
+            
+            # Start animation timer
+            self.animation_timer.start(animation.get('frame_rate', 150))
+            self.update_sprite()
         
         # Idle timer functionality removed with idle mode
     
+    def play_timeline(self, timeline):
+        """Start a sequence timeline, cancelling the one that was playing."""
+        self.cancel_timeline()
+        # Sequences not started by an AFK behavior are charged as their own behavior
+        costs = self.runtime.metrics.behaviors
+        if costs.active == costs.IDLE:
+            costs.switch(f"sequence:{timeline.name}")
+        self.active_timeline = timeline
+        timeline.start()
+        return timeline
+    
+    def cancel_timeline(self):
+        """Cancel the playing sequence timeline, if any."""
+        if self.active_timeline:
+            self.active_timeline.cancel()
+            self.active_timeline = None
+    
     def stop_animation(self):
         """Stop the current animation."""
         if self.animation_timer.isActive():
@@ -224,36 +482,64 @@ class DesktopMascot(QWidget):
                 self.logic.on_animation_complete()
                 return
         
-        self.update_sprite()
+        self.update_sprite(frame_advanced=True)
     
-    def update_sprite(self):
-        """Update the displayed sprite."""
+    def update_sprite(self, frame_advanced=False):
+        """Update the displayed sprite.
+        
+        When frame_advanced is True the previous frame of the same animation is
+        on screen, so only the precomputed changed area is repainted.
+        """
         if not self.current_animation or not self.current_animation['frames']:
             return
             
         if self.current_frame < len(self.current_animation['frames']):
-            pixmap = self.current_animation['frames'][self.current_frame]
-            
-            # Apply size scaling
+            started = time.perf_counter()
+            # Get the frame scaled once for the current size and screen devicePixelRatio
             current_scale = config.get_setting('size', 'current_scale', 1.0)
-            if current_scale != 1.0:
-                scaled_size = pixmap.size() * current_scale
-                pixmap = pixmap.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap = self.animation_loader.get_scaled_frame(
+                self.current_animation, self.current_frame, current_scale, self.devicePixelRatioF())
+            dirty_rect = None
+            if frame_advanced:
+                dirty_rect = self.animation_loader.get_scaled_dirty_rect(
+                    self.current_animation, self.current_frame, current_scale)
             
             # If sleeping and using precomposed ZZZ frames, use them instead
-            if (self.is_sleeping and hasattr(self, 'zzz_composite_frames') and 
+            if (self.state.state is MascotState.SLEEPING and hasattr(self, 'zzz_composite_frames') and 
                 self.zzz_composite_frames and hasattr(self, 'zzz_current_frame') and
                 len(self.zzz_composite_frames) > 0):
                 # Use precomposed frame to avoid recompositing
                 pixmap = self.zzz_composite_frames[self.zzz_current_frame]
+                dirty_rect = None
             
-            self.sprite_label.setPixmap(pixmap)
+            self.sprite_label.setPixmap(pixmap, dirty_rect)
             
-            # Update widget and label size to match scaled sprite
-            sprite_size = pixmap.size()
+            # Update widget and label size to match scaled sprite (in logical pixels)
+            sprite_size = self.logical_size(pixmap)
             self.resize(sprite_size)
             self.sprite_label.resize(sprite_size)
             self.sprite_label.move(0, 0)  # Ensure label is positioned at top-left
+            self.sprite_updates += 1
+            self.sprite_update_time += time.perf_counter() - started
+    
+    def logical_size(self, pixmap):
+        """Get the size of a pixmap in logical (device independent) pixels."""
+        return pixmap.size() / pixmap.devicePixelRatio()
+    
+    def showEvent(self, event):
+        """Hook up screen change tracking once the native window exists."""
+        super().showEvent(event)
+        window = self.windowHandle()
+        if window and not getattr(self, 'screen_change_connected', False):
+            window.screenChanged.connect(self.on_screen_changed)
+            self.screen_change_connected = True
+    
+    def on_screen_changed(self, screen):
+        """Re-render the sprite when moving to a screen with a different devicePixelRatio."""
+        # Scaled frames are keyed by devicePixelRatio, so a redraw picks the right cache entry
+        if self.state.state is MascotState.SLEEPING and getattr(self, 'zzz_frames', None):
+            self.precomposite_zzz_frames()
+        self.update_sprite()
     
     def composite_zzz_overlay(self, base_pixmap, scale):
         """Composite ZZZ overlay on top of the base sprite."""
@@ -297,10 +583,10 @@ class DesktopMascot(QWidget):
     
     def follow_mouse(self):
         """Move mascot towards mouse cursor with proper walking/running animation."""
-        if not self.is_following_mouse:
+        if self.state.state is not MascotState.FOLLOWING_MOUSE:
             return
             
-        cursor_pos = QCursor.pos()
+        cursor_pos = self.snapshot.cursor_pos()
         mascot_pos = self.pos()
         
         # Calculate distance to cursor
@@ -311,18 +597,15 @@ class DesktopMascot(QWidget):
         # Stop if close enough and start dancing
         if distance < 50:
             # Start dancing for 10 seconds (10000 ms) regardless of current animation
+            # (leaving the follow state stops the follow timer)
             self.logic.start_timed_dance(10000)
-            # Disable mouse following while dancing
-            self.is_following_mouse = False
-            self.mouse_follow_timer.stop()
             # Reset running mode
             self.is_running_mode = False
             self.follow_start_time = None
             return
         
         # Check if we should switch to running mode (after 10 seconds) or super running mode (after 20 seconds)
-        import time
-        current_time = time.time()
+        current_time = self.clock.time()
         is_super_running = False
         if self.follow_start_time:
             elapsed_time = current_time - self.follow_start_time
@@ -334,67 +617,52 @@ class DesktopMascot(QWidget):
                 # Regular running mode after 10 seconds (double speed)
                 self.is_running_mode = True
             
-        # Determine primary direction and start appropriate animation
-        if abs(dx) > abs(dy):
-            # Horizontal movement is dominant
-            if dx > 0:
-                # Moving right
-                target_animation = 'walking_spr_pl_run_right' if self.is_running_mode else 'walking_spr_pl_right'
-                if self.current_animation_name != target_animation:
-                    self.start_animation(target_animation, loop=True)
-            else:
-                # Moving left
-                target_animation = 'walking_spr_pl_run_left' if self.is_running_mode else 'walking_spr_pl_left'
-                if self.current_animation_name != target_animation:
-                    self.start_animation(target_animation, loop=True)
-        else:
-            # Vertical movement is dominant
-            if dy > 0:
-                # Moving down
-                target_animation = 'walking_spr_pl_run_down' if self.is_running_mode else 'walking_spr_pl_down'
-                if self.current_animation_name != target_animation:
-                    self.start_animation(target_animation, loop=True)
-            else:
-                # Moving up
-                target_animation = 'walking_spr_pl_run_up' if self.is_running_mode else 'walking_spr_pl_up'
-                if self.current_animation_name != target_animation:
-                    self.start_animation(target_animation, loop=True)
-        
-        # Move towards cursor with appropriate speed
+        # Move towards cursor with appropriate speed (pixels per second)
         if is_super_running:
-            speed = 24  # Quadruple speed for super running mode
+            speed = 480  # Quadruple speed for super running mode
         elif self.is_running_mode:
-            speed = 12  # Double speed for regular running mode
+            speed = 240  # Double speed for regular running mode
         else:
-            speed = 6   # Normal walking speed
-        if distance > 0:
-            move_x = int(dx / distance * speed)
-            move_y = int(dy / distance * speed)
-            self.move(mascot_pos.x() + move_x, mascot_pos.y() + move_y)
+            speed = 120  # Normal walking speed
+        
+        # Steer with the pursuit controller, scaling the step by the real time since the last tick
+        now = self.clock.perf_counter()
+        dt = min(0.25, now - self.follow_last_tick) if self.follow_last_tick is not None else self.pursuit.min_interval / 1000
+        self.follow_last_tick = now
+        cursor_vx, cursor_vy = self.snapshot.cursor_velocity()
+        new_x, new_y, direction, interval = self.pursuit.step(
+            mascot_pos.x(), mascot_pos.y(), cursor_pos.x(), cursor_pos.y(), cursor_vx, cursor_vy, speed, dt)
+        
+        # Walking/running animation facing the (sticky) direction
+        if direction:
+            target_animation = f'walking_spr_pl_run_{direction}' if self.is_running_mode else f'walking_spr_pl_{direction}'
+            if self.current_animation_name != target_animation:
+                self.start_animation(target_animation, loop=True)
+        
+        self.move(new_x, new_y)
+        self.mouse_follow_timer.start(interval)
     
     def set_follow_mouse(self, follow):
         """Enable or disable mouse following."""
         self.logic.on_user_interaction()  # User interaction
-        self.is_following_mouse = follow
         if follow:
-            # Stop random walking when following mouse
-            self.logic.stop_random_walking_system()
+            if not self.state.transition(MascotState.FOLLOWING_MOUSE):
+                return
             # Initialize timing for running mode
-            import time
-            self.follow_start_time = time.time()
+            self.follow_start_time = self.clock.time()
             self.is_running_mode = False
-            self.mouse_follow_timer.start(50)  # Update every 50ms
+            self.pursuit.reset()
+            self.follow_last_tick = None
+            self.mouse_follow_timer.start(self.pursuit.min_interval)
             self.idle_timer.stop()
             # Animation will be handled by follow_mouse() based on direction
         else:
-            self.mouse_follow_timer.stop()
+            self.state.leave(MascotState.FOLLOWING_MOUSE)
             # Reset running mode variables
             self.is_running_mode = False
             self.follow_start_time = None
             # Restart random walking if no other special modes are active
-            if (self.logic.random_walking_enabled and 
-                not self.logic.eternal_dance_mode and not self.logic.timed_dance_mode and 
-                not self.is_sleeping and not getattr(self, 'is_falling', False)):
+            if self.logic.random_walking_enabled and not self.state.is_busy():
                 self.logic.start_random_walking_system()
             # Stop walking/running animation when disabling mouse following
             if self.current_animation_name and self.current_animation_name.startswith('walking_'):
@@ -406,15 +674,14 @@ class DesktopMascot(QWidget):
         """Enable or disable sleep mode."""
         if not auto_stop:
             self.logic.on_user_interaction()  # User interaction
-        self.is_sleeping = sleep
         if sleep:
-            # Stop random walking when sleeping
-            self.logic.stop_random_walking_system()
+            if not self.state.transition(MascotState.SLEEPING):
+                return
             self.idle_timer.stop()
-            self.mouse_follow_timer.stop()
             # Load and display only the specific sleep sprite
             self.start_sleep_animation()
         else:
+            self.state.leave(MascotState.SLEEPING)
             # Automatically trigger Return to AFK when sleep mode is deactivated
             self.return_to_afk_mode()
     
@@ -422,19 +689,16 @@ class DesktopMascot(QWidget):
         """Enable or disable fall mode."""
         if not auto_stop:
             self.logic.on_user_interaction()  # User interaction
-        self.is_falling = fall
         if fall:
-            # Stop random walking when falling
-            self.logic.stop_random_walking_system()
+            if not self.state.transition(MascotState.FALLING):
+                return
             self.idle_timer.stop()
-            self.mouse_follow_timer.stop()
             # Start the fall animation
             self.start_fall_animation()
         else:
+            self.state.leave(MascotState.FALLING)
             # Restart random walking if no other special modes are active
-            if (self.logic.random_walking_enabled and 
-                not self.logic.eternal_dance_mode and not self.logic.timed_dance_mode and 
-                not self.is_sleeping and not self.is_following_mouse):
+            if self.logic.random_walking_enabled and not self.state.is_busy():
                 self.logic.start_random_walking_system()
             self.logic.return_to_idle()
     
@@ -442,28 +706,14 @@ class DesktopMascot(QWidget):
         """Return to AFK mode by disabling all special modes and enabling random walking."""
         self.logic.on_user_interaction()  # User interaction
         
-        # Disable all special modes
-        self.is_following_mouse = False
-        self.is_sleeping = False
-        if hasattr(self, 'is_falling'):
-            self.is_falling = False
-        if hasattr(self, 'is_character_interaction'):
-            self.is_character_interaction = False
+        # Disable all special modes (and their timers)
+        self.state.reset_mode()
         
         # Stop all timers
         self.idle_timer.stop()
-        self.mouse_follow_timer.stop()
         if hasattr(self.logic, 'walking_movement_timer'):
             self.logic.walking_movement_timer.stop()
         
-        # Stop any dance modes
-        if self.logic.eternal_dance_mode:
-            self.logic.eternal_dance_mode = False
-        if self.logic.timed_dance_mode:
-            self.logic.timed_dance_mode = False
-            if hasattr(self.logic, 'timed_dance_timer'):
-                self.logic.timed_dance_timer.stop()
-        
         # Stop ZZZ animation if running
         self.stop_zzz_animation()
         
@@ -485,7 +735,7 @@ class DesktopMascot(QWidget):
             # Use the first fall animation available
             self.start_animation(fall_animations[0], loop=True)
         else:
-            print("Warning: No fall animations found in falls category")
+            log.warning('animation', "No fall animations found in falls category")
      
     def start_sleep_animation(self):
         """Start the sleep animation with Clover on bed and ZZZ overlay."""
@@ -606,7 +856,7 @@ class DesktopMascot(QWidget):
         self.zzz_current_frame = 0
         
         if not self.zzz_frames:
-            print("Warning: No ZZZ sprites found for sleep animation")
+            log.warning('animation', "No ZZZ sprites found for sleep animation")
         else:
             # Precomposite all ZZZ frames with the current sleep scene to avoid visual loading
             self.precomposite_zzz_frames()
@@ -616,52 +866,59 @@ class DesktopMascot(QWidget):
         if not hasattr(self, 'current_animation') or not self.current_animation or not self.current_animation['frames']:
             return
             
-        # Get the base sleep sprite
-        base_pixmap = self.current_animation['frames'][0]
+        # Get the base sleep sprite, scaled once for the current size and screen devicePixelRatio
         current_scale = config.get_setting('size', 'current_scale', 1.0)
+        device_pixel_ratio = self.devicePixelRatioF()
+        base_pixmap = self.animation_loader.get_scaled_frame(
+            self.current_animation, 0, current_scale, device_pixel_ratio)
         
-        # Apply scaling to base sprite
-        if current_scale != 1.0:
-            scaled_size = base_pixmap.size() * current_scale
-            base_pixmap = base_pixmap.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Wrap the ZZZ sprites so they share the loader's scaled-frame cache
+        if getattr(self, 'zzz_animation', None) is None or self.zzz_animation['frames'] is not self.zzz_frames:
+            self.zzz_animation = {'frames': self.zzz_frames}
         
         # Clear previous composite frames
         self.zzz_composite_frames = []
         
         # Create composite frames for each ZZZ sprite
-        for i, zzz_pixmap in enumerate(self.zzz_frames):
+        for i in range(len(self.zzz_frames)):
+            zzz_pixmap = self.animation_loader.get_scaled_frame(
+                self.zzz_animation, i, current_scale, device_pixel_ratio)
             composite_frame = self.create_zzz_composite(base_pixmap, zzz_pixmap, i, current_scale)
             self.zzz_composite_frames.append(composite_frame)
     
     def create_zzz_composite(self, base_pixmap, zzz_pixmap, frame_index, scale):
-        """Create a single composite frame with ZZZ overlay."""
+        """Create a single composite frame with ZZZ overlay.
+        
+        Both pixmaps are expected to be pre-scaled (see AnimationLoader.get_scaled_frame),
+        so the composite is built directly at physical resolution.
+        """
         from PyQt5.QtGui import QPainter
         
-        # Scale ZZZ sprite if needed
-        if scale != 1.0:
-            zzz_scaled_size = zzz_pixmap.size() * scale
-            zzz_pixmap = zzz_pixmap.scaled(zzz_scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        device_pixel_ratio = base_pixmap.devicePixelRatio()
+        base_size = self.logical_size(base_pixmap)
+        zzz_size = self.logical_size(zzz_pixmap)
         
         # Calculate progressive height offset for each ZZZ frame (0, 1, 2)
         height_offset = frame_index * int(10 * scale)  # Progressive height increase
         
         # Create a larger canvas to accommodate ZZZ sprites above the mascot
         zzz_space = int(60 * scale)  # Extra space above for ZZZ animation
-        canvas_width = max(base_pixmap.width(), zzz_pixmap.width())
-        canvas_height = base_pixmap.height() + zzz_space
+        canvas_width = max(base_size.width(), zzz_size.width())
+        canvas_height = base_size.height() + zzz_space
         
-        result_pixmap = QPixmap(canvas_width, canvas_height)
+        result_pixmap = QPixmap(int(canvas_width * device_pixel_ratio), int(canvas_height * device_pixel_ratio))
+        result_pixmap.setDevicePixelRatio(device_pixel_ratio)
         result_pixmap.fill(Qt.transparent)
         
-        # Draw the base sprite at the bottom of the canvas
+        # Draw the base sprite at the bottom of the canvas (painter works in logical pixels)
         painter = QPainter(result_pixmap)
-        base_x = (canvas_width - base_pixmap.width()) // 2
+        base_x = (canvas_width - base_size.width()) // 2
         base_y = zzz_space  # Position base sprite below ZZZ space
         painter.drawPixmap(base_x, base_y, base_pixmap)
         
         # Position ZZZ above Clover's head with progressive height
-        zzz_x = (canvas_width - zzz_pixmap.width()) // 2
-        zzz_y = zzz_space - zzz_pixmap.height() - int(5 * scale) - height_offset
+        zzz_x = (canvas_width - zzz_size.width()) // 2
+        zzz_y = zzz_space - zzz_size.height() - int(5 * scale) - height_offset
         
         # Draw the ZZZ overlay
         painter.drawPixmap(zzz_x, zzz_y, zzz_pixmap)
@@ -672,8 +929,6 @@ class DesktopMascot(QWidget):
     def start_zzz_animation(self):
         """Start the ZZZ overlay animation using precomposed frames."""
         if hasattr(self, 'zzz_composite_frames') and self.zzz_composite_frames:
-            self.zzz_timer = QTimer()
-            self.zzz_timer.timeout.connect(self.next_zzz_frame)
             self.zzz_timer.start(800)  # Slower animation to make it less jarring
     
     def next_zzz_frame(self):
@@ -683,27 +938,24 @@ class DesktopMascot(QWidget):
             # Directly set the precomposed frame to avoid recompositing
             self.sprite_label.setPixmap(self.zzz_composite_frames[self.zzz_current_frame])
             # Update widget size to match the composite frame
-            frame_size = self.zzz_composite_frames[self.zzz_current_frame].size()
+            frame_size = self.logical_size(self.zzz_composite_frames[self.zzz_current_frame])
             self.resize(frame_size)
             self.sprite_label.resize(frame_size)
             self.sprite_label.move(0, 0)
     
     def stop_zzz_animation(self):
         """Stop the ZZZ overlay animation and clean up properly."""
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
-            # Clear ZZZ-related attributes to prevent separate sprite loading
-            if hasattr(self, 'zzz_composite_frames'):
-                self.zzz_composite_frames = []
-            if hasattr(self, 'zzz_frames'):
-                self.zzz_frames = []
-            self.zzz_current_frame = 0
-            # Simply update the sprite without reloading animation to avoid separate loading
-            self.update_sprite()
+        self.zzz_timer.stop()
+        # Clear ZZZ-related attributes to prevent separate sprite loading
+        self.zzz_composite_frames = []
+        self.zzz_frames = []
+        self.zzz_current_frame = 0
+        # Simply update the sprite without reloading animation to avoid separate loading
+        self.update_sprite()
     
     def force_dance(self):
         """Toggle eternal dance mode."""
-        if self.logic.eternal_dance_mode:
+        if self.state.state is MascotState.ETERNAL_DANCE:
             # Stop eternal dance
             self.logic.stop_eternal_dance()
         else:
@@ -728,17 +980,25 @@ class DesktopMascot(QWidget):
         except (ValueError, IndexError):
             return 'Custom'
     
+    def moveEvent(self, event):
+        """Proximity zones are relative to the mascot, so they change when it moves too."""
+        super().moveEvent(event)
+        if hasattr(self, 'event_handler'):
+            self.event_handler.update_zones()
+        if getattr(self, 'hud', None) and self.hud.is_active():
+            self.hud.follow()
+    
     def mousePressEvent(self, event):
         """Handle mouse press events."""
         if event.button() == Qt.LeftButton:
             # Check if we're in hide and seek waiting phase
-            if hasattr(self, 'in_hide_seek_sequence') and self.in_hide_seek_sequence and hasattr(self, 'hide_seek_phase') and self.hide_seek_phase == 'waiting':
-                print("Hide&Seek: Clover was clicked - Found!")
+            if self.state.state is MascotState.HIDE_SEEK and self.hide_seek_phase == 'waiting':
+                log.info('hide_seek', "Clover was clicked - Found!")
                 self.on_clover_found()
                 return
             
             # Don't call on_user_interaction for dragging to preserve eternal dance
-            self.is_dragging = True
+            self.state.set_dragging(True)
             self.drag_start_position = event.globalPos() - self.frameGeometry().topLeft()
         elif event.button() == Qt.RightButton:
             # Don't call on_user_interaction for right-click to preserve eternal dance
@@ -746,20 +1006,20 @@ class DesktopMascot(QWidget):
     
     def mouseMoveEvent(self, event):
         """Handle mouse move events for dragging."""
-        if self.is_dragging and event.buttons() == Qt.LeftButton:
+        if self.state.dragging and event.buttons() == Qt.LeftButton:
             self.move(event.globalPos() - self.drag_start_position)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events."""
         if event.button() == Qt.LeftButton:
-            self.is_dragging = False
+            self.state.set_dragging(False)
     
     def show_context_menu(self, position):
         """Show the right-click context menu."""
         menu = QMenu(self)
         
         # Dance action (toggle eternal dance)
-        dance_text = "Stop Dancing" if self.logic.eternal_dance_mode else "Dance Forever"
+        dance_text = "Stop Dancing" if self.state.state is MascotState.ETERNAL_DANCE else "Dance Forever"
         dance_action = QAction(dance_text, self)
         dance_action.triggered.connect(self.force_dance)
         menu.addAction(dance_action)
@@ -767,8 +1027,9 @@ class DesktopMascot(QWidget):
         # Follow mouse action
         follow_action = QAction("Follow Mouse", self)
         follow_action.setCheckable(True)
-        follow_action.setChecked(self.is_following_mouse)
-        follow_action.triggered.connect(lambda: self.set_follow_mouse(not self.is_following_mouse))
+        is_following_mouse = self.state.state is MascotState.FOLLOWING_MOUSE
+        follow_action.setChecked(is_following_mouse)
+        follow_action.triggered.connect(lambda: self.set_follow_mouse(not is_following_mouse))
         menu.addAction(follow_action)
         
         # Sit submenu
@@ -799,15 +1060,17 @@ class DesktopMascot(QWidget):
         # Sleep action
         sleep_action = QAction("Sleep", self)
         sleep_action.setCheckable(True)
-        sleep_action.setChecked(self.is_sleeping)
-        sleep_action.triggered.connect(lambda: self.set_sleep_mode(not self.is_sleeping))
+        is_sleeping = self.state.state is MascotState.SLEEPING
+        sleep_action.setChecked(is_sleeping)
+        sleep_action.triggered.connect(lambda: self.set_sleep_mode(not is_sleeping))
         menu.addAction(sleep_action)
         
         # Fall action
         fall_action = QAction("Fall", self)
         fall_action.setCheckable(True)
-        fall_action.setChecked(getattr(self, 'is_falling', False))
-        fall_action.triggered.connect(lambda: self.set_fall_mode(not getattr(self, 'is_falling', False)))
+        is_falling = self.state.state is MascotState.FALLING
+        fall_action.setChecked(is_falling)
+        fall_action.triggered.connect(lambda: self.set_fall_mode(not is_falling))
         menu.addAction(fall_action)
         
         # AFK mode toggle action
@@ -898,7 +1161,7 @@ class DesktopMascot(QWidget):
     
     def show_afk_settings(self):
         """Show the AFK behavior settings dialog."""
-        dialog = AFKBehaviorSettingsDialog(self)
+        dialog = AFKBehaviorSettingsDialog(self, self.runtime.metrics.behaviors.snapshot())
         dialog.exec_()
     
     def toggle_afk_mode(self):
@@ -908,24 +1171,26 @@ class DesktopMascot(QWidget):
         config.update_setting('afk_behavior', 'afk_mode_enabled', new_state)
         
         if new_state:
-            print("AFK mode enabled")
+            log.info('afk', "AFK mode enabled")
             # Restart AFK behaviors if enabled
             self.return_to_afk_mode()
         else:
-            print("AFK mode disabled")
-            # Stop current AFK behaviors
+            log.info('afk', "AFK mode disabled")
+            # Stop current AFK behaviors and their pending follow-ups
             self.logic.random_walking_timer.stop()
+            self.logic.cancel_behavior_tasks()
     
     def disable_afk_mode_temporarily(self):
         """Temporarily disable AFK mode when an action starts."""
         config.update_setting('afk_behavior', 'afk_mode_enabled', False)
         self.logic.random_walking_timer.stop()
-        print("AFK mode temporarily disabled")
+        self.logic.cancel_behavior_tasks()
+        log.info('afk', "AFK mode temporarily disabled")
     
     def re_enable_afk_mode(self):
         """Re-enable AFK mode when an action ends."""
         config.update_setting('afk_behavior', 'afk_mode_enabled', True)
-        print("AFK mode re-enabled")
+        log.info('afk', "AFK mode re-enabled")
         # Restart AFK behaviors
         self.return_to_afk_mode()
     
@@ -935,25 +1200,12 @@ class DesktopMascot(QWidget):
         
         # Stop any current timers and movements
         self.idle_timer.stop()
-        self.mouse_follow_timer.stop()
-        if hasattr(self.logic, 'walking_movement_timer'):
-            self.logic.walking_movement_timer.stop()
         
         # Stop random walking
         self.logic.stop_random_walking_system()
         
-        # Reset states
-        self.is_following_mouse = False
-        self.is_sleeping = False
-        if hasattr(self, 'is_falling'):
-            self.is_falling = False
-        
-        # Stop any special modes
-        if self.logic.eternal_dance_mode:
-            self.logic.eternal_dance_mode = False
-        if self.logic.timed_dance_mode:
-            self.logic.timed_dance_mode = False
-            self.logic.timed_dance_timer.stop()
+        # Stop any special modes (and their timers)
+        self.state.reset_mode()
         
         # Start the requested sitting animation
         sitting_animations = self.animation_loader.get_animations_by_category('sitting')
@@ -974,32 +1226,30 @@ class DesktopMascot(QWidget):
     def start_character_interaction(self, animation_name):
         """Start a character interaction animation."""
         self.logic.on_user_interaction()  # User interaction
-        self.is_character_interaction = True
-        # Stop random walking during character interactions
-        self.logic.stop_random_walking_system()
+        # Random walking stops when the interaction state is entered
+        if not self.state.transition(MascotState.CHARACTER_INTERACTION):
+            return
         self.idle_timer.stop()  # Stop any running idle timer
         self.start_animation(animation_name, loop=False)
     
     def start_cart_movement(self):
         """Start cart animation with left-to-right movement across screen."""
+        if not self.state.can_enter(MascotState.RIDING):
+            return
+        
         # Register as user interaction to prevent interruptions
         self.logic.on_user_interaction()
         
         # Stop all timers and set interaction state
         self.idle_timer.stop()
         self.animation_timer.stop()
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
-        
-        self.is_character_interaction = True
+        self.state.transition(MascotState.RIDING)
         
         # Clear any previously moved windows
         self.moved_windows = {}
         
         # Get screen dimensions
-        from PyQt5.QtWidgets import QDesktopWidget
-        desktop = QDesktopWidget()
-        screen_rect = desktop.screenGeometry()
+        screen_rect = self.snapshot.screen_geometry()
         
         # Set starting position (left side of screen)
         self.move(-self.width(), self.y())
@@ -1009,71 +1259,52 @@ class DesktopMascot(QWidget):
         if cart_animations:
             self.start_animation(cart_animations[0], loop=True)
         
-        # Set up movement timer
-        self.cart_movement_timer = QTimer()
-        self.cart_movement_timer.timeout.connect(self.update_cart_position)
-        
-        # Movement parameters
-        self.cart_target_x = screen_rect.width() + self.width()  # End position (right side)
-        self.cart_start_x = -self.width()  # Start position (left side)
-        self.cart_current_x = self.cart_start_x
-        self.cart_speed = 3  # pixels per update
-        
-        # Start movement
-        self.cart_movement_timer.start(16)  # ~60 FPS
-    
-    def update_cart_position(self):
-        """Update cart position during movement animation."""
-        self.cart_current_x += self.cart_speed
-        self.move(int(self.cart_current_x), self.y())
-        
-        # Check for windows in path and push them
-        self.push_windows_in_cart_path()
-        
-        # Check if cart has moved off screen
-        if self.cart_current_x >= self.cart_target_x:
-            # Stop movement and restore moved windows
-            self.cart_movement_timer.stop()
+        # Ride to the right side of the screen at 3 pixels per frame (~60 FPS), pushing windows aside
+        timeline = Timeline(self, 'cart')
+        timeline.move_to((screen_rect.width() + self.width(), self.y()), speed=3, tick_ms=16,
+                         clamp_to_screen=False, on_tick=self.push_windows_in_cart_path)
+        timeline.on_finished = self.end_ride
+        self.play_timeline(timeline)
+    
+    def end_ride(self, restore_windows=True):
+        """Finish a cart, meme cart or whale mail ride and resume normal behavior."""
+        # Restore moved windows
+        if restore_windows:
             self.restore_moved_windows()
-            self.is_character_interaction = False
-            
-            # Return to center of screen and resume normal behavior
-            from PyQt5.QtWidgets import QDesktopWidget
-            desktop = QDesktopWidget()
-            screen_rect = desktop.screenGeometry()
-            center_x = (screen_rect.width() - self.width()) // 2
-            center_y = (screen_rect.height() - self.height()) // 2
-            self.move(center_x, center_y)
-            
-            # Return to idle animation
-            sitting_animations = self.animation_loader.get_animations_by_category('sitting')
-            if sitting_animations:
-                self.start_animation(sitting_animations[0])
-            
-            # Resume AFK behaviors after cart ride completes
-            import random
-            self.logic.random_walking_timer.start(random.randint(3000, 8000))
+        self.state.leave(MascotState.RIDING)
+        
+        # Return to center of screen and resume normal behavior
+        screen_rect = self.snapshot.screen_geometry()
+        center_x = (screen_rect.width() - self.width()) // 2
+        center_y = (screen_rect.height() - self.height()) // 2
+        self.move(center_x, center_y)
+        
+        # Return to idle animation
+        sitting_animations = self.animation_loader.get_animations_by_category('sitting')
+        if sitting_animations:
+            self.start_animation(sitting_animations[0])
+        
+        # Resume AFK behaviors after the ride completes
+        self.logic.random_walking_timer.start(self.random.randint(3000, 8000))
     
     def start_meme_cart_movement(self):
         """Start meme cart animation with left-to-right movement and random meme display."""
+        if not self.state.can_enter(MascotState.RIDING):
+            return
+        
         # Register as user interaction to prevent interruptions
         self.logic.on_user_interaction()
         
         # Stop all timers and set interaction state
         self.idle_timer.stop()
         self.animation_timer.stop()
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
-        
-        self.is_character_interaction = True
+        self.state.transition(MascotState.RIDING)
         
         # Clear any previously moved windows
         self.moved_windows = {}
         
         # Get screen dimensions
-        from PyQt5.QtWidgets import QDesktopWidget
-        desktop = QDesktopWidget()
-        screen_rect = desktop.screenGeometry()
+        screen_rect = self.snapshot.screen_geometry()
         
         # Set starting position (left side of screen)
         self.move(-self.width(), self.y())
@@ -1086,88 +1317,52 @@ class DesktopMascot(QWidget):
         # Fetch and display random meme
         self.fetch_and_display_meme()
         
-        # Set up movement timer
-        self.meme_cart_movement_timer = QTimer()
-        self.meme_cart_movement_timer.timeout.connect(self.update_meme_cart_position)
-        
         # Movement parameters
         self.meme_cart_target_x = screen_rect.width() + self.width()  # End position (right side)
         self.meme_cart_start_x = -self.width()  # Start position (left side)
-        self.meme_cart_current_x = self.meme_cart_start_x
-        self.meme_cart_speed = 3  # pixels per update
-        
-        # Start movement
-        self.meme_cart_movement_timer.start(16)  # ~60 FPS
-    
-    def update_meme_cart_position(self):
-        """Update meme cart position during movement animation."""
-        self.meme_cart_current_x += self.meme_cart_speed
-        self.move(int(self.meme_cart_current_x), self.y())
-        
+        self.meme_released = False
+        
+        # Ride to the right side of the screen at 3 pixels per frame (~60 FPS)
+        timeline = Timeline(self, 'meme_cart')
+        timeline.move_to((self.meme_cart_target_x, self.y()), speed=3, tick_ms=16,
+                         clamp_to_screen=False, on_tick=self.update_meme_cart_meme)
+        # Windows are not pushed by the meme cart, so there is nothing to restore
+        timeline.on_finished = lambda: self.end_ride(restore_windows=False)
+        self.play_timeline(timeline)
+    
+    def update_meme_cart_meme(self):
+        """Carry the meme under the cart and release it at the halfway point."""
         # Check if we've reached halfway point to release meme
         halfway_point = (self.meme_cart_start_x + self.meme_cart_target_x) / 2
-        if not hasattr(self, 'meme_released') and self.meme_cart_current_x >= halfway_point:
+        if not self.meme_released and self.x() >= halfway_point:
             # Release meme in center of screen at halfway point
             self.release_meme_in_center()
             self.meme_released = True
         
         # Update meme position to follow cart only if not yet released
-        if self.meme_image_label and not hasattr(self, 'meme_released'):
-            meme_x = int(self.meme_cart_current_x) - 50  # Position meme to the left of cart
+        if self.meme_image_label and not self.meme_released:
+            meme_x = self.x() - 50  # Position meme to the left of cart
             meme_y = self.y() + self.height()  # Position meme below the mascot (hooked from below)
             self.meme_image_label.move(meme_x, meme_y)
-        
-        # Check for windows in path and push them
-        #self.push_windows_in_cart_path()
-        
-        # Check if cart has moved off screen
-        if self.meme_cart_current_x >= self.meme_cart_target_x:
-            # Stop movement and restore moved windows
-            self.meme_cart_movement_timer.stop()
-            #self.restore_moved_windows()
-            self.is_character_interaction = False
-            
-            # Reset meme release flag for next time
-            if hasattr(self, 'meme_released'):
-                delattr(self, 'meme_released')
-            
-            # Return to center of screen and resume normal behavior
-            from PyQt5.QtWidgets import QDesktopWidget
-            desktop = QDesktopWidget()
-            screen_rect = desktop.screenGeometry()
-            center_x = (screen_rect.width() - self.width()) // 2
-            center_y = (screen_rect.height() - self.height()) // 2
-            self.move(center_x, center_y)
-            
-            # Return to idle animation
-            sitting_animations = self.animation_loader.get_animations_by_category('sitting')
-            if sitting_animations:
-                self.start_animation(sitting_animations[0])
-            
-            # Resume AFK behaviors after meme cart ride completes
-            import random
-            self.logic.random_walking_timer.start(random.randint(3000, 8000))
     
     def start_whale_mail_movement(self):
         """Start whale mail animation with bottom-to-top movement across screen."""
+        if not self.state.can_enter(MascotState.RIDING):
+            return
+        
         # Register as user interaction to prevent interruptions
         self.logic.on_user_interaction()
         
         # Stop all timers and set interaction state
         self.idle_timer.stop()
         self.animation_timer.stop()
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
-        
-        self.is_character_interaction = True
+        self.state.transition(MascotState.RIDING)
         
         # Clear any previously moved windows
         self.moved_windows = {}
         
         # Get screen dimensions
-        from PyQt5.QtWidgets import QDesktopWidget
-        desktop = QDesktopWidget()
-        screen_rect = desktop.screenGeometry()
+        screen_rect = self.snapshot.screen_geometry()
         
         # Set starting position (bottom of screen)
         self.move(self.x(), screen_rect.height())
@@ -1177,53 +1372,18 @@ class DesktopMascot(QWidget):
         if basket_animations:
             self.start_animation(basket_animations[0], loop=True)
         
-        # Set up movement timer
-        self.whale_movement_timer = QTimer()
-        self.whale_movement_timer.timeout.connect(self.update_whale_position)
-        
-        # Movement parameters
-        self.whale_target_y = -self.height()  # End position (top of screen)
-        self.whale_start_y = screen_rect.height()  # Start position (bottom of screen)
-        self.whale_current_y = self.whale_start_y
-        self.whale_speed = 2  # pixels per update (slower than cart for more graceful movement)
-        
-        # Start movement
-        self.whale_movement_timer.start(16)  # ~60 FPS
-    
-    def update_whale_position(self):
-        """Update whale position during movement animation."""
-        self.whale_current_y -= self.whale_speed
-        self.move(self.x(), int(self.whale_current_y))
-        
-        # Check for windows in path and push them
-        self.push_windows_in_path()
-        
-        # Check if whale has moved off screen
-        if self.whale_current_y <= self.whale_target_y:
-            # Stop movement and restore moved windows
-            self.whale_movement_timer.stop()
-            self.restore_moved_windows()
-            self.is_character_interaction = False
-            
-            # Return to center of screen and resume normal behavior
-            from PyQt5.QtWidgets import QDesktopWidget
-            desktop = QDesktopWidget()
-            screen_rect = desktop.screenGeometry()
-            center_x = (screen_rect.width() - self.width()) // 2
-            center_y = (screen_rect.height() - self.height()) // 2
-            self.move(center_x, center_y)
-            
-            # Return to idle animation
-            sitting_animations = self.animation_loader.get_animations_by_category('sitting')
-            if sitting_animations:
-                self.start_animation(sitting_animations[0])
-            
-            # Resume AFK behaviors after whale mail completes
-            import random
-            self.logic.random_walking_timer.start(random.randint(3000, 8000))
+        # Float up to the top of the screen at 2 pixels per frame (slower than the cart, more graceful)
+        timeline = Timeline(self, 'whale_mail')
+        timeline.move_to((self.x(), -self.height()), speed=2, tick_ms=16,
+                         clamp_to_screen=False, on_tick=self.push_windows_in_path)
+        timeline.on_finished = self.end_ride
+        self.play_timeline(timeline)
     
     def start_hide_and_seek_sequence(self):
         """Start the Hide and Seek minigame sequence."""
+        if not self.state.can_enter(MascotState.HIDE_SEEK):
+            return
+        
         # Register as user interaction to prevent interruptions
         self.logic.on_user_interaction()
         
@@ -1232,49 +1392,42 @@ class DesktopMascot(QWidget):
         
         # Automatically reset character size to normal to prevent movement bugs
         self.change_size(1.0)
-        print("Hide&Seek: Character size reset to normal to prevent movement bugs")
+        log.debug('hide_seek', "Character size reset to normal to prevent movement bugs")
         
         # Stop all timers and set interaction state
         self.idle_timer.stop()
         self.animation_timer.stop()
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
         
-        self.is_character_interaction = True
-        self.in_hide_seek_sequence = False  # Initialize flag
+        self.state.transition(MascotState.HIDE_SEEK)
         self.hide_seek_phase = 'grab'  # Track current phase: grab, move_to_taskbar, hide, waiting, found
         
         # Start with Edward grabbing Clover
         self.start_hide_seek_grab_phase()
     
     def start_hide_seek_grab_phase(self):
-        """Phase 1: Edward grabs Clover."""
-        self.in_hide_seek_sequence = True
+        """Phases 1-3: Edward grabs Clover, carries him to the taskbar and drops him."""
         self.hide_seek_phase = 'grab'
         
-        # Start grab animation
-        grab_animation = 'edward_walking_spr_ed_grab_clover'
-        if self.animation_loader.animation_exists(grab_animation):
-            self.start_animation(grab_animation, loop=False)
-            
-            # Calculate duration and move to next phase
-            animation_info = self.animation_loader.get_animation_info(grab_animation)
-            if animation_info:
-                duration = animation_info['frame_count'] * animation_info['frame_rate'] + 500
-            else:
-                duration = 2000
-            
-            QTimer.singleShot(int(duration), self.start_hide_seek_move_phase)
-        else:
-            print(f"Animation not found: {grab_animation}")
-            self.start_hide_seek_move_phase()
+        timeline = Timeline(self, 'hide_and_seek')
+        # Phase 1: Edward grabs Clover (short pause after grabbing)
+        timeline.animation('edward_walking_spr_ed_grab_clover', extra_ms=500)
+        # Phase 2: Edward walks to the Windows taskbar with Clover
+        timeline.call(self.start_hide_seek_move_phase)
+        timeline.move_to(self.get_hide_seek_target, speed=10, tick_ms=50, arrive_within=30,
+                         on_tick=self.update_hide_seek_walking_animation, label='walk_to_taskbar')
+        # Phase 3: Edward drops Clover (longer pause for the place animation to complete)
+        timeline.call(self.start_hide_seek_drop_phase)
+        timeline.animation('edward_walking_spr_ed_place_clover', extra_ms=800)
+        # Phase 4: Clover hides
+        timeline.on_finished = self.start_hide_seek_hide_phase
+        self.play_timeline(timeline)
     
     def start_hide_seek_move_phase(self):
         """Phase 2: Edward moves to Windows taskbar with Clover."""
         self.hide_seek_phase = 'move_to_taskbar'
         
         # Get screen dimensions and taskbar position (bottom of screen)
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         taskbar_x = screen.width() // 2  # Center of taskbar
         taskbar_y = screen.height() - 50  # Near bottom of screen
         
@@ -1284,7 +1437,10 @@ class DesktopMascot(QWidget):
         
         # Determine initial direction and start appropriate walking animation
         self.update_hide_seek_walking_animation()
-        self.start_hide_seek_movement()
+    
+    def get_hide_seek_target(self):
+        """Get the point Edward walks to during the move phase."""
+        return (self.hide_seek_target_x, self.hide_seek_target_y)
     
     def update_hide_seek_walking_animation(self):
         """Update Edward's walking animation based on movement direction."""
@@ -1317,81 +1473,22 @@ class DesktopMascot(QWidget):
         if (self.animation_loader.animation_exists(walk_animation) and 
             self.current_animation_name != walk_animation):
             self.start_animation(walk_animation, loop=True)
-            print(f"Hide&Seek: Switching to {walk_animation} animation")
+            log.debug('hide_seek', "Switching to %s animation", walk_animation)
         elif not self.animation_loader.animation_exists(walk_animation):
-            print(f"Hide&Seek: Animation not found: {walk_animation}, using fallback")
+            log.warning('hide_seek', "Animation not found: %s, using fallback", walk_animation)
             # Fallback to down animation
             fallback_animation = 'edward_walking_spr_ed_down_walk_clover'
             if self.animation_loader.animation_exists(fallback_animation):
                 self.start_animation(fallback_animation, loop=True)
     
-    def start_hide_seek_movement(self):
-        """Move Edward towards the taskbar."""
-        if not hasattr(self, 'hide_seek_movement_timer'):
-            self.hide_seek_movement_timer = QTimer()
-            self.hide_seek_movement_timer.timeout.connect(self.update_hide_seek_position)
-        
-        self.hide_seek_movement_timer.start(50)  # Update every 50ms
-    
-    def update_hide_seek_position(self):
-        """Update Edward's position during movement to taskbar."""
-        current_x = self.x()
-        current_y = self.y()
-        
-        # Calculate direction and distance
-        dx = self.hide_seek_target_x - current_x
-        dy = self.hide_seek_target_y - current_y
-        distance = (dx**2 + dy**2)**0.5
-        
-        print(f"Hide&Seek Movement: Current({current_x}, {current_y}), Target({self.hide_seek_target_x}, {self.hide_seek_target_y}), Distance: {distance:.1f}")
-        
-        if distance < 30:  # Increased threshold to make it easier to trigger
-            print("Hide&Seek: Reached target, starting drop phase")
-            self.hide_seek_movement_timer.stop()
-            self.start_hide_seek_drop_phase()
-        else:
-            # Update walking animation based on current movement direction
-            self.update_hide_seek_walking_animation()
-            
-            # Move towards target
-            speed = 10
-            move_x = int(speed * dx / distance) if distance > 0 else 0
-            move_y = int(speed * dy / distance) if distance > 0 else 0
-            
-            new_x = current_x + move_x
-            new_y = current_y + move_y
-            
-            # Keep within screen bounds
-            screen = QApplication.primaryScreen().geometry()
-            new_x = max(0, min(new_x, screen.width() - self.width()))
-            new_y = max(0, min(new_y, screen.height() - self.height()))
-            
-            self.move(new_x, new_y)
-    
     def start_hide_seek_drop_phase(self):
-        """Phase 3: Edward drops Clover and Clover hides."""
-        print("Hide&Seek: Starting drop phase")
+        """Phase 3: Edward drops Clover."""
+        log.info('hide_seek', "Reached target, starting drop phase")
         self.hide_seek_phase = 'drop'
-        
-        # Start place animation
-        place_animation = 'edward_walking_spr_ed_place_clover'
-        if self.animation_loader.animation_exists(place_animation):
-            self.start_animation(place_animation, loop=False)
-            
-            # Calculate duration and move to hide phase
-            animation_info = self.animation_loader.get_animation_info(place_animation)
-            if animation_info:
-                duration = animation_info['frame_count'] * animation_info['frame_rate'] + 800
-            else:
-                duration = 2000
-            
-            QTimer.singleShot(int(duration), self.start_hide_seek_hide_phase)
-        else:
-            self.start_hide_seek_hide_phase()
     
     def start_hide_seek_hide_phase(self):
         """Phase 4: Clover hides visually using various creative methods."""
-        print("Hide&Seek: Starting hide phase")
+        log.info('hide_seek', "Starting hide phase")
         self.hide_seek_phase = 'hide'
         
         # Save original scale before hiding
@@ -1409,19 +1506,19 @@ class DesktopMascot(QWidget):
         ]
         
         # Choose random hiding method
-        hiding_method = random.choice(hiding_methods)
+        hiding_method = self.random.choice(hiding_methods)
         hiding_method()
         
         # Start waiting phase
         self.hide_seek_phase = 'waiting'
-        print(f"Clover is hiding somewhere! Find and click on him to win!")
+        log.info('hide_seek', "Clover is hiding somewhere! Find and click on him to win!")
         
         # Set up detection for clicks on Clover
         self.start_visual_detection()
     
     def hide_on_desktop(self):
         """Hide Clover in corners and edges of the desktop."""
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         
         # Define possible hiding spots (corners and edges)
         hiding_spots = [
@@ -1436,13 +1533,13 @@ class DesktopMascot(QWidget):
         ]
         
         # Choose random hiding spot
-        self.hide_seek_position = random.choice(hiding_spots)
+        self.hide_seek_position = self.random.choice(hiding_spots)
         
         # Make Clover smaller and move to hiding spot
         self.change_size(0.8)
         self.move(self.hide_seek_position[0], self.hide_seek_position[1])
         self.start_animation('sitting_spr_clover_sit_dark', loop=True)
-        print("Clover is hiding on the desktop!")
+        log.info('hide_seek', "Clover is hiding on the desktop!")
     
     def hide_behind_windows(self):
         """Hide Clover behind or near open windows."""
@@ -1457,11 +1554,12 @@ class DesktopMascot(QWidget):
                             windows.append(rect)
                     return True
                 
-                win32gui.EnumWindows(enum_windows_proc, 0)
+                with trace.span('enum_windows', 'windows', caller='hide_behind_windows'):
+                    win32gui.EnumWindows(enum_windows_proc, 0)
                 
                 if windows:
                     # Choose a random window and hide near its edge
-                    window_rect = random.choice(windows)
+                    window_rect = self.random.choice(windows)
                     
                     # Hide near window edges
                     positions = [
@@ -1471,21 +1569,21 @@ class DesktopMascot(QWidget):
                         (window_rect[0] + 50, window_rect[3] + 10),  # Bottom edge
                     ]
                     
-                    self.hide_seek_position = random.choice(positions)
+                    self.hide_seek_position = self.random.choice(positions)
                     self.change_size(0.4)
                     self.move(max(0, self.hide_seek_position[0]), max(0, self.hide_seek_position[1]))
                     self.start_animation('sitting_spr_clover_sit_dark', loop=True)
-                    print("Clover is hiding near a window!")
+                    log.info('hide_seek', "Clover is hiding near a window!")
                     return
             except Exception as e:
-                print(f"Error hiding behind windows: {e}")
+                log.error('hide_seek', "Error hiding behind windows: %s", e)
         
         # Fallback to desktop hiding
         self.hide_on_desktop()
     
     def hide_in_taskbar_area(self):
         """Hide Clover near the taskbar area."""
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         
         # Hide near taskbar (bottom of screen)
         taskbar_positions = [
@@ -1495,15 +1593,15 @@ class DesktopMascot(QWidget):
             (50, screen.height() - 120),  # Slightly above taskbar
         ]
         
-        self.hide_seek_position = random.choice(taskbar_positions)
+        self.hide_seek_position = self.random.choice(taskbar_positions)
         self.change_size(0.6)  # Moderately small near taskbar
         self.move(self.hide_seek_position[0], self.hide_seek_position[1])
         self.start_animation('sitting_spr_clover_sit_dark', loop=True)
-        print("Clover is hiding near the taskbar!")
+        log.info('hide_seek', "Clover is hiding near the taskbar!")
     
     def hide_partially_offscreen(self):
         """Hide Clover partially off the screen edges."""
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         
         # Positions where Clover is partially off-screen
         offscreen_positions = [
@@ -1513,35 +1611,35 @@ class DesktopMascot(QWidget):
             (screen.width() // 2, screen.height() - 20),  # Bottom edge, partially hidden
         ]
         
-        self.hide_seek_position = random.choice(offscreen_positions)
+        self.hide_seek_position = self.random.choice(offscreen_positions)
         self.change_size(0.9)
         self.move(self.hide_seek_position[0], self.hide_seek_position[1])
         self.start_animation('sitting_spr_clover_sit_dark', loop=True)
-        print("Clover is hiding at the screen edge!")
+        log.info('hide_seek', "Clover is hiding at the screen edge!")
     
     def hide_very_small(self):
         """Hide Clover by making him very small in a random location."""
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         
         # Random position anywhere on screen
-        x = random.randint(100, screen.width() - 200)
-        y = random.randint(100, screen.height() - 200)
+        x = self.random.randint(100, screen.width() - 200)
+        y = self.random.randint(100, screen.height() - 200)
         
         self.hide_seek_position = (x, y)
         self.change_size(0.5)  # Small but visible
         self.move(self.hide_seek_position[0], self.hide_seek_position[1])
         self.start_animation('sitting_spr_clover_sit_dark', loop=True)
-        print("Clover is hiding very small somewhere!")
+        log.info('hide_seek', "Clover is hiding very small somewhere!")
     
     def hide_in_user_directories(self):
         """Hide Clover in random locations within user directories (Documents, Pictures, Videos, Music, Downloads)."""
         import os
         
-        print("Hide&Seek: Starting directory-based hiding!")
+        log.info('hide_seek', "Starting directory-based hiding!")
         
         # Get user home directory
         user_home = os.path.expanduser("~")
-        print(f"Hide&Seek: User home directory: {user_home}")
+        log.debug('hide_seek', "User home directory: %s", user_home)
         
         # Define target directories
         target_dirs = [
@@ -1554,16 +1652,16 @@ class DesktopMascot(QWidget):
         
         # Filter existing directories
         existing_dirs = [d for d in target_dirs if os.path.exists(d) and os.path.isdir(d)]
-        print(f"Hide&Seek: Found {len(existing_dirs)} existing directories: {[os.path.basename(d) for d in existing_dirs]}")
+        log.debug('hide_seek', "Found %s existing directories: %s", len(existing_dirs), [os.path.basename(d) for d in existing_dirs])
         
         if not existing_dirs:
             # Fallback to desktop hiding if no directories found
-            print("Hide&Seek: No user directories found, falling back to desktop hiding")
+            log.info('hide_seek', "No user directories found, falling back to desktop hiding")
             self.hide_on_desktop()
             return
         
         # Choose a random directory
-        chosen_dir = random.choice(existing_dirs)
+        chosen_dir = self.random.choice(existing_dirs)
         
         # Get all subdirectories (including the chosen directory itself)
         all_dirs = [chosen_dir]
@@ -1581,21 +1679,21 @@ class DesktopMascot(QWidget):
             pass
         
         # Choose a random directory from all available
-        final_dir = random.choice(all_dirs)
-        print(f"Hide&Seek: Selected directory: {final_dir}")
-        print(f"Hide&Seek: Total directories found: {len(all_dirs)}")
+        final_dir = self.random.choice(all_dirs)
+        log.debug('hide_seek', "Selected directory: %s", final_dir)
+        log.debug('hide_seek', "Total directories found: %s", len(all_dirs))
         
         # Calculate position based on directory path hash for consistency
         # This ensures Clover appears in a predictable location relative to the directory
         dir_hash = hash(final_dir) % 1000
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         
         # Use hash to determine position within screen bounds
         x = (dir_hash % (screen.width() - 200)) + 100
         y = ((dir_hash // 10) % (screen.height() - 200)) + 100
         
         self.hide_seek_position = (x, y)
-        print(f"Hide&Seek: Calculated position: ({x}, {y})")
+        log.debug('hide_seek', "Calculated position: (%s, %s)", x, y)
         
         # Make Clover smaller and move to calculated position
         self.change_size(0.7)  # Medium size
@@ -1605,28 +1703,24 @@ class DesktopMascot(QWidget):
         # Store the directory for reference
         self.hide_seek_directory = final_dir
         dir_name = os.path.basename(final_dir) if final_dir != chosen_dir else os.path.basename(chosen_dir)
-        print(f"Hide&Seek: Clover is hiding somewhere related to: {dir_name}")
+        log.info('hide_seek', "Clover is hiding somewhere related to: %s", dir_name)
     
     def start_visual_detection(self):
         """Set up visual detection for when player clicks on Clover."""
-        print("Hide&Seek: Visual detection started - click on Clover to find him!")
+        log.info('hide_seek', "Visual detection started - click on Clover to find him!")
         
         # Enable mouse events for Clover
         self.setMouseTracking(True)
         
         # Set up a timer for auto-discovery as last resort (5 minutes)
-        if not hasattr(self, 'hide_seek_detection_timer'):
-            self.hide_seek_detection_timer = QTimer()
-            self.hide_seek_detection_timer.timeout.connect(self.check_visual_timeout)
-        
-        self.hide_seek_start_time = time.time()
+        self.hide_seek_start_time = self.clock.time()
         self.hide_seek_detection_timer.start(5000)  # Check every 5 seconds
     
     def check_visual_timeout(self):
         """Check if enough time has passed for auto-discovery (last resort)."""
-        elapsed = time.time() - self.hide_seek_start_time
+        elapsed = self.clock.time() - self.hide_seek_start_time
         if elapsed > 300:  # Auto-find after 5 minutes (last resort)
-            print("Hide&Seek: Auto-discovery timeout (5 min) - Clover found!")
+            log.info('hide_seek', "Auto-discovery timeout (5 min) - Clover found!")
             self.on_clover_found()
     
     # Old file-based detection methods removed - now using visual click detection
@@ -1636,14 +1730,13 @@ class DesktopMascot(QWidget):
         self.hide_seek_phase = 'found'
         
         # Stop detection timer
-        if hasattr(self, 'hide_seek_detection_timer'):
-            self.hide_seek_detection_timer.stop()
+        self.hide_seek_detection_timer.stop()
         
         # Make Clover visible again
         self.setVisible(True)
         
         # Move to center of screen for celebration
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         center_x = screen.width() // 2 - self.width() // 2
         center_y = screen.height() // 2 - self.height() // 2
         self.move(center_x, center_y)
@@ -1653,29 +1746,18 @@ class DesktopMascot(QWidget):
     
     def start_hide_seek_celebration(self):
         """Start the victory dance celebration."""
-        # Start dance animation
-        dance_animations = self.animation_loader.get_animations_by_category('dancing!')
-        if dance_animations:
-            self.start_animation(dance_animations[0], loop=True)
-            
-            # Dance for 5 seconds then return to normal
-            QTimer.singleShot(5000, self.end_hide_seek_sequence)
-        else:
-            # Fallback to normal ending
-            self.end_hide_seek_sequence()
+        # Dance for 5 seconds then return to normal (ends right away without a dance animation)
+        timeline = Timeline(self, 'hide_and_seek_celebration')
+        timeline.animation(category='dancing!', loop=True, duration_ms=5000)
+        timeline.on_finished = self.end_hide_seek_sequence
+        self.play_timeline(timeline)
     
     def end_hide_seek_sequence(self):
         """End the Hide and Seek sequence and return to normal behavior."""
-        print("Hide&Seek: Ending sequence and cleaning up")
-        
-        # Stop any movement timers
-        if hasattr(self, 'hide_seek_movement_timer'):
-            self.hide_seek_movement_timer.stop()
-        if hasattr(self, 'hide_seek_detection_timer'):
-            self.hide_seek_detection_timer.stop()
+        log.info('hide_seek', "Ending sequence and cleaning up")
         
-        self.is_character_interaction = False
-        self.in_hide_seek_sequence = False
+        # Leaving the state stops any movement or celebration still playing and the detection timer
+        self.state.leave(MascotState.HIDE_SEEK)
         self.hide_seek_phase = None
         
         # Restore original size if it was changed during hiding
@@ -1696,8 +1778,14 @@ class DesktopMascot(QWidget):
 
     # cleanup_hidden_file method removed - no longer needed with visual detection
     
+    # Possible names of the gun unsummon animation
+    SHOWDOWN_UNSUMMON_ANIMATIONS = ['spr_clover_geno_unsummon', 'gun_spr_clover_geno_unsummon', 'geno_spr_clover_geno_unsummon']
+    
     def start_showdown_sequence(self):
         """Start the Showdown minigame sequence."""
+        if not self.state.can_enter(MascotState.SHOWDOWN):
+            return
+        
         # Register as user interaction to prevent interruptions
         self.logic.on_user_interaction()
         
@@ -1709,19 +1797,15 @@ class DesktopMascot(QWidget):
         # Stop all timers and set interaction state
         self.idle_timer.stop()
         self.animation_timer.stop()
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
         
-        self.is_character_interaction = True
-        self.in_showdown_sequence = True
+        self.state.transition(MascotState.SHOWDOWN)
         self.showdown_phase = 'summon'  # Track current phase: summon, shooting
         
-        # Initialize bullet tracking lists
-        self.showdown_heart_bullets = []
-        self.showdown_strong_bullets = []
+        # Preallocate bullet pools so shots don't create widgets or timers
+        self.init_bullet_pools()
         
         # Move to bottom center of screen for dramatic effect
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         center_x = screen.width() // 2 - self.width() // 2
         bottom_y = screen.height() - self.height() - 50  # 50px margin from bottom
         self.move(center_x, bottom_y)
@@ -1733,24 +1817,12 @@ class DesktopMascot(QWidget):
         """Phase 1: Clover summons the gun."""
         self.showdown_phase = 'summon'
         
-        # Start gun summoning animation
-        summon_animation = 'gun_spr_clover_geno_summon'
-        if self.animation_loader.animation_exists(summon_animation):
-            self.start_animation(summon_animation, loop=False)
-            
-            # Calculate duration to reach last frame and stay there
-            animation_info = self.animation_loader.get_animation_info(summon_animation)
-            if animation_info:
-                duration = animation_info['frame_count'] * animation_info['frame_rate']
-            else:
-                duration = 3000  # Fallback duration
-            
-            # After animation completes, stay on last frame and start shooting
-            QTimer.singleShot(int(duration), self.hold_summon_last_frame)
-        else:
-            print(f"Animation not found: {summon_animation}")
-            # Fallback to shooting phase
-            self.start_showdown_shooting_phase()
+        # Play the gun summoning animation once, then hold its last frame and start shooting
+        # (goes straight to shooting if the animation is missing)
+        timeline = Timeline(self, 'showdown_summon')
+        timeline.animation('gun_spr_clover_geno_summon')
+        timeline.on_finished = self.hold_summon_last_frame
+        self.play_timeline(timeline)
     
     def hold_summon_last_frame(self):
         """Hold Clover on the last frame of summoning animation and start shooting."""
@@ -1762,7 +1834,7 @@ class DesktopMascot(QWidget):
             self.current_frame = len(animation['frames']) - 1
             self.animation_timer.stop()  # Stop animation timer to hold frame
             self.update_sprite()  # Update to show last frame
-            print(f"Showdown: Holding on last frame ({self.current_frame})")
+            log.debug('showdown', "Holding on last frame (%s)", self.current_frame)
         
         # Start shooting phase
         self.start_showdown_shooting_phase()
@@ -1772,8 +1844,9 @@ class DesktopMascot(QWidget):
         self.showdown_phase = 'shooting'
         
         # Initialize shooting variables
-        self.showdown_heart_bullets = []  # List to track active bullets
-        self.showdown_shooting_timer = QTimer()
+        self.init_bullet_pools()
+        self.showdown_shooting_timer = self.runtime.create_timer()
+        self.state.own_timer(MascotState.SHOWDOWN, 'shooting', self.showdown_shooting_timer)
         
         # Initialize difficulty progression variables
         self.showdown_base_shooting_interval = 600  # Base shooting interval in ms
@@ -1782,20 +1855,22 @@ class DesktopMascot(QWidget):
         self.showdown_speed_multiplier = 1          # Current speed multiplier
         
         # Initialize difficulty progression timer (every 10 seconds)
-        self.showdown_difficulty_timer = QTimer()
+        self.showdown_difficulty_timer = self.runtime.create_timer()
         self.showdown_difficulty_timer.timeout.connect(self.increase_showdown_difficulty)
+        self.state.own_timer(MascotState.SHOWDOWN, 'difficulty', self.showdown_difficulty_timer)
         self.showdown_difficulty_timer.start(10000)  # 10 seconds
         
         # Initialize sliding variables
-        self.showdown_sliding_timer = QTimer()
+        self.showdown_sliding_timer = self.runtime.create_timer()
         self.showdown_sliding_timer.timeout.connect(self.update_clover_sliding)
+        self.state.own_timer(MascotState.SHOWDOWN, 'sliding', self.showdown_sliding_timer)
         self.showdown_sliding_timer.start(self.showdown_base_sliding_interval)
         
         # Start continuous shooting sequence
         self.showdown_shooting_timer.timeout.connect(self.fire_showdown_shot)
         self.showdown_shooting_timer.start(self.showdown_base_shooting_interval)
         
-        print("Showdown: Started continuous shooting and sliding towards mouse cursor")
+        log.info('showdown', "Started continuous shooting and sliding towards mouse cursor")
     
     def increase_showdown_difficulty(self):
         """Double the laser firing rate and sliding speed every 10 seconds."""
@@ -1816,8 +1891,8 @@ class DesktopMascot(QWidget):
         self.showdown_sliding_timer.stop()
         self.showdown_sliding_timer.start(new_sliding_interval)
         
-        print(f"Showdown: Difficulty increased! Speed multiplier: {self.showdown_speed_multiplier}x")
-        print(f"Showdown: New shooting interval: {new_shooting_interval}ms, sliding interval: {new_sliding_interval}ms")
+        log.debug('showdown', "Difficulty increased! Speed multiplier: %sx", self.showdown_speed_multiplier)
+        log.debug('showdown', "New shooting interval: %sms, sliding interval: %sms", new_shooting_interval, new_sliding_interval)
         
         # Start strong shots when reaching 4x speed
         if self.showdown_speed_multiplier >= 4 and not hasattr(self, 'showdown_strong_shot_timer'):
@@ -1828,7 +1903,7 @@ class DesktopMascot(QWidget):
             new_strong_interval = max(100, self.showdown_base_strong_interval // self.showdown_strong_shot_speed_multiplier)
             self.showdown_strong_shot_timer.stop()
             self.showdown_strong_shot_timer.start(new_strong_interval)
-            print(f"Showdown: Strong shot speed increased! Multiplier: {self.showdown_strong_shot_speed_multiplier}x")
+            log.debug('showdown', "Strong shot speed increased! Multiplier: %sx", self.showdown_strong_shot_speed_multiplier)
     
     def update_clover_sliding(self):
         """Update Clover's position to slide towards mouse cursor horizontally."""
@@ -1836,7 +1911,7 @@ class DesktopMascot(QWidget):
             return
             
         # Get current mouse position
-        mouse_pos = QCursor.pos()
+        mouse_pos = self.snapshot.cursor_pos()
         
         # Calculate target X position (center Clover under mouse)
         target_x = mouse_pos.x() - self.width() // 2
@@ -1856,196 +1931,219 @@ class DesktopMascot(QWidget):
             new_x = target_x  # Snap to target if very close
         
         # Keep Clover within screen bounds
-        screen = QApplication.primaryScreen().geometry()
+        screen = self.snapshot.screen_geometry()
         new_x = max(0, min(new_x, screen.width() - self.width()))
         
         # Update position (keep Y at bottom)
         self.move(new_x, self.y())
     
+    def init_bullet_pools(self):
+        """Create the showdown bullet pools on first use (widgets and timers are recycled)."""
+        if getattr(self, 'heart_bullet_pool', None) is None:
+            # Heart bullets have no timers of their own, the showdown simulation steps them all
+            self.heart_bullet_pool = BulletPool(
+                lambda: self.create_sprite_widget(z=1), None, initial_size=16, runtime=self.runtime)
+        if getattr(self, 'strong_bullet_pool', None) is None:
+            self.strong_bullet_pool = BulletPool(
+                lambda: self.create_sprite_widget(z=2), self.update_strong_bullet, initial_size=4,
+                runtime=self.runtime)
+        if getattr(self, 'showdown_sim', None) is None:
+            self.showdown_sim = ShowdownSimulation(capacity=16)
+            self.showdown_sim_actors = {}  # Simulation slot -> heart BulletActor
+            self.showdown_sim_timer = self.runtime.create_timer(self)
+            self.showdown_sim_timer.setTimerType(Qt.PreciseTimer)
+            self.showdown_sim_timer.timeout.connect(self.step_showdown_simulation)
+            self.state.own_timer(MascotState.SHOWDOWN, 'simulation', self.showdown_sim_timer)
+            self.showdown_sim_accumulator = 0.0
+            self.showdown_sim_last_time = 0.0
+            self.showdown_sim_cursor = None  # Cursor sampled at the previous tick
+            self.showdown_sim_bounds = (0, 0, 0, 0)
+    
+    def get_bullet_pool_stats(self):
+        """Get hit/miss/allocation counters of the showdown bullet pools."""
+        self.init_bullet_pools()
+        return {
+            'heart': self.heart_bullet_pool.get_stats(),
+            'strong': self.strong_bullet_pool.get_stats()
+        }
+    
+    def get_bullet_frames(self, bullet, animation_data, scale):
+        """Get a bullet's scaled frames, refreshing them only when scale or screen changes."""
+        device_pixel_ratio = self.devicePixelRatioF()
+        key = (id(animation_data), scale, device_pixel_ratio)
+        if bullet.frames_key != key:
+            bullet.frames = [
+                self.animation_loader.get_scaled_frame(animation_data, i, scale, device_pixel_ratio)
+                for i in range(len(animation_data['frames']))
+            ]
+            bullet.frames_key = key
+        return bullet.frames
+    
+    def release_showdown_bullets(self, heart=True, strong=True):
+        """Hide all active bullets and return them to their pools."""
+        if heart and getattr(self, 'showdown_sim', None):
+            self.showdown_sim_timer.stop()
+            self.showdown_sim.clear()
+            self.showdown_sim_actors = {}
+        if heart and getattr(self, 'heart_bullet_pool', None):
+            self.heart_bullet_pool.release_all()
+        if strong and getattr(self, 'strong_bullet_pool', None):
+            self.strong_bullet_pool.release_all()
+    
     def fire_showdown_shot(self):
         """Fire a single shot towards the mouse cursor."""
         # Get current mouse position
-        mouse_pos = QCursor.pos()
-        
-        # Create heart bullet sprite above Clover
-        heart_bullet = self.create_heart_bullet(mouse_pos)
-        if heart_bullet:
-            self.showdown_heart_bullets.append(heart_bullet)
+        mouse_pos = self.snapshot.cursor_pos()
         
-        print(f"Showdown: Fired shot towards mouse at ({mouse_pos.x()}, {mouse_pos.y()})")
+        # Fire a pooled heart bullet from above Clover
+        self.create_heart_bullet(mouse_pos)
         
-        # Clean up old bullets that are no longer active
-        self.showdown_heart_bullets = [bullet for bullet in self.showdown_heart_bullets if bullet and not bullet.isHidden()]
+        log.debug('showdown', "Fired shot towards mouse at (%s, %s)", mouse_pos.x(), mouse_pos.y())
     
     def create_heart_bullet(self, target_pos):
-        """Create a heart bullet sprite that appears above Clover and moves towards target."""
+        """Fire a heart bullet from the pool that appears above Clover and moves towards target."""
         # Get heart bullet animation
         heart_animation = 'gun_spr_heart_yellow_shot'
-        if not self.animation_loader.animation_exists(heart_animation):
-            print(f"Heart bullet animation not found: {heart_animation}")
+        animation_data = self.animation_loader.get_animation(heart_animation)
+        if not animation_data or not animation_data['frames']:
+            log.warning('showdown', "Heart bullet animation not found: %s", heart_animation)
             return None
         
         # Get current scale for bullet scaling
         current_scale = config.get_setting('size', 'current_scale', 1.0)
         
-        # Create a new QLabel for the heart bullet
-        heart_bullet = QLabel()
-        heart_bullet.setParent(None)  # Make it a top-level widget
-        heart_bullet.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        heart_bullet.setAttribute(Qt.WA_TranslucentBackground)
-        
-        # Get first frame of heart animation and apply scaling
-        animation_data = self.animation_loader.get_animation(heart_animation)
-        if animation_data and animation_data['frames']:
-            first_frame = animation_data['frames'][0]
-            # Scale the bullet sprite to match Clover's size
-            if current_scale != 1.0:
-                scaled_size = first_frame.size() * current_scale
-                first_frame = first_frame.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            heart_bullet.setPixmap(first_frame)
-            heart_bullet.resize(first_frame.size())
+        # Recycle a bullet (widget and scaled frames) from the pool
+        self.init_bullet_pools()
+        heart_bullet = self.heart_bullet_pool.acquire()
+        frames = self.get_bullet_frames(heart_bullet, animation_data, current_scale)
+        widget = heart_bullet.widget
+        widget.setPixmap(frames[0])
+        widget.resize(self.logical_size(frames[0]))
         
         # Position heart bullet above Clover (scaled offset)
         scaled_offset = int(30 * current_scale)  # Scale the vertical offset
-        clover_x = self.x() + self.width() // 2
-        clover_y = self.y() - scaled_offset  # Above Clover
-        heart_bullet.move(clover_x - heart_bullet.width() // 2, clover_y)
-        
-        # Store target position and scale for movement
-        heart_bullet.target_x = target_pos.x()
-        heart_bullet.target_y = target_pos.y()
-        heart_bullet.bullet_scale = current_scale  # Store scale for animation
-        
-        # Initialize animation frame and tracking
-        heart_bullet.animation_frame = 0
-        heart_bullet.animation_complete = False
-        
-        # Show the heart bullet
-        heart_bullet.show()
-        
-        # Animate the heart bullet towards target
-        self.animate_heart_bullet(heart_bullet)
-        
-        return heart_bullet
-    
-    def animate_heart_bullet(self, heart_bullet):
-        """Animate a heart bullet moving towards target and detect mouse hits."""
-        # Set up animation variables
-        heart_bullet.animation_frame = 0
-        heart_bullet.move_distance = 0
-        
-        # Get animation data
-        heart_animation = 'gun_spr_heart_yellow_shot'
-        animation_data = self.animation_loader.get_animation(heart_animation)
+        heart_bullet.x = self.x() + self.width() // 2 - widget.width() // 2
+        heart_bullet.y = self.y() - scaled_offset  # Above Clover
+        widget.move(int(heart_bullet.x), int(heart_bullet.y))
         
         # Calculate movement direction
-        start_x = heart_bullet.x()
-        start_y = heart_bullet.y()
-        target_x = heart_bullet.target_x
-        target_y = heart_bullet.target_y
-        
-        dx = target_x - start_x
-        dy = target_y - start_y
+        dx = target_pos.x() - heart_bullet.x
+        dy = target_pos.y() - heart_bullet.y
         distance = (dx**2 + dy**2)**0.5
         
         if distance == 0:
-            return  # No movement needed
+            # No movement needed, don't waste a bullet
+            self.heart_bullet_pool.release(heart_bullet)
+            return None
         
         # Normalize direction and set speed (scaled with bullet size and showdown speed)
-        base_speed = 8  # base pixels per update
-        bullet_scale = getattr(heart_bullet, 'bullet_scale', 1.0)
+        base_speed = 8  # base pixels per step
         showdown_speed_multiplier = getattr(self, 'showdown_speed_multiplier', 1.0)
-        speed = base_speed * bullet_scale * showdown_speed_multiplier  # Scale speed with bullet size and showdown speed
-        move_x = (dx / distance) * speed
-        move_y = (dy / distance) * speed
+        heart_bullet.speed = base_speed * current_scale * showdown_speed_multiplier
+        heart_bullet.move_x = (dx / distance) * heart_bullet.speed
+        heart_bullet.move_y = (dy / distance) * heart_bullet.speed
+        heart_bullet.max_distance = 1000 * current_scale
+        
+        # Hand the bullet to the shared simulation
+        heart_bullet.slot = self.showdown_sim.spawn(
+            heart_bullet.x, heart_bullet.y, heart_bullet.move_x, heart_bullet.move_y,
+            heart_bullet.max_distance, widget.width(), widget.height(), len(frames))
+        self.showdown_sim_actors[heart_bullet.slot] = heart_bullet
+        widget.show()
+        
+        if not self.showdown_sim_timer.isActive():
+            # Screen bounds are cached for the burst instead of queried every tick
+            screen = self.snapshot.screen_geometry()
+            self.showdown_sim_bounds = (-100, -100, screen.width() + 100, screen.height() + 100)
+            self.showdown_sim_accumulator = 0.0
+            self.showdown_sim_last_time = self.clock.perf_counter()
+            mouse_pos = self.snapshot.cursor_pos()
+            self.showdown_sim_cursor = (mouse_pos.x(), mouse_pos.y())
+            self.showdown_sim_timer.start(self.get_showdown_tick_ms())
         
-        # Create timer for bullet animation and store it on the bullet object
-        bullet_timer = QTimer()
-        heart_bullet.bullet_timer = bullet_timer  # Store timer for cleanup
+        return heart_bullet
+    
+    def get_showdown_tick_ms(self):
+        """Get the showdown simulation tick length (swept hits keep long ticks exact)."""
+        return max(10, int(config.get_setting('performance', 'showdown_tick_ms', SIMULATION_STEP_MS)))
+    
+    def step_showdown_simulation(self):
+        """Advance all heart bullets in fixed steps and sync their widgets."""
+        now = self.clock.perf_counter()
+        self.showdown_sim_accumulator += (now - self.showdown_sim_last_time) * 1000
+        self.showdown_sim_last_time = now
+        
+        # Use a fixed base hit radius that doesn't scale with bullet size
+        # This ensures consistent hit detection regardless of Clover's size
+        hit_radius = 30  # Fixed radius for consistent gameplay
+        
+        # Catch up on late ticks, but never spiral when the GUI thread stalls
+        # (a tick arriving slightly early still counts, the accumulator evens it out)
+        step_ms = self.get_showdown_tick_ms()
+        steps = min(MAX_CATCHUP_STEPS, int((self.showdown_sim_accumulator + step_ms * 0.1) // step_ms))
+        if steps == MAX_CATCHUP_STEPS:
+            self.showdown_sim_accumulator = 0.0
+        else:
+            self.showdown_sim_accumulator -= steps * step_ms
+        
+        if steps:
+            mouse_pos = self.snapshot.cursor_pos()
+            cursor_end = (mouse_pos.x(), mouse_pos.y())
+            cursor_start = self.showdown_sim_cursor or cursor_end
+            self.showdown_sim_cursor = cursor_end
+        
+        for step in range(steps):
+            # The cursor was only sampled at the ticks, split its path evenly between the steps
+            step_start = interpolate_point(cursor_start, cursor_end, 0, steps, step)
+            step_end = interpolate_point(cursor_start, cursor_end, 0, steps, step + 1)
+            result = self.showdown_sim.step(step_start, step_end, self.showdown_sim_bounds,
+                                            hit_radius, step_ms / SIMULATION_STEP_MS)
+            
+            if result.hits.size:
+                log.info('showdown', "Heart bullet hit the mouse! You win!")
+                for slot in result.hits.tolist():
+                    self.heart_bullet_pool.release(self.showdown_sim_actors.pop(slot))
+                # Start victory sequence with unsummon animation
+                self.start_showdown_victory_sequence()
+                return
+            
+            # Remove bullets that moved too far or off screen
+            for slot in result.culled.tolist():
+                self.heart_bullet_pool.release(self.showdown_sim_actors.pop(slot))
         
-        def update_bullet():
+        if not self.showdown_sim_actors:
+            self.showdown_sim_timer.stop()
+            return
+        
+        # Sync widgets with the simulation (animation plays once, then stays on last frame)
+        sim = self.showdown_sim
+        slots = sim.active_slots()
+        positions = sim.position[slots].astype(int).tolist()
+        frames = sim.frame[slots].tolist()
+        for slot, (x, y), frame in zip(slots.tolist(), positions, frames):
+            heart_bullet = self.showdown_sim_actors[slot]
             try:
-                if not heart_bullet or heart_bullet.isHidden():
-                    bullet_timer.stop()
-                    return
-                
-                # Update animation frame (play once, then stay on last frame)
-                if animation_data and animation_data['frames'] and not heart_bullet.animation_complete:
-                    frames = animation_data['frames']
-                    heart_bullet.animation_frame += 1
-                    if heart_bullet.animation_frame >= len(frames):
-                        heart_bullet.animation_frame = len(frames) - 1  # Stay on last frame
-                        heart_bullet.animation_complete = True
-                    
-                    # Apply scaling to animation frames
-                    frame = frames[heart_bullet.animation_frame]
-                    if bullet_scale != 1.0:
-                        scaled_size = frame.size() * bullet_scale
-                        frame = frame.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    heart_bullet.setPixmap(frame)
-                
-                # Move bullet towards target
-                current_pos = heart_bullet.pos()
-                new_x = current_pos.x() + move_x
-                new_y = current_pos.y() + move_y
-                heart_bullet.move(int(new_x), int(new_y))
-                heart_bullet.move_distance += speed
-                
-                # Check if bullet hit the mouse cursor (within 30 pixel radius)
-                current_mouse_pos = QCursor.pos()
-                bullet_center_x = heart_bullet.x() + heart_bullet.width() // 2
-                bullet_center_y = heart_bullet.y() + heart_bullet.height() // 2
-                
-                hit_distance = ((bullet_center_x - current_mouse_pos.x())**2 + 
-                               (bullet_center_y - current_mouse_pos.y())**2)**0.5
-                
-                # Use a fixed base hit radius that doesn't scale with bullet size
-                # This ensures consistent hit detection regardless of Clover's size
-                hit_radius = 30  # Fixed radius for consistent gameplay
-                if hit_distance <= hit_radius:  # Hit detected!
-                    print("Showdown: Heart bullet hit the mouse! You win!")
-                    bullet_timer.stop()
-                    # Remove from tracking list first
-                    if heart_bullet in self.showdown_heart_bullets:
-                        self.showdown_heart_bullets.remove(heart_bullet)
-                    heart_bullet.hide()
-                    heart_bullet.deleteLater()
-                    # Start victory sequence with unsummon animation
-                    self.start_showdown_victory_sequence()
-                    return
-                
-                # Remove bullet if it's moved too far or off screen (scaled distance)
-                max_distance = 1000 * bullet_scale
-                screen = QApplication.primaryScreen().geometry()
-                if (heart_bullet.move_distance > max_distance or 
-                    new_x < -100 or new_x > screen.width() + 100 or
-                    new_y < -100 or new_y > screen.height() + 100):
-                    bullet_timer.stop()
-                    # Remove from tracking list first
-                    if heart_bullet in self.showdown_heart_bullets:
-                        self.showdown_heart_bullets.remove(heart_bullet)
-                    heart_bullet.hide()
-                    heart_bullet.deleteLater()
+                if frame != heart_bullet.animation_frame:
+                    heart_bullet.animation_frame = frame
+                    heart_bullet.widget.setPixmap(heart_bullet.frames[frame])
+                heart_bullet.widget.move(x, y)
             except RuntimeError:
-                # Object has been deleted, stop timer
-                bullet_timer.stop()
-                return
-        
-        bullet_timer.timeout.connect(update_bullet)
-        bullet_timer.start(30)  # Update every 30ms for smooth movement
+                # Widget has been deleted, drop the bullet from the simulation
+                sim.kill(slot)
+                self.heart_bullet_pool.release(self.showdown_sim_actors.pop(slot))
     
     def start_strong_shots(self):
         """Initialize strong shot system when reaching 8x speed."""
-        print("Showdown: Starting strong shots at 8x speed!")
+        log.info('showdown', "Starting strong shots at 8x speed!")
         
         # Initialize strong shot variables
-        self.showdown_strong_bullets = []  # List to track active strong bullets
         self.showdown_base_strong_interval = 800  # Base strong shot interval in ms
         self.showdown_strong_shot_speed_multiplier = 1  # Strong shot speed multiplier
         
         # Start strong shot timer
-        self.showdown_strong_shot_timer = QTimer()
+        self.showdown_strong_shot_timer = self.runtime.create_timer()
         self.showdown_strong_shot_timer.timeout.connect(self.fire_strong_shot)
+        self.state.own_timer(MascotState.SHOWDOWN, 'strong_shot', self.showdown_strong_shot_timer)
         self.showdown_strong_shot_timer.start(self.showdown_base_strong_interval)
     
     def fire_strong_shot(self):
@@ -2054,160 +2152,111 @@ class DesktopMascot(QWidget):
             return
             
         # Get current mouse position
-        mouse_pos = QCursor.pos()
-        print(f"Showdown: Fired strong shot towards mouse at ({mouse_pos.x()}, {mouse_pos.y()})")
+        mouse_pos = self.snapshot.cursor_pos()
+        log.debug('showdown', "Fired strong shot towards mouse at (%s, %s)", mouse_pos.x(), mouse_pos.y())
         
-        # Create and track the strong bullet
-        strong_bullet = self.create_strong_bullet(mouse_pos)
-        if strong_bullet:
-            self.showdown_strong_bullets.append(strong_bullet)
+        # Fire a pooled strong bullet
+        self.create_strong_bullet(mouse_pos)
     
     def create_strong_bullet(self, target_pos):
-        """Create a strong bullet widget that appears directly over the mouse position."""
-        # Create QLabel for strong bullet
-        strong_bullet = QLabel()
-        strong_bullet.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        strong_bullet.setAttribute(Qt.WA_TranslucentBackground)
+        """Fire a strong bullet from the pool that appears directly over the mouse position."""
+        strong_animation = 'gun_spr_shot_strong'
+        animation_data = self.animation_loader.get_animation(strong_animation)
+        if not animation_data or not animation_data['frames']:
+            return None
         
         # Get current scale for bullet scaling
         current_scale = config.get_setting('size', 'current_scale', 1.0)
         
-        # Get first frame of strong shot animation and apply scaling
-        strong_animation = 'gun_spr_shot_strong'
-        animation_data = self.animation_loader.get_animation(strong_animation)
-        if animation_data and animation_data['frames']:
-            first_frame = animation_data['frames'][0]
-            # Scale the bullet sprite to match Clover's size
-            if current_scale != 1.0:
-                scaled_size = first_frame.size() * current_scale
-                first_frame = first_frame.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            strong_bullet.setPixmap(first_frame)
-            strong_bullet.resize(first_frame.size())
+        # Recycle a bullet (widget, timer and scaled frames) from the pool
+        self.init_bullet_pools()
+        strong_bullet = self.strong_bullet_pool.acquire()
+        frames = self.get_bullet_frames(strong_bullet, animation_data, current_scale)
+        widget = strong_bullet.widget
+        widget.setPixmap(frames[0])
+        widget.resize(self.logical_size(frames[0]))
         
         # Position strong bullet directly over the mouse position
-        mouse_x = target_pos.x()
-        mouse_y = target_pos.y()
-        strong_bullet.move(mouse_x - strong_bullet.width() // 2, mouse_y - strong_bullet.height() // 2)
+        strong_bullet.x = target_pos.x() - widget.width() // 2
+        strong_bullet.y = target_pos.y() - widget.height() // 2
+        widget.move(int(strong_bullet.x), int(strong_bullet.y))
         
-        # Store scale for animation
-        strong_bullet.bullet_scale = current_scale
+        # Show the strong bullet and animate it in place
+        widget.show()
         
-        # Initialize animation frame and tracking
-        strong_bullet.animation_frame = 0
-        strong_bullet.animation_complete = False
-        
-        # Show the strong bullet
-        strong_bullet.show()
+        # Animation speed based on strong shot multiplier
+        speed_multiplier = getattr(self, 'showdown_strong_shot_speed_multiplier', 1)
+        animation_interval = max(25, 50 // speed_multiplier)  # Faster animation with higher multiplier
+        strong_bullet.frame_interval = animation_interval
+        strong_bullet.started_at = self.clock.perf_counter()
+        strong_bullet.cursor_sample = (strong_bullet.started_at, target_pos.x(), target_pos.y())
         
-        # Animate the strong bullet in place
-        self.animate_strong_bullet(strong_bullet)
+        # Frames follow the clock, so a longer showdown tick only makes the animation coarser
+        tick_ms = self.get_showdown_tick_ms()
+        strong_bullet.timer.start(animation_interval if tick_ms <= SIMULATION_STEP_MS else max(animation_interval, tick_ms))
         
         return strong_bullet
     
-    def animate_strong_bullet(self, strong_bullet):
+    def update_strong_bullet(self, strong_bullet):
         """Animate a strong bullet in place and detect mouse hits when animation completes."""
-        # Set up animation variables
-        strong_bullet.animation_frame = 0
-        
-        # Get animation data
-        strong_animation = 'gun_spr_shot_strong'
-        animation_data = self.animation_loader.get_animation(strong_animation)
-        
-        # Create timer for bullet animation and store it on the bullet object
-        bullet_timer = QTimer()
-        strong_bullet.bullet_timer = bullet_timer  # Store timer for cleanup
-        
-        def update_strong_bullet():
-            try:
-                if not strong_bullet or strong_bullet.isHidden():
-                    bullet_timer.stop()
-                    return
+        widget = strong_bullet.widget
+        try:
+            # Animation finished without a hit: the short linger is over
+            if strong_bullet.lingering:
+                self.remove_strong_bullet(strong_bullet)
+                return
+            
+            frames = strong_bullet.frames
+            now = self.clock.perf_counter()
+            current_mouse_pos = self.snapshot.cursor_pos()
+            
+            # Frame from elapsed time (a tick arriving slightly early still advances)
+            elapsed_ms = (now - strong_bullet.started_at) * 1000
+            frame = int((elapsed_ms + strong_bullet.frame_interval * 0.1) // strong_bullet.frame_interval)
+            if frame >= len(frames):
+                # Animation complete
+                strong_bullet.animation_frame = len(frames) - 1  # Stay on last frame
+                strong_bullet.animation_complete = True
                 
-                # Update animation frame (play once, then check for mouse hit when complete)
-                if animation_data and animation_data['frames']:
-                    frames = animation_data['frames']
-                    
-                    if not strong_bullet.animation_complete:
-                        strong_bullet.animation_frame += 1
-                        if strong_bullet.animation_frame >= len(frames):
-                            # Animation complete
-                            strong_bullet.animation_frame = len(frames) - 1  # Stay on last frame
-                            strong_bullet.animation_complete = True
-                            
-                            # Check if mouse is over the animation when it completes
-                            current_mouse_pos = QCursor.pos()
-                            bullet_center_x = strong_bullet.x() + strong_bullet.width() // 2
-                            bullet_center_y = strong_bullet.y() + strong_bullet.height() // 2
-                            
-                            hit_distance = ((bullet_center_x - current_mouse_pos.x())**2 + 
-                                          (bullet_center_y - current_mouse_pos.y())**2)**0.5
-                            
-                            # Use a fixed hit radius for consistent gameplay
-                            hit_radius = 30  # Fixed radius for consistent gameplay
-                            if hit_distance <= hit_radius:  # Hit detected!
-                                print("Showdown: Mouse was over strong shot when animation completed! You lose!")
-                                bullet_timer.stop()
-                                # Remove from tracking list first
-                                if strong_bullet in self.showdown_strong_bullets:
-                                    self.showdown_strong_bullets.remove(strong_bullet)
-                                strong_bullet.hide()
-                                strong_bullet.deleteLater()
-                                # Start defeat sequence
-                                self.start_showdown_defeat_sequence()
-                                return
-                            else:
-                                # Animation completed but mouse wasn't over it, remove after a short delay
-                                QTimer.singleShot(500, lambda: self.remove_strong_bullet(strong_bullet, bullet_timer))
-                                return
-                    
-                    # Apply scaling to animation frames
-                    bullet_scale = getattr(strong_bullet, 'bullet_scale', 1.0)
-                    frame = frames[strong_bullet.animation_frame]
-                    if bullet_scale != 1.0:
-                        scaled_size = frame.size() * bullet_scale
-                        frame = frame.scaled(scaled_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    strong_bullet.setPixmap(frame)
-                    
-            except RuntimeError:
-                # Object has been deleted, stop timer
-                bullet_timer.stop()
+                # Check if mouse was over the animation at the moment it completed,
+                # interpolating the cursor path between the last two samples
+                completed_at = strong_bullet.started_at + len(frames) * strong_bullet.frame_interval / 1000
+                sample_time, sample_x, sample_y = strong_bullet.cursor_sample
+                mouse_x, mouse_y = interpolate_point(
+                    (sample_x, sample_y), (current_mouse_pos.x(), current_mouse_pos.y()),
+                    sample_time, now, completed_at)
+                bullet_center_x = widget.x() + widget.width() // 2
+                bullet_center_y = widget.y() + widget.height() // 2
+                
+                # Use a fixed hit radius for consistent gameplay
+                hit_radius = 30  # Fixed radius for consistent gameplay
+                if (bullet_center_x - mouse_x)**2 + (bullet_center_y - mouse_y)**2 <= hit_radius**2:  # Hit detected!
+                    log.info('showdown', "Mouse was over strong shot when animation completed! You lose!")
+                    self.remove_strong_bullet(strong_bullet)
+                    # Start defeat sequence
+                    self.start_showdown_defeat_sequence()
+                else:
+                    # Mouse wasn't over it, keep the last frame up briefly then recycle
+                    strong_bullet.lingering = True
+                    strong_bullet.timer.start(500)
                 return
-        
-        bullet_timer.timeout.connect(update_strong_bullet)
-        # Animation speed based on strong shot multiplier
-        speed_multiplier = getattr(self, 'showdown_strong_shot_speed_multiplier', 1)
-        animation_interval = max(25, 50 // speed_multiplier)  # Faster animation with higher multiplier
-        bullet_timer.start(animation_interval)
+            
+            strong_bullet.cursor_sample = (now, current_mouse_pos.x(), current_mouse_pos.y())
+            if frame != strong_bullet.animation_frame:
+                strong_bullet.animation_frame = frame
+                widget.setPixmap(frames[frame])
+        except RuntimeError:
+            # Widget has been deleted, stop timer
+            strong_bullet.timer.stop()
     
-    def remove_strong_bullet(self, strong_bullet, bullet_timer=None):
-        """Remove a strong bullet after animation completes."""
-        if strong_bullet:
-            try:
-                # Stop the bullet timer if it exists on the bullet object
-                if hasattr(strong_bullet, 'bullet_timer'):
-                    strong_bullet.bullet_timer.stop()
-                # Also stop the passed timer for backward compatibility
-                if bullet_timer and bullet_timer.isActive():
-                    bullet_timer.stop()
-                
-                # Remove from tracking list first
-                if hasattr(self, 'showdown_strong_bullets') and strong_bullet in self.showdown_strong_bullets:
-                    self.showdown_strong_bullets.remove(strong_bullet)
-                strong_bullet.hide()
-                strong_bullet.deleteLater()
-            except RuntimeError as e:
-                # Handle case where QLabel has already been deleted
-                print(f"Warning: Strong bullet QLabel already deleted: {e}")
-                # Still try to remove from tracking list if possible
-                if hasattr(self, 'showdown_strong_bullets') and strong_bullet in self.showdown_strong_bullets:
-                    try:
-                        self.showdown_strong_bullets.remove(strong_bullet)
-                    except (ValueError, RuntimeError):
-                        pass
+    def remove_strong_bullet(self, strong_bullet):
+        """Return a strong bullet to the pool after its animation completes."""
+        if strong_bullet and getattr(self, 'strong_bullet_pool', None):
+            self.strong_bullet_pool.release(strong_bullet)
     
     def start_showdown_defeat_sequence(self):
         """Handle defeat when hit by a strong shot."""
-        print("Showdown: Player defeated by strong shot!")
+        log.info('showdown', "Player defeated by strong shot!")
         
         # Stop all showdown timers
         if hasattr(self, 'showdown_shooting_timer'):
@@ -2219,84 +2268,20 @@ class DesktopMascot(QWidget):
         if hasattr(self, 'showdown_strong_shot_timer'):
             self.showdown_strong_shot_timer.stop()
         
-        # Clean up all bullets
-        for heart_bullet in self.showdown_heart_bullets:
-            if heart_bullet:
-                try:
-                    # Stop the bullet timer if it exists
-                    if hasattr(heart_bullet, 'bullet_timer'):
-                        heart_bullet.bullet_timer.stop()
-                    heart_bullet.hide()
-                    heart_bullet.deleteLater()
-                except RuntimeError as e:
-                    # Handle case where QLabel has already been deleted
-                    print(f"Warning: Heart bullet QLabel already deleted: {e}")
-        self.showdown_heart_bullets.clear()
-        
-        for strong_bullet in getattr(self, 'showdown_strong_bullets', []):
-            if strong_bullet:
-                try:
-                    strong_bullet.hide()
-                    strong_bullet.deleteLater()
-                except RuntimeError as e:
-                    # Handle case where QLabel has already been deleted
-                    print(f"Warning: Strong bullet QLabel already deleted: {e}")
-        if hasattr(self, 'showdown_strong_bullets'):
-            self.showdown_strong_bullets.clear()
-        
-        # Start unsummon animation before ending
-        self.showdown_phase = 'defeat_unsummon'
-        print("Showdown: Attempting to start defeat unsummon animation...")
-        
-        # Try to find and start unsummon animation
-        all_animations = self.animation_loader.get_all_animations()
-        unsummon_animations = [name for name in all_animations if 'unsummon' in name.lower()]
-        print(f"Showdown: Available unsummon animations: {unsummon_animations}")
-        
-        # Try different possible names for the unsummon animation
-        possible_names = ['spr_clover_geno_unsummon', 'gun_spr_clover_geno_unsummon', 'geno_spr_clover_geno_unsummon']
-        unsummon_started = False
-        
-        for anim_name in possible_names:
-            if self.animation_loader.animation_exists(anim_name):
-                print(f"Showdown: Found unsummon animation: {anim_name}")
-                self.start_animation(anim_name, loop=False)
-                unsummon_started = True
-                break
-        
-        if unsummon_started:
-            # Set timer to end showdown after unsummon animation completes
-            # Use the animation name that was actually found
-            found_anim_name = None
-            for anim_name in possible_names:
-                if self.animation_loader.animation_exists(anim_name):
-                    found_anim_name = anim_name
-                    break
-            
-            if found_anim_name:
-                unsummon_info = self.animation_loader.get_animation_info(found_anim_name)
-                if unsummon_info:
-                    unsummon_duration = unsummon_info['frame_count'] * unsummon_info['frame_rate']
-                    print(f"Showdown: Defeat unsummon duration calculated: {unsummon_duration}ms")
-                else:
-                    unsummon_duration = 2000  # Fallback duration if animation not found
-            else:
-                unsummon_duration = 2000  # Fallback duration if animation not found
-        else:
-            print("Showdown: Defeat unsummon animation not found, ending immediately")
-            unsummon_duration = 100  # Very short delay before ending
-        
-        # Create timer to end showdown after unsummon completes
-        if not hasattr(self, 'defeat_transition_timer'):
-            self.defeat_transition_timer = QTimer()
-            self.defeat_transition_timer.setSingleShot(True)
-            self.defeat_transition_timer.timeout.connect(self.end_showdown_sequence)
+        # Return all bullets to their pools
+        self.release_showdown_bullets()
         
-        self.defeat_transition_timer.start(unsummon_duration)
+        # Unsummon the gun, then end the showdown
+        self.showdown_phase = 'defeat_unsummon'
+        timeline = Timeline(self, 'showdown_defeat')
+        timeline.animation(self.SHOWDOWN_UNSUMMON_ANIMATIONS, missing_ms=100, label='unsummon')
+        timeline.on_finished = self.end_showdown_sequence
+        self.play_timeline(timeline)
+        self.log_unsummon_animation(timeline)
     
     def start_showdown_victory_sequence(self):
         """Start the victory sequence with unsummon animation followed by dancing."""
-        print("Showdown: Starting victory sequence with unsummon animation")
+        log.info('showdown', "Starting victory sequence with unsummon animation")
         
         # Stop all showdown timers first
         if hasattr(self, 'showdown_shooting_timer'):
@@ -2306,140 +2291,40 @@ class DesktopMascot(QWidget):
         if hasattr(self, 'showdown_difficulty_timer'):
             self.showdown_difficulty_timer.stop()
         
-        # Clean up any remaining heart bullets
-        for heart_bullet in self.showdown_heart_bullets:
-            if heart_bullet:
-                try:
-                    heart_bullet.hide()
-                    heart_bullet.deleteLater()
-                except RuntimeError as e:
-                    # Handle case where QLabel has already been deleted
-                    print(f"Warning: Heart bullet QLabel already deleted: {e}")
-        self.showdown_heart_bullets.clear()
-        
-        # Start unsummon animation
-        self.showdown_phase = 'victory_unsummon'
-        print("Showdown: Attempting to start unsummon animation...")
-        
-        # Debug: Print all available animations to find the correct name
-        all_animations = self.animation_loader.get_all_animations()
-        unsummon_animations = [name for name in all_animations if 'unsummon' in name.lower()]
-        print(f"Showdown: Available unsummon animations: {unsummon_animations}")
-        
-        # Try different possible animation names
-        possible_names = ['spr_clover_geno_unsummon', 'gun_spr_clover_geno_unsummon', 'geno_spr_clover_geno_unsummon']
-        animation_found = False
-        
-        for anim_name in possible_names:
-            if self.animation_loader.animation_exists(anim_name):
-                print(f"Showdown: Found unsummon animation: {anim_name}")
-                self.start_animation(anim_name, loop=False)
-                animation_found = True
-                break
+        # Return any remaining heart bullets to their pool
+        self.release_showdown_bullets(strong=False)
         
-        if animation_found:
-            # Set timer to transition to dancing after unsummon animation completes
-            # Use the animation name that was actually found
-            found_anim_name = None
-            for anim_name in possible_names:
-                if self.animation_loader.animation_exists(anim_name):
-                    found_anim_name = anim_name
-                    break
-            
-            if found_anim_name:
-                unsummon_info = self.animation_loader.get_animation_info(found_anim_name)
-                if unsummon_info:
-                    unsummon_duration = unsummon_info['frame_count'] * unsummon_info['frame_rate']
-                    print(f"Showdown: Unsummon duration calculated: {unsummon_duration}ms")
-                else:
-                    unsummon_duration = 2000  # Fallback duration if animation not found
-            else:
-                unsummon_duration = 2000  # Fallback duration if animation not found
-                print("Showdown: Using fallback duration: 2000ms")
+        # Unsummon the gun, dance for 3 seconds, then end the showdown
+        self.showdown_phase = 'victory_unsummon'
+        timeline = Timeline(self, 'showdown_victory')
+        timeline.animation(self.SHOWDOWN_UNSUMMON_ANIMATIONS, missing_ms=100, label='unsummon')
+        timeline.call(lambda: log.info('showdown', "Starting victory dance!"), label='victory_dance')
+        timeline.animation(category='dancing!', loop=True, duration_ms=3000, missing_ms=3000)
+        timeline.on_finished = self.end_showdown_sequence
+        self.play_timeline(timeline)
+        self.log_unsummon_animation(timeline)
+    
+    def log_unsummon_animation(self, timeline):
+        """Print which unsummon animation a showdown ending timeline resolved to."""
+        unsummon_step = timeline.steps[0]
+        if unsummon_step.animation_name:
+            log.debug('showdown', "Found unsummon animation: %s (%sms)", unsummon_step.animation_name, unsummon_step.duration)
         else:
-            print("Showdown: Unsummon animation not found, skipping to dance")
-            unsummon_duration = 100  # Very short delay before dancing
-            
-        self.victory_transition_timer = QTimer()
-        self.victory_transition_timer.timeout.connect(self.start_victory_dance)
-        self.victory_transition_timer.setSingleShot(True)
-        self.victory_transition_timer.start(unsummon_duration)
-    
-    def start_victory_dance(self):
-        """Start the victory dance animation after unsummon completes."""
-        print("Showdown: Starting victory dance!")
-        
-        # Start dancing animation
-        dance_animations = self.animation_loader.get_animations_by_category('dancing!')
-        if dance_animations:
-            self.start_animation(dance_animations[0], loop=True)
-        
-        # Set timer to end the victory sequence after dancing for a while
-        self.victory_dance_timer = QTimer()
-        self.victory_dance_timer.timeout.connect(self.end_showdown_sequence)
-        self.victory_dance_timer.setSingleShot(True)
-        self.victory_dance_timer.start(3000)  # Dance for 3 seconds
+            log.warning('showdown', "Unsummon animation not found, ending after a short delay")
     
     def end_showdown_sequence(self):
         """End the Showdown sequence and return to normal behavior."""
-        print("Showdown: Ending sequence and cleaning up")
-        
-        # Stop shooting timer
-        if hasattr(self, 'showdown_shooting_timer'):
-            self.showdown_shooting_timer.stop()
-        
-        # Stop sliding timer
-        if hasattr(self, 'showdown_sliding_timer'):
-            self.showdown_sliding_timer.stop()
-        
-        # Stop difficulty progression timer
-        if hasattr(self, 'showdown_difficulty_timer'):
-            self.showdown_difficulty_timer.stop()
-        
-        # Stop strong shot timer
-        if hasattr(self, 'showdown_strong_shot_timer'):
-            self.showdown_strong_shot_timer.stop()
+        log.info('showdown', "Ending sequence and cleaning up")
         
-        # Stop victory sequence timers
-        if hasattr(self, 'victory_transition_timer'):
-            self.victory_transition_timer.stop()
-        if hasattr(self, 'victory_dance_timer'):
-            self.victory_dance_timer.stop()
-        
-        # Clean up any remaining heart bullets
-        for heart_bullet in self.showdown_heart_bullets:
-            if heart_bullet:
-                try:
-                    # Stop the bullet timer if it exists
-                    if hasattr(heart_bullet, 'bullet_timer'):
-                        heart_bullet.bullet_timer.stop()
-                    heart_bullet.hide()
-                    heart_bullet.deleteLater()
-                except RuntimeError as e:
-                    # Handle case where QLabel has already been deleted
-                    print(f"Warning: Heart bullet QLabel already deleted: {e}")
-        self.showdown_heart_bullets.clear()
-        
-        # Clean up any remaining strong bullets
-        for strong_bullet in getattr(self, 'showdown_strong_bullets', []):
-            if strong_bullet:
-                try:
-                    # Stop the bullet timer if it exists
-                    if hasattr(strong_bullet, 'bullet_timer'):
-                        strong_bullet.bullet_timer.stop()
-                    strong_bullet.hide()
-                    strong_bullet.deleteLater()
-                except RuntimeError as e:
-                    # Handle case where QLabel has already been deleted
-                    print(f"Warning: Strong bullet QLabel already deleted: {e}")
-        if hasattr(self, 'showdown_strong_bullets'):
-            self.showdown_strong_bullets.clear()
-        
-        # Reset state
-        self.is_character_interaction = False
-        self.in_showdown_sequence = False
+        # Leaving the state stops the shooting, sliding, difficulty, strong shot and
+        # simulation timers and the summon/unsummon/dance timeline if one is still playing
+        self.state.leave(MascotState.SHOWDOWN)
         self.showdown_phase = None
         
+        # Return any remaining bullets to their pools
+        self.release_showdown_bullets()
+        log.debug('showdown', "Bullet pool stats: %s", self.get_bullet_pool_stats())
+        
         # Reset speed multipliers and base intervals to prevent stacking between showdowns
         if hasattr(self, 'showdown_speed_multiplier'):
             self.showdown_speed_multiplier = 1
@@ -2462,132 +2347,50 @@ class DesktopMascot(QWidget):
         if sitting_animations:
             self.start_animation(sitting_animations[0])
     
-    def start_next_edward_animation(self):
-        """Start the next animation in the Edward Walking sequence."""
-        if self.edward_sequence_index < len(self.edward_sequence):
-            animation_name = self.edward_sequence[self.edward_sequence_index]
-            
-            # Check if animation exists
-            if self.animation_loader.animation_exists(animation_name):
-                # Mark that we're in Edward sequence to prevent logic interference
-                self.in_edward_sequence = True
-                
-                # Start the animation (don't loop for sequence)
-                self.start_animation(animation_name, loop=False)
-                
-                # Set up movement for walking animations
-                self.setup_edward_movement(animation_name)
-                
-                # Set up timer to move to next animation when current one finishes
-                animation_info = self.animation_loader.get_animation_info(animation_name)
-                if animation_info:
-                    # Calculate duration based on frame count and frame rate
-                    duration = animation_info['frame_count'] * animation_info['frame_rate']
-                    
-                    # Add some delay between animations
-                    if self.edward_sequence_index == 0:  # After grab
-                        duration += 500  # Extra pause after grabbing
-                    elif self.edward_sequence_index == len(self.edward_sequence) - 1:  # Before place
-                        duration += 800  # Longer pause for place animation to complete
-                    else:
-                        duration += 200  # Short pause between walking animations
-                    
-                    # Set timer for next animation
-                    QTimer.singleShot(int(duration), self.continue_edward_sequence)
-                else:
-                    # Fallback timing if animation info not available
-                    QTimer.singleShot(2000, self.continue_edward_sequence)
-            else:
-                print(f"Animation not found: {animation_name}")
-                self.continue_edward_sequence()
-        else:
-            # Sequence complete, return to normal behavior
-            self.end_edward_sequence()
-    
-    def setup_edward_movement(self, animation_name):
-        """Set up movement for Edward walking animations."""
-        # Stop any existing movement timer
-        if hasattr(self, 'edward_movement_timer'):
-            self.edward_movement_timer.stop()
-        
-        # Determine movement direction and set up timer
-        if 'up_walk' in animation_name:
-            self.edward_movement_direction = 'up'
-            self.start_edward_movement()
-        elif 'right_walk' in animation_name:
-            self.edward_movement_direction = 'right'
-            self.start_edward_movement()
-        elif 'down_walk' in animation_name:
-            self.edward_movement_direction = 'down'
-            self.start_edward_movement()
-        elif 'left_walk' in animation_name:
-            self.edward_movement_direction = 'left'
-            self.start_edward_movement()
-        else:
-            # Not a walking animation, no movement needed
-            self.edward_movement_direction = None
-    
-    def start_edward_movement(self):
-        """Start the movement timer for Edward walking."""
-        if not hasattr(self, 'edward_movement_timer'):
-            self.edward_movement_timer = QTimer()
-            self.edward_movement_timer.timeout.connect(self.update_edward_position)
-        
-        self.edward_movement_timer.start(50)  # Update every 50ms for smooth movement
-    
-    def update_edward_position(self):
-        """Update Edward's position during walking animations."""
-        if not hasattr(self, 'edward_movement_direction') or self.edward_movement_direction is None:
-            return
-        
-        # Movement speed (pixels per update)
-        speed = 4
-        current_pos = self.pos()
-        
-        # Calculate new position based on direction
-        if self.edward_movement_direction == 'up':
-            new_pos = QPoint(current_pos.x(), current_pos.y() - speed)
-        elif self.edward_movement_direction == 'right':
-            new_pos = QPoint(current_pos.x() + speed, current_pos.y())
-        elif self.edward_movement_direction == 'down':
-            new_pos = QPoint(current_pos.x(), current_pos.y() + speed)
-        elif self.edward_movement_direction == 'left':
-            new_pos = QPoint(current_pos.x() - speed, current_pos.y())
-        else:
+    # Walking direction of each Edward walking animation (pixels per 50ms tick)
+    EDWARD_WALK_VELOCITIES = {
+        'up_walk': (0, -4),
+        'right_walk': (4, 0),
+        'down_walk': (0, 4),
+        'left_walk': (-4, 0)
+    }
+    
+    def start_edward_sequence(self, sequence):
+        """Play the Edward Walking sequence: each animation once, walking during walk animations."""
+        # Mark that we're in Edward sequence to prevent logic interference
+        if not self.state.transition(MascotState.EDWARD):
             return
+        self.edward_sequence = sequence
+        
+        timeline = Timeline(self, 'edward')
+        for index, animation_name in enumerate(sequence):
+            # Add some delay between animations
+            if index == 0:  # After grab
+                extra_ms = 500  # Extra pause after grabbing
+            elif index == len(sequence) - 1:  # Before place
+                extra_ms = 800  # Longer pause for place animation to complete
+            else:
+                extra_ms = 200  # Short pause between walking animations
+            
+            # Walking animations also move Edward, staying within screen bounds
+            velocity = None
+            for walk, walk_velocity in self.EDWARD_WALK_VELOCITIES.items():
+                if walk in animation_name:
+                    velocity = walk_velocity
+                    break
+            timeline.animation(animation_name, extra_ms=extra_ms, velocity=velocity, tick_ms=50)
         
-        # Keep within screen bounds
-        from PyQt5.QtWidgets import QDesktopWidget
-        desktop = QDesktopWidget()
-        screen_rect = desktop.screenGeometry()
-        
-        # Ensure the mascot stays within screen bounds
-        if (new_pos.x() >= 0 and new_pos.x() + self.width() <= screen_rect.width() and
-            new_pos.y() >= 0 and new_pos.y() + self.height() <= screen_rect.height()):
-            self.move(new_pos)
-    
-    def continue_edward_sequence(self):
-        """Continue to the next animation in the Edward sequence."""
-        # Stop movement timer when transitioning to next animation
-        if hasattr(self, 'edward_movement_timer'):
-            self.edward_movement_timer.stop()
-        
-        self.edward_sequence_index += 1
-        self.start_next_edward_animation()
+        # Sequence complete, return to normal behavior
+        timeline.on_finished = self.end_edward_sequence
+        self.play_timeline(timeline)
     
     def end_edward_sequence(self):
         """End the Edward Walking sequence and return to normal behavior."""
-        # Stop movement timer
-        if hasattr(self, 'edward_movement_timer'):
-            self.edward_movement_timer.stop()
-        
-        self.is_character_interaction = False
-        self.in_edward_sequence = False  # Clear the flag
+        # Leaving the state stops the sequence if it is still playing
+        self.state.leave(MascotState.EDWARD)
         
         # Restart random walking if no other special modes are active
-        if (self.logic.random_walking_enabled and not self.logic.eternal_dance_mode and 
-            not self.logic.timed_dance_mode and not self.is_sleeping and 
-            not self.is_following_mouse and not getattr(self, 'is_falling', False)):
+        if self.logic.random_walking_enabled and not self.state.is_busy():
             self.logic.start_random_walking_system()
         
         # Return to idle animation
@@ -2596,8 +2399,7 @@ class DesktopMascot(QWidget):
             self.start_animation(sitting_animations[0])
         
         # Resume AFK behaviors after Edward sequence completes
-        import random
-        self.logic.random_walking_timer.start(random.randint(3000, 8000))
+        self.logic.random_walking_timer.start(self.random.randint(3000, 8000))
     
     def push_windows_in_path(self):
         """Detect and push windows that are in Clover's path during whale mail animation."""
@@ -2655,7 +2457,8 @@ class DesktopMascot(QWidget):
                 return True
             
             # Enumerate all windows
-            win32gui.EnumWindows(enum_windows_callback, [])
+            with trace.span('enum_windows', 'windows', caller='push_windows_in_path'):
+                win32gui.EnumWindows(enum_windows_callback, [])
             
         except Exception as e:
             # Silently handle any errors to avoid disrupting the animation
@@ -2717,7 +2520,8 @@ class DesktopMascot(QWidget):
                 return True
             
             # Enumerate all windows
-            win32gui.EnumWindows(enum_windows_callback, [])
+            with trace.span('enum_windows', 'windows', caller='push_windows_in_cart_path'):
+                win32gui.EnumWindows(enum_windows_callback, [])
             
         except Exception as e:
             # Silently handle any errors to avoid disrupting the animation
@@ -2750,6 +2554,10 @@ class DesktopMascot(QWidget):
     
     def fetch_and_display_meme(self):
         """Fetch a random Undertale Yellow meme from Google Images and display it."""
+        if not self.runtime.network_enabled:
+            # Simulated runs stay offline
+            self.display_meme_placeholder()
+            return
         try:
             # Start fetching meme in a separate thread to avoid blocking UI
             from PyQt5.QtCore import QThread, QObject, pyqtSignal
@@ -2774,7 +2582,9 @@ class DesktopMascot(QWidget):
                             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                         }
                         
-                        response = requests.get(search_url, headers=headers, timeout=10)
+                        trace.get_tracer().name_thread('meme-worker')
+                        with trace.span('meme_search', 'meme'):
+                            response = requests.get(search_url, headers=headers, timeout=10)
                         
                         if response.status_code == 200:
                             # Extract image URLs from the HTML
@@ -2782,18 +2592,21 @@ class DesktopMascot(QWidget):
                             
                             if img_urls:
                                 # Filter for reasonable sized images and pick a random one
-                                import random
-                                selected_url = random.choice(img_urls[:10])  # Use first 10 results
+                                import random as worker_random
+                                selected_url = worker_random.choice(img_urls[:10])  # Use first 10 results
                                 
                                 # Download the image
-                                img_response = requests.get(selected_url, headers=headers, timeout=10)
+                                with trace.span('meme_download', 'meme'):
+                                    img_response = requests.get(selected_url, headers=headers, timeout=10)
                                 if img_response.status_code == 200:
                                     from PyQt5.QtGui import QPixmap
                                     pixmap = QPixmap()
-                                    if pixmap.loadFromData(img_response.content):
+                                    with trace.span('meme_decode', 'meme', bytes=len(img_response.content)):
+                                        loaded = pixmap.loadFromData(img_response.content)
                                         # Scale image to reasonable size
-                                        if pixmap.width() > 600 or pixmap.height() > 600:
+                                        if loaded and (pixmap.width() > 600 or pixmap.height() > 600):
                                             pixmap = pixmap.scaled(600, 600, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                                    if loaded:
                                         self.meme_fetched.emit(pixmap)
                                         return
                         
@@ -2801,7 +2614,7 @@ class DesktopMascot(QWidget):
                         self.meme_fetched.emit(None)
                         
                     except Exception as e:
-                        print(f"Error in meme worker: {e}")
+                        log.error('meme', "Error in meme worker: %s", e)
                         self.meme_fetched.emit(None)
             
             # Create worker and thread
@@ -2819,7 +2632,7 @@ class DesktopMascot(QWidget):
             self.meme_thread.start()
             
         except Exception as e:
-            print(f"Error setting up meme fetching: {e}")
+            log.error('meme', "Error setting up meme fetching: %s", e)
             self.display_meme_placeholder()
     
     def display_meme_placeholder(self):
@@ -2827,10 +2640,7 @@ class DesktopMascot(QWidget):
         try:
             # Create meme display label if it doesn't exist
             if not self.meme_image_label:
-                self.meme_image_label = QLabel()
-                self.meme_image_label.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool)
-                self.meme_image_label.setAttribute(Qt.WA_TranslucentBackground)
-                self.meme_image_label.setStyleSheet("background: transparent;")
+                self.meme_image_label = self.create_sprite_widget(z=0)
             
             # Create a more elaborate Undertale Yellow themed meme placeholder
             placeholder_pixmap = QPixmap(300, 240)
@@ -2869,7 +2679,7 @@ class DesktopMascot(QWidget):
             self.meme_image_label.show()
             
         except Exception as e:
-            print(f"Error displaying meme placeholder: {e}")
+            log.error('meme', "Error displaying meme placeholder: %s", e)
     
     def on_meme_fetched(self, pixmap):
         """Handle the fetched meme image."""
@@ -2886,7 +2696,7 @@ class DesktopMascot(QWidget):
                 self.meme_thread.wait()
                 
         except Exception as e:
-            print(f"Error handling fetched meme: {e}")
+            log.error('meme', "Error handling fetched meme: %s", e)
             self.display_meme_placeholder()
     
     def display_fetched_meme(self, pixmap):
@@ -2894,10 +2704,7 @@ class DesktopMascot(QWidget):
         try:
             # Create meme display label if it doesn't exist
             if not self.meme_image_label:
-                self.meme_image_label = QLabel()
-                self.meme_image_label.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool)
-                self.meme_image_label.setAttribute(Qt.WA_TranslucentBackground)
-                self.meme_image_label.setStyleSheet("background: transparent;")
+                self.meme_image_label = self.create_sprite_widget(z=0)
             
             self.current_meme_pixmap = pixmap
             self.meme_image_label.setPixmap(self.current_meme_pixmap)
@@ -2905,23 +2712,21 @@ class DesktopMascot(QWidget):
             self.meme_image_label.show()
             
         except Exception as e:
-            print(f"Error displaying fetched meme: {e}")
+            log.error('meme', "Error displaying fetched meme: %s", e)
             self.display_meme_placeholder()
     
     def release_meme_in_center(self):
         """Release the meme at a random position along the route with click-to-dismiss functionality."""
         if self.meme_image_label and self.current_meme_pixmap:
             # Get screen dimensions
-            from PyQt5.QtWidgets import QDesktopWidget
-            desktop = QDesktopWidget()
-            screen_rect = desktop.screenGeometry()
+            screen_rect = self.snapshot.screen_geometry()
             
             # Position meme at random location along the cart's route
             # Use current cart position as base and add some randomness
-            random_offset_x = random.randint(-200, 200)
-            random_offset_y = random.randint(-150, 150)
+            random_offset_x = self.random.randint(-200, 200)
+            random_offset_y = self.random.randint(-150, 150)
             
-            meme_x = max(0, min(int(self.meme_cart_current_x) + random_offset_x, 
+            meme_x = max(0, min(self.x() + random_offset_x, 
                                screen_rect.width() - self.current_meme_pixmap.width()))
             meme_y = max(0, min(self.y() + random_offset_y, 
                                screen_rect.height() - self.current_meme_pixmap.height()))
@@ -2970,34 +2775,32 @@ class DesktopMascot(QWidget):
         # Stop all timers
         self.idle_timer.stop()
         self.animation_timer.stop()
-        if hasattr(self, 'zzz_timer'):
-            self.zzz_timer.stop()
-        
-        # Set dying state
-        self.is_character_interaction = True  # Prevent any interruptions
-        
-        # Start dying animation
-        dying_animations = self.animation_loader.get_animations_by_category('dying')
-        if dying_animations:
-            self.start_animation(dying_animations[0], loop=False)
-            # Set up timer to close after animation completes
-            # Dying animation has 50 frames, estimate duration
-            dying_anim = self.animation_loader.get_animation('dying')
-            if dying_anim:
-                frame_rate = dying_anim.get('frame_rate', 150)
-                total_duration = 50 * frame_rate  # 50 frames
-                QTimer.singleShot(total_duration + 500, self.force_close)  # Add 500ms buffer
-            else:
-                QTimer.singleShot(3000, self.force_close)  # Fallback 3 seconds
-        else:
-            # No dying animation found, close immediately
-            self.force_close()
+        
+        # Set dying state (prevents any interruptions)
+        self.state.transition(MascotState.DYING)
+        
+        # Play the dying animation once (plus a short pause on its last frame), then close
+        # (closes right away if there is no dying animation)
+        timeline = Timeline(self, 'dying')
+        timeline.animation(category='dying', extra_ms=500)
+        timeline.on_finished = self.force_close
+        self.play_timeline(timeline)
     
     def force_close(self):
         """Force close the application."""
+        # Stop any sequence still playing
+        self.cancel_timeline()
         # Clean up system tray icon
         if hasattr(self, 'tray_icon'):
             self.tray_icon.hide()
+        if self.hud:
+            self.hud.close()
+        self.sampler.stop()
+        if self.watchdog:
+            self.watchdog.stop()
+        # Tear down overlay windows
+        if self.overlay_compositor:
+            self.overlay_compositor.close()
         self.close()
         QApplication.quit()
     
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Memory - tracemalloc snapshots and a census of live Qt objects, diffed to find what keeps growing
+"""
+
+import gc
+import time
+import tracemalloc
+from PyQt5.QtWidgets import QApplication, QLabel
+from PyQt5.QtCore import QObject
+from PyQt5.QtGui import QPixmap, QImage
+from PyQt5 import sip
+import config
+from utils import log, trace
+
+class MemorySnapshot:
+    """What was alive at one moment: Qt objects by class, pixmaps and images, Python allocations."""
+
+    def __init__(self, census, allocations, traced):
+        self.taken_at = time.time()
+        self.census = census            # class name -> [count, bytes] (bytes only for pixmaps and images)
+        self.allocations = allocations  # tracemalloc.Snapshot
+        self.traced = traced            # (current, peak) bytes traced by tracemalloc
+
+
+class MemoryDiagnostics:
+    """Takes memory snapshots and diffs them, for finding leaks over a long session.
+
+    A snapshot counts every live QObject by class, found both through the
+    Python wrappers the garbage collector knows about and by walking the
+    children of the application and its top-level widgets (which finds
+    objects only C++ holds, like timers parented to a label), and counts
+    the QPixmaps and QImages held from Python or shown by labels with the
+    bytes they take (implicitly shared copies once). It also takes a
+    tracemalloc snapshot, starting tracemalloc (memory_trace_frames frames
+    per allocation) the first time, so later snapshots see allocations
+    since then.
+
+    The first snapshot is the baseline: each one after it is diffed
+    against the baseline (growth over the session) and the one before it
+    (growth since last time). Only those two are kept, since tracemalloc
+    snapshots are large. The census looks at every object the garbage
+    collector tracks, so snapshots are only taken when asked for.
+    """
+
+    def __init__(self):
+        self.baseline = None
+        self.previous = None
+        if config.get_setting('debug', 'memory_trace_on_startup', False):
+            self.start_tracing()
+
+    # tracemalloc
+    def start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(config.get_setting('debug', 'memory_trace_frames', 1))
+            log.info('memory', "tracemalloc started")
+
+    # Census
+    def census(self):
+        """Count live QObjects by class, and pixmaps and images with their bytes.
+
+        QObjects come from the garbage collector (anything with a Python
+        wrapper) and from walking the children of the application and its
+        top-level widgets, each counted once by its C++ address. Pixmaps and
+        images are counted once per shared image data (cacheKey), including
+        the ones labels show.
+        """
+        qobjects = {}  # C++ address -> object
+        images = {}    # (class, cacheKey) -> QPixmap or QImage
+        kinds = {}     # type -> 'qobject', 'image' or None, so each type is only checked once
+
+        for obj in gc.get_objects():
+            cls = type(obj)
+            kind = kinds.get(cls, False)
+            if kind is False:
+                kind = kinds[cls] = ('qobject' if issubclass(cls, QObject) else
+                                     'image' if issubclass(cls, (QPixmap, QImage)) else None)
+            if kind == 'qobject':
+                if not sip.isdeleted(obj):
+                    qobjects.setdefault(sip.unwrapinstance(obj), obj)
+            elif kind == 'image' and not obj.isNull():
+                images[(cls.__name__, obj.cacheKey())] = obj
+
+        app = QApplication.instance()
+        for root in ([app] + QApplication.topLevelWidgets() if app else []):
+            for obj in [root] + root.findChildren(QObject):
+                if not sip.isdeleted(obj):
+                    qobjects.setdefault(sip.unwrapinstance(obj), obj)
+
+        census = {}
+        for obj in qobjects.values():
+            entry = census.setdefault(type(obj).__name__, [0, 0])
+            entry[0] += 1
+            if isinstance(obj, QLabel):
+                pixmap = obj.pixmap()
+                if pixmap is not None and not pixmap.isNull():
+                    images[('QPixmap', pixmap.cacheKey())] = pixmap
+        for (name, key), image in images.items():
+            entry = census.setdefault(name, [0, 0])
+            entry[0] += 1
+            entry[1] += image.width() * image.height() * image.depth() // 8
+        return census
+
+    # Snapshots
+    def take(self):
+        """Take a snapshot; returns it with its diffs against the baseline and the previous one (None for the first)."""
+        with trace.span('memory_snapshot', 'diagnostics'):
+            self.start_tracing()
+            snapshot = MemorySnapshot(self.census(), tracemalloc.take_snapshot(), tracemalloc.get_traced_memory())
+        since_start = self.diff(self.baseline, snapshot) if self.baseline else None
+        since_previous = self.diff(self.previous, snapshot) if self.previous and self.previous is not self.baseline else None
+        if self.baseline is None:
+            self.baseline = snapshot
+        self.previous = snapshot
+        return snapshot, since_start, since_previous
+
+    def reset(self):
+        """Forget the baseline, so the next snapshot starts a new one."""
+        self.baseline = None
+        self.previous = None
+
+    def diff(self, older, newer, top=None):
+        """What changed between two snapshots: census classes that changed and the allocation sites that grew most."""
+        top = top or config.get_setting('debug', 'memory_diff_top_n', 15)
+        census = {}
+        for name in set(older.census) | set(newer.census):
+            before = older.census.get(name, (0, 0))
+            after = newer.census.get(name, (0, 0))
+            if before != after:
+                census[name] = {'count': after[0], 'count_diff': after[0] - before[0],
+                                'bytes': after[1], 'bytes_diff': after[1] - before[1]}
+        # Filtered here rather than with Snapshot.filter_traces(), which is slow on a whole snapshot
+        stats = [stat for stat in newer.allocations.compare_to(older.allocations, 'lineno')
+                 if (stat.size_diff or stat.count_diff) and not is_own_allocation(stat.traceback[0].filename)]
+        allocations = [{'where': str(stat.traceback[0]), 'size_diff': stat.size_diff,
+                        'count_diff': stat.count_diff, 'size': stat.size} for stat in stats[:top]]
+        return {
+            'seconds': newer.taken_at - older.taken_at,
+            'census': dict(sorted(census.items(), key=lambda item: (-abs(item[1]['count_diff']), item[0]))),
+            'allocations': allocations,
+            'traced_diff': newer.traced[0] - older.traced[0]
+        }
+
+    def format_diff(self, diff, top=None):
+        """Get a diff as lines of text, largest changes first."""
+        top = top or config.get_setting('debug', 'memory_diff_top_n', 15)
+        lines = [f"over {format_duration(diff['seconds'])}, Python allocations {format_bytes(diff['traced_diff'], True)}"]
+        if diff['census']:
+            lines.append(f"  {'class':<28} {'live':>7} {'change':>7} {'bytes':>10}")
+            for name, entry in list(diff['census'].items())[:top]:
+                size = format_bytes(entry['bytes_diff'], True) if entry['bytes'] or entry['bytes_diff'] else ''
+                lines.append(f"  {name[:28]:<28} {entry['count']:>7} {entry['count_diff']:>+7} {size:>10}")
+        else:
+            lines.append("  no change in live Qt objects")
+        for entry in diff['allocations']:
+            lines.append(f"  {format_bytes(entry['size_diff'], True):>10} {entry['count_diff']:>+7} blocks  {entry['where']}")
+        return lines
+
+    def format_census(self, snapshot, top=None):
+        """Get a snapshot's most common classes as lines of text."""
+        top = top or config.get_setting('debug', 'memory_diff_top_n', 15)
+        lines = [f"Python allocations {format_bytes(snapshot.traced[0])} (peak {format_bytes(snapshot.traced[1])})"]
+        for name, (count, size) in sorted(snapshot.census.items(), key=lambda item: -item[1][0])[:top]:
+            lines.append(f"  {name[:28]:<28} {count:>7} {format_bytes(size) if size else '':>10}")
+        return lines
+
+
+def is_own_allocation(filename):
+    """Whether an allocation site is the snapshots themselves (tracemalloc, this module) or the import system."""
+    return filename in (tracemalloc.__file__, __file__) or filename.startswith('<frozen importlib')
+
+def format_bytes(size, signed=False):
+    sign = ('+' if size >= 0 else '-') if signed else ''
+    size = abs(size)
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024 or unit == 'MiB':
+            return f"{sign}{size:.0f} {unit}" if unit == 'B' else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Metrics - Call counts, cost and lateness histograms and dropped frames for every timer callback
+"""
+
+import os
+import json
+import math
+import time
+from collections import deque
+from utils import trace
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+BUCKETS_PER_OCTAVE = 4  # Histogram resolution: bucket bounds grow by 2^(1/4) (about 19%)
+
+
+class Histogram:
+    """Log-bucketed histogram of microsecond values: constant memory, O(1) to record."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        bucket = int(math.log2(value + 1) * BUCKETS_PER_OCTAVE) if value > 0 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = self.count * p / 100
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.max, 2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE) - 1)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'max': self.max
+        }
+
+
+class CallbackMetrics:
+    """What one timer callback has cost: calls, cost and lateness (microseconds) and frames dropped."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.cost = Histogram()
+        self.lateness = Histogram()
+        self.dropped_frames = 0
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'total_cost_ms': self.cost.total / 1000,
+            'cost_us': self.cost.to_dict(),
+            'lateness_us': self.lateness.to_dict(),
+            'dropped_frames': self.dropped_frames
+        }
+
+
+class StallMetrics:
+    """How often and how long the GUI thread blocked the event loop (see core.watchdog)."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = Histogram()    # microseconds
+        self.recent = deque(maxlen=20)  # The latest stalls, with the stack they were stuck in
+
+    def record(self, seconds, stack=None):
+        self.count += 1
+        self.duration.add(seconds * 1e6)
+        self.recent.append({'at': time.time(), 'duration_ms': seconds * 1000, 'stack': stack})
+
+    def to_dict(self, elapsed):
+        return {
+            'count': self.count,
+            'per_hour': self.count / elapsed * 3600 if elapsed > 0 else 0.0,
+            'duration_us': self.duration.to_dict(),
+            'recent': list(self.recent)
+        }
+
+
+class BehaviorCost:
+    """What one behavior (or sequence) has cost while it was the active one."""
+
+    def __init__(self, name):
+        self.name = name
+        self.runs = 0
+        self.seconds = 0.0   # Runtime clock time it was active
+        self.cpu = 0.0       # CPU seconds (the process's, or the GUI thread's without psutil)
+        self.wakeups = 0     # Timer firings
+        self.frames = 0      # Sprite frames shown
+
+    def to_dict(self):
+        seconds = self.seconds
+        return {
+            'runs': self.runs,
+            'seconds': seconds,
+            'cpu_ms': self.cpu * 1000,
+            'wakeups': self.wakeups,
+            'frames': self.frames,
+            'cpu_ms_per_run': self.cpu * 1000 / self.runs if self.runs else 0.0,
+            'cpu_ms_per_minute': self.cpu * 1000 / seconds * 60 if seconds > 0 else 0.0,
+            'wakeups_per_second': self.wakeups / seconds if seconds > 0 else 0.0,
+            'fps': self.frames / seconds if seconds > 0 else 0.0
+        }
+
+
+class BehaviorCostAccounting:
+    """Charges CPU time, timer wakeups and frames to the active behavior.
+
+    MascotLogic switches the active behavior when it runs an AFK behavior,
+    the mascot when it plays a sequence nobody else claimed, and user
+    interaction switches back to 'idle'. A behavior is charged from the
+    switch to it until the next switch (so the quiet time after a walk
+    still counts as the walk). The counters are only read at switches and
+    snapshots: wakeups from the registry (one per MeteredTimer firing),
+    frames from frame_counter, which the mascot points at its count of
+    frames shown, and CPU from psutil's user + system time of the whole
+    process, so work a behavior starts on worker threads (meme search,
+    download and decode) counts too. Without psutil CPU falls back to the
+    GUI thread's time.thread_time().
+    """
+
+    IDLE = 'idle'
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.frame_counter = lambda: 0
+        self.costs = {}  # name -> BehaviorCost
+        self.active = self.IDLE
+        self.mark = None
+        self.starting = False  # Inside run(): switches are the behavior starting, not the user
+        self.process = psutil.Process() if PSUTIL_AVAILABLE else None
+        self.cpu_source = 'process' if self.process else 'gui_thread'
+
+    def cpu_time(self):
+        if self.process is not None:
+            times = self.process.cpu_times()
+            return times.user + times.system
+        return time.thread_time()
+
+    def read(self):
+        return (self.registry.clock.perf_counter(), self.cpu_time(), self.registry.wakeups, self.frame_counter())
+
+    def charge(self):
+        """Charge everything since the last switch to the active behavior."""
+        now = self.read()
+        if self.mark is not None:
+            cost = self.get(self.active)
+            cost.seconds += now[0] - self.mark[0]
+            cost.cpu += now[1] - self.mark[1]
+            cost.wakeups += now[2] - self.mark[2]
+            cost.frames += now[3] - self.mark[3]
+        self.mark = now
+
+    def switch(self, name):
+        """Make name the active behavior (None for idle), counting a run of it."""
+        if self.starting:
+            return
+        self.charge()
+        self.active = name or self.IDLE
+        if name:
+            self.get(name).runs += 1
+
+    def run(self, name, handler):
+        """Switch to name and start it with handler().
+
+        Behaviors start through the same mascot methods as the tray menu,
+        which report user interaction (switching to idle) or play sequences
+        (switching to those); while the handler runs that's the behavior
+        starting, so those switches are ignored.
+        """
+        self.switch(name)
+        self.starting = True
+        try:
+            handler()
+        finally:
+            self.starting = False
+
+    def get(self, name):
+        cost = self.costs.get(name)
+        if cost is None:
+            cost = self.costs[name] = BehaviorCost(name)
+        return cost
+
+    def snapshot(self):
+        """Get every behavior's totals and averages so far."""
+        self.charge()
+        return {name: cost.to_dict() for name, cost in self.costs.items()}
+
+
+class MetricsRegistry:
+    """Metrics for every callback of the timers a Runtime creates.
+
+    Runtime.create_timer() hands out MeteredTimers when metrics are
+    enabled (performance.enable_metrics), so every animation, movement,
+    bullet, poll and scheduler timer is measured without the call sites
+    knowing. Lateness is measured on the runtime's clock (so it is virtual
+    in a simulation) and cost with the real time.perf_counter(). GUI thread
+    stalls found by the watchdog are kept here too.
+    """
+
+    def __init__(self, clock, enabled=True):
+        self.clock = clock
+        self.enabled = enabled
+        self.callbacks = {}  # name -> CallbackMetrics
+        self.stalls = StallMetrics()
+        self.wakeups = 0     # Metered timer firings
+        self.behaviors = BehaviorCostAccounting(self)
+        self.started_at = time.time()
+
+    def get(self, name):
+        metrics = self.callbacks.get(name)
+        if metrics is None:
+            metrics = self.callbacks[name] = CallbackMetrics(name)
+        return metrics
+
+    def record_stall(self, seconds, stack=None):
+        self.stalls.record(seconds, stack)
+
+    def reset(self):
+        self.callbacks = {}
+        self.stalls = StallMetrics()
+        self.behaviors.costs = {}
+        self.started_at = time.time()
+
+    def snapshot(self):
+        """Get every callback's metrics, most expensive (total cost) first."""
+        ordered = sorted(self.callbacks.values(), key=lambda metrics: -metrics.cost.total)
+        elapsed = time.time() - self.started_at
+        return {
+            'since': self.started_at,
+            'seconds': elapsed,
+            'callbacks': {metrics.name: metrics.to_dict() for metrics in ordered},
+            'stalls': self.stalls.to_dict(elapsed),
+            'behaviors': self.behaviors.snapshot()
+        }
+
+    def format_table(self, top=15):
+        """Get the most expensive callbacks as lines of text."""
+        snapshot = self.snapshot()
+        lines = [f"{'callback':<48} {'calls':>7} {'total ms':>9} {'p50 us':>7} {'p99 us':>7} {'late p99':>9} {'dropped':>7}"]
+        for name, metrics in list(snapshot['callbacks'].items())[:top]:
+            lines.append(f"{name[-48:]:<48} {metrics['calls']:>7} {metrics['total_cost_ms']:>9.1f} "
+                         f"{metrics['cost_us']['p50']:>7.0f} {metrics['cost_us']['p99']:>7.0f} "
+                         f"{metrics['lateness_us']['p99'] / 1000:>7.1f}ms {metrics['dropped_frames']:>7}")
+        stalls = snapshot['stalls']
+        if stalls['count']:
+            lines.append(f"GUI stalls: {stalls['count']} ({stalls['per_hour']:.1f}/h), "
+                         f"p50 {stalls['duration_us']['p50'] / 1000:.0f} ms, max {stalls['duration_us']['max'] / 1000:.0f} ms")
+        return lines
+
+    def dump_json(self, path=None):
+        """Write the snapshot as JSON (to metrics.json in the config directory by default)."""
+        if path is None:
+            from utils.path_helper import get_config_path
+            path = os.path.join(get_config_path(), 'metrics.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return path
+
+
+def get_callback_name(slot):
+    """Readable name of a timer callback ('DesktopMascot.next_frame', ...)."""
+    func = getattr(slot, 'func', slot)  # functools.partial
+    return getattr(func, '__qualname__', None) or repr(func)
+
+
+class MeteredSignal:
+    """The timeout of a MeteredTimer: keeps the connected slots for the timer to call."""
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append((slot, None))
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self.slots = []
+        else:
+            self.slots = [entry for entry in self.slots if entry[0] != slot]
+
+
+class MeteredTimer:
+    """Wraps a QTimer (or VirtualTimer), measuring each callback it runs.
+
+    Tracks when the timer should fire next, so each firing records how
+    late it was and how many whole intervals (frames) that lateness
+    skipped. Callbacks are recorded under their own names unless the timer
+    was given one (the scheduler names its timers after the task, since
+    its slots are all the same lambda). Anything beyond the QTimer subset
+    used here is passed through to the wrapped timer.
+    """
+
+    def __init__(self, timer, registry, name=None):
+        self.timer = timer
+        self.registry = registry
+        self.name = name
+        self.timeout = MeteredSignal()
+        self.expected = None  # Clock time the timer should fire at
+        self.tracer = trace.get_tracer()  # Each callback is also a span while a trace is recording
+        timer.timeout.connect(self.fire)
+
+    def fire(self):
+        registry = self.registry
+        now = registry.clock.perf_counter()
+        interval = self.timer.interval() / 1000
+        lateness = max(0.0, now - self.expected) if self.expected is not None else 0.0
+        dropped = int(lateness // interval) if interval > 0 else 0
+        # A repeating timer is due again one interval from now; a single-shot one only if a slot restarts it
+        self.expected = None if self.timer.isSingleShot() else now + interval
+        registry.wakeups += 1
+
+        for index, (slot, metrics) in enumerate(self.timeout.slots):
+            if metrics is None:
+                metrics = registry.get(self.name or get_callback_name(slot))
+                self.timeout.slots[index] = (slot, metrics)
+            started = time.perf_counter()
+            try:
+                slot()
+            finally:
+                ended = time.perf_counter()
+                metrics.cost.add((ended - started) * 1e6)
+                metrics.lateness.add(lateness * 1e6)
+                if self.tracer.recording:
+                    self.tracer.complete(metrics.name, 'timer', started, ended, {'late_ms': lateness * 1000})
+                metrics.calls += 1
+                metrics.dropped_frames += dropped
+
+    # QTimer interface
+    def start(self, interval=None):
+        if interval is None:
+            self.timer.start()
+        else:
+            self.timer.start(interval)
+        self.expected = self.registry.clock.perf_counter() + self.timer.interval() / 1000
+
+    def stop(self):
+        self.timer.stop()
+        self.expected = None
+
+    def setInterval(self, interval):
+        self.timer.setInterval(interval)
+        if self.timer.isActive():
+            self.expected = self.registry.clock.perf_counter() + interval / 1000
+
+    def __getattr__(self, name):
+        return getattr(self.timer, name)
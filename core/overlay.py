@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Overlay Compositor - Draws many sprites in one transparent window per screen
+"""
+
+import bisect
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import Qt, QRect, QPoint, QSize
+from PyQt5.QtGui import QPainter, QColor
+
+class OverlayActor:
+    """A sprite drawn by the overlay compositor.
+
+    Mimics the small part of the QLabel API used for bullets and memes
+    (setPixmap, move, show, hide, deleteLater, ...) so callers don't have to
+    care whether they got a real top-level window or an overlay actor.
+    """
+
+    def __init__(self, compositor, z=0):
+        self.compositor = compositor
+        self.z = z
+        self._pixmap = None
+        self._pos = QPoint(0, 0)
+        self._size = QSize(0, 0)
+        self._visible = False
+        self._deleted = False
+        self._mouse_press_handler = None
+
+    # Geometry
+    def x(self):
+        return self._pos.x()
+
+    def y(self):
+        return self._pos.y()
+
+    def pos(self):
+        return QPoint(self._pos)
+
+    def width(self):
+        return self._size.width()
+
+    def height(self):
+        return self._size.height()
+
+    def size(self):
+        return QSize(self._size)
+
+    def geometry(self):
+        """Get the actor's rectangle in global (virtual desktop) coordinates."""
+        return QRect(self._pos, self._size)
+
+    def move(self, x, y=None):
+        """Move the actor to a global position."""
+        new_pos = QPoint(x) if y is None else QPoint(int(x), int(y))
+        if new_pos == self._pos:
+            return
+        old_geometry = self.geometry()
+        self._pos = new_pos
+        self.compositor.actor_geometry_changed(self, old_geometry)
+
+    def resize(self, width, height=None):
+        """Resize the actor (in logical pixels)."""
+        new_size = QSize(width) if height is None else QSize(int(width), int(height))
+        if new_size == self._size:
+            return
+        old_geometry = self.geometry()
+        self._size = new_size
+        self.compositor.actor_geometry_changed(self, old_geometry)
+
+    # Content
+    def pixmap(self):
+        return self._pixmap
+
+    def setPixmap(self, pixmap):
+        """Set the pixmap to draw; only the actor's area is repainted."""
+        self._pixmap = pixmap
+        self.compositor.invalidate(self.geometry())
+
+    def devicePixelRatioF(self):
+        """Get the devicePixelRatio of the screen the actor is on."""
+        return self.compositor.device_pixel_ratio_at(self._pos)
+
+    # Visibility
+    def isVisible(self):
+        return self._visible and not self._deleted
+
+    def isHidden(self):
+        return not self.isVisible()
+
+    def show(self):
+        if self._deleted or self._visible:
+            return
+        self._visible = True
+        self.compositor.actor_visibility_changed(self)
+
+    def hide(self):
+        if not self._visible:
+            return
+        self._visible = False
+        self.compositor.actor_visibility_changed(self)
+
+    def raise_(self):
+        """Bring the actor to the top of its z level."""
+        self.compositor.raise_actor(self)
+
+    def deleteLater(self):
+        """Remove the actor from the scene."""
+        if self._deleted:
+            return
+        self.hide()
+        self._deleted = True
+        self.compositor.remove_actor(self)
+
+    # Input
+    def setMouseTracking(self, enable):
+        """Kept for QLabel compatibility; actors only receive mouse presses."""
+        pass
+
+    @property
+    def mousePressEvent(self):
+        return self._mouse_press_handler
+
+    @mousePressEvent.setter
+    def mousePressEvent(self, handler):
+        """Assigning a press handler makes the actor clickable."""
+        self._mouse_press_handler = handler
+        self.compositor.actor_interactivity_changed(self)
+
+    def is_interactive(self):
+        return self._mouse_press_handler is not None
+
+
+class OverlayWindow(QWidget):
+    """Screen-sized, click-through, translucent window drawing the compositor's scene."""
+
+    def __init__(self, compositor, screen):
+        super().__init__()
+        self.compositor = compositor
+        self.overlay_screen = screen
+
+        self.setWindowFlags(
+            Qt.FramelessWindowHint |
+            Qt.WindowStaysOnTopHint |
+            Qt.Tool |
+            Qt.WindowTransparentForInput |
+            Qt.WindowDoesNotAcceptFocus
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setGeometry(screen.geometry())
+
+    def paintEvent(self, event):
+        """Draw every visible actor that intersects the repainted area."""
+        origin = self.geometry().topLeft()
+        dirty = event.rect().translated(origin)
+        painter = QPainter(self)
+        for actor in self.compositor.scene:
+            if not actor._visible or actor._pixmap is None:
+                continue
+            if actor.geometry().intersects(dirty):
+                painter.drawPixmap(actor._pos - origin, actor._pixmap)
+        painter.end()
+
+
+class OverlayHitProxy(QWidget):
+    """Invisible window over a clickable actor that routes presses back to the scene."""
+
+    def __init__(self, compositor):
+        super().__init__()
+        self.compositor = compositor
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+
+    def paintEvent(self, event):
+        # Nearly transparent fill so platforms that hit-test on alpha still deliver clicks
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 1))
+        painter.end()
+
+    def mousePressEvent(self, event):
+        actor = self.compositor.actor_at(event.globalPos())
+        if actor and actor.mousePressEvent:
+            actor.mousePressEvent(event)
+
+
+class OverlayCompositor:
+    """Keeps a z-ordered scene of sprites and draws them in one overlay window per screen.
+
+    Moving an actor only marks its old and new rectangles dirty; Qt coalesces
+    those into a single repaint per overlay window, instead of the window
+    manager moving one top-level window per sprite.
+    """
+
+    def __init__(self):
+        self.scene = []        # Actors sorted by z (stable insertion order within a level)
+        self._scene_keys = []  # Parallel list of z values for bisect
+        self.windows = {}      # QScreen -> OverlayWindow
+        self.hit_proxies = {}  # OverlayActor -> OverlayHitProxy
+
+        app = QApplication.instance()
+        app.screenAdded.connect(self.on_screens_changed)
+        app.screenRemoved.connect(self.on_screens_changed)
+        self.on_screens_changed()
+
+    def on_screens_changed(self, screen=None):
+        """Rebuild one overlay window per screen."""
+        screens = QApplication.screens()
+        for known_screen in list(self.windows):
+            if known_screen not in screens:
+                window = self.windows.pop(known_screen)
+                window.hide()
+                window.deleteLater()
+        for new_screen in screens:
+            if new_screen not in self.windows:
+                self.windows[new_screen] = OverlayWindow(self, new_screen)
+                new_screen.geometryChanged.connect(self.on_screen_geometry_changed)
+        self.update_window_visibility()
+
+    def on_screen_geometry_changed(self, geometry):
+        for screen, window in self.windows.items():
+            window.setGeometry(screen.geometry())
+        self.update_window_visibility()
+
+    # Scene management
+    def create_actor(self, z=0):
+        """Create an actor and add it to the scene (hidden until show() is called)."""
+        actor = OverlayActor(self, z)
+        index = bisect.bisect_right(self._scene_keys, z)
+        self.scene.insert(index, actor)
+        self._scene_keys.insert(index, z)
+        return actor
+
+    def remove_actor(self, actor):
+        if actor in self.scene:
+            index = self.scene.index(actor)
+            del self.scene[index]
+            del self._scene_keys[index]
+        proxy = self.hit_proxies.pop(actor, None)
+        if proxy:
+            proxy.hide()
+            proxy.deleteLater()
+        self.update_window_visibility()
+
+    def raise_actor(self, actor):
+        """Move an actor to the top of its z level."""
+        if actor not in self.scene:
+            return
+        index = self.scene.index(actor)
+        del self.scene[index]
+        del self._scene_keys[index]
+        index = bisect.bisect_right(self._scene_keys, actor.z)
+        self.scene.insert(index, actor)
+        self._scene_keys.insert(index, actor.z)
+        self.invalidate(actor.geometry())
+
+    def actor_at(self, global_pos):
+        """Hit test: get the topmost visible interactive actor under a global position."""
+        for actor in reversed(self.scene):
+            if actor.isVisible() and actor.is_interactive() and actor.geometry().contains(global_pos):
+                return actor
+        return None
+
+    # Change notifications from actors
+    def actor_geometry_changed(self, actor, old_geometry):
+        if actor._visible:
+            self.invalidate(old_geometry)
+            self.invalidate(actor.geometry())
+            self.update_hit_proxy(actor)
+
+    def actor_visibility_changed(self, actor):
+        self.update_window_visibility()
+        self.invalidate(actor.geometry())
+        self.update_hit_proxy(actor)
+
+    def actor_interactivity_changed(self, actor):
+        self.update_hit_proxy(actor)
+
+    def update_hit_proxy(self, actor):
+        """Keep an input window over clickable actors; overlays themselves ignore input."""
+        proxy = self.hit_proxies.get(actor)
+        if not actor.is_interactive() or not actor.isVisible():
+            if proxy:
+                proxy.hide()
+            return
+        if proxy is None:
+            proxy = OverlayHitProxy(self)
+            self.hit_proxies[actor] = proxy
+        proxy.setGeometry(actor.geometry())
+        if proxy.isHidden():
+            proxy.show()
+
+    # Painting
+    def invalidate(self, global_rect):
+        """Schedule a repaint of a global rectangle on every overlay it touches."""
+        if global_rect.isEmpty():
+            return
+        for window in self.windows.values():
+            window_geometry = window.geometry()
+            if window_geometry.intersects(global_rect):
+                window.update(global_rect.intersected(window_geometry).translated(-window_geometry.topLeft()))
+
+    def update_window_visibility(self):
+        """Only keep the overlays mapped while there is something to draw."""
+        needed = any(actor._visible for actor in self.scene)
+        for window in self.windows.values():
+            if needed and window.isHidden():
+                window.show()
+            elif not needed and not window.isHidden():
+                window.hide()
+    
+    def device_pixel_ratio_at(self, global_pos):
+        screen = QApplication.screenAt(global_pos) or QApplication.primaryScreen()
+        return screen.devicePixelRatio()
+
+    def actor_count(self):
+        return len(self.scene)
+
+    def close(self):
+        """Hide and delete all overlay windows."""
+        for proxy in self.hit_proxies.values():
+            proxy.hide()
+            proxy.deleteLater()
+        self.hit_proxies = {}
+        for window in self.windows.values():
+            window.hide()
+            window.deleteLater()
+        self.windows = {}
+        self.scene = []
+        self._scene_keys = []
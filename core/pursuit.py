@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Pursuit - Steering for follow-mouse: predicted target, smoothed heading, sticky facing and adaptive tick
+"""
+
+import math
+
+ON_COURSE = math.cos(math.radians(1))  # A heading within 1 degree of the aim is taken as on course
+
+
+class PursuitController:
+    """Steers the mascot towards the cursor.
+
+    The old follow_mouse moved straight at the cursor every 50 ms and
+    picked the walking animation from whichever axis was bigger, so near a
+    diagonal the animation restarted on almost every tick. This controller:
+
+    - aims where the cursor will be by the time the mascot gets there
+      (cursor velocity times the time to reach it, capped at max_lead;
+      below still_speed the cursor is taken as still and aimed at directly),
+    - turns the heading towards that point gradually (steering_time is
+      how long a full turn takes), so jitter in the cursor doesn't jerk the
+      mascot around; once on course there is no turn to compute,
+    - faces the cursor, only changing the facing to the other axis once
+      that axis leads by the hysteresis factor,
+    - asks for the next tick sooner when the cursor is near or moving fast
+      and later when it is far and still; movement is scaled by the real
+      time between ticks so the speed doesn't change with the tick rate.
+
+    It has no Qt dependencies so benchmarks/follow_benchmark.py can replay
+    cursor traces through it.
+    """
+
+    def __init__(self, min_interval=50, max_interval=120, hysteresis=0.3,
+                 steering_time=0.15, max_lead=0.5, near_distance=150, far_distance=600,
+                 fast_cursor_speed=1000, still_speed=30):
+        self.min_interval = min_interval        # ms between ticks when near or the cursor is fast
+        self.max_interval = max_interval        # ms between ticks when far and the cursor is still
+        self.hysteresis = hysteresis
+        self.steering_time = steering_time      # seconds
+        self.max_lead = max_lead                # seconds
+        self.near_distance = near_distance      # px
+        self.far_distance = far_distance        # px
+        self.fast_cursor_speed = fast_cursor_speed  # px/s
+        self.still_speed = still_speed          # px/s below which the cursor counts as still (hand jitter)
+        self.reset()
+
+    def reset(self):
+        """Forget the heading, facing and position (call when following starts)."""
+        self.heading = None      # Unit vector (hx, hy)
+        self.direction = None    # 'left', 'right', 'up' or 'down'
+        self.position = None     # Float position, so sub-pixel steps accumulate
+        self.placed = None       # The rounded position last returned
+        self.direction_changes = 0
+
+    def step(self, mascot_x, mascot_y, cursor_x, cursor_y, cursor_vx, cursor_vy, speed, dt):
+        """Advance one tick.
+
+        speed is in pixels per second and dt is the seconds since the last
+        tick. Returns (new_x, new_y, direction, next_interval_ms).
+        """
+        # Resync if something else moved the mascot (dragging, a sequence, ...)
+        if (mascot_x, mascot_y) != self.placed:
+            self.position = (float(mascot_x), float(mascot_y))
+        x, y = self.position
+
+        dx = cursor_x - x
+        dy = cursor_y - y
+        distance = math.hypot(dx, dy)
+        cursor_speed = math.hypot(cursor_vx, cursor_vy)
+
+        # Aim at where the cursor will be when we get there (a still cursor, jitter aside, is where it is)
+        if cursor_speed < self.still_speed or speed <= 0:
+            cursor_speed = 0.0
+            aim_x, aim_y, aim_distance = dx, dy, distance
+        else:
+            lead = distance / speed
+            if lead > self.max_lead:
+                lead = self.max_lead
+            aim_x = dx + cursor_vx * lead
+            aim_y = dy + cursor_vy * lead
+            aim_distance = math.hypot(aim_x, aim_y)
+
+        # Turn the heading towards the aim point (nothing to turn once it's on course)
+        heading = self.heading
+        if aim_distance > 0:
+            want_x, want_y = aim_x / aim_distance, aim_y / aim_distance
+            if heading is None or heading[0] * want_x + heading[1] * want_y > ON_COURSE:
+                heading = (want_x, want_y)
+            else:
+                blend = dt / self.steering_time if self.steering_time > dt else 1.0
+                hx = heading[0] + (want_x - heading[0]) * blend
+                hy = heading[1] + (want_y - heading[1]) * blend
+                length = math.hypot(hx, hy)
+                heading = (hx / length, hy / length) if length > 1e-9 else (want_x, want_y)
+            self.heading = heading
+
+        if heading is not None:
+            travel = speed * dt
+            reach = distance if distance > aim_distance else aim_distance
+            if travel > reach:
+                travel = reach
+            x += heading[0] * travel
+            y += heading[1] * travel
+            self.position = (x, y)
+
+        # Face the cursor itself (not the predicted point, which swings as the cursor speeds up and slows down)
+        self.update_direction(cursor_x - x, cursor_y - y)
+
+        placed_x, placed_y = self.placed = (round(x), round(y))
+        return placed_x, placed_y, self.direction, self.next_interval(distance, cursor_speed)
+
+    def update_direction(self, dx, dy):
+        """Pick the facing towards (dx, dy), sticking to the current axis until the other clearly leads."""
+        if dx == 0 and dy == 0:
+            return
+        horizontal = 'right' if dx > 0 else 'left'
+        vertical = 'down' if dy > 0 else 'up'
+        if self.direction in ('left', 'right'):
+            direction = vertical if abs(dy) > abs(dx) * (1 + self.hysteresis) else horizontal
+        elif self.direction in ('up', 'down'):
+            direction = horizontal if abs(dx) > abs(dy) * (1 + self.hysteresis) else vertical
+        else:
+            direction = horizontal if abs(dx) >= abs(dy) else vertical
+        if direction != self.direction:
+            if self.direction is not None:
+                self.direction_changes += 1
+            self.direction = direction
+
+    def next_interval(self, distance, cursor_speed):
+        """Milliseconds until the next tick: short when near or the cursor is fast, long when far and still."""
+        fast = self.fast_cursor_speed
+        if distance <= self.near_distance or 0 < fast <= cursor_speed:
+            return self.min_interval
+        if distance >= self.far_distance:
+            farness = 1.0
+        else:
+            farness = (distance - self.near_distance) / (self.far_distance - self.near_distance)
+        if cursor_speed and fast > 0:
+            farness *= 1.0 - cursor_speed / fast
+        return int(self.min_interval + (self.max_interval - self.min_interval) * farness)
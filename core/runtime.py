@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Runtime - Clock, timer factory and random number generator shared by the mascot's components
+"""
+
+import time
+import random
+import weakref
+from PyQt5.QtCore import QTimer
+from .input_snapshot import InputSnapshot
+from .metrics import MetricsRegistry, MeteredTimer
+import config
+
+class RealClock:
+    """Wall clock time (time.time) and a high resolution counter (time.perf_counter)."""
+
+    def time(self):
+        return time.time()
+
+    def perf_counter(self):
+        return time.perf_counter()
+
+
+class QtTimerFactory:
+    """Creates ordinary QTimers (and keeps weak references to count the active ones)."""
+
+    def __init__(self):
+        self.created = 0
+        self.timers = weakref.WeakSet()
+
+    def create(self, parent=None):
+        timer = QTimer(parent) if parent is not None else QTimer()
+        self.created += 1
+        self.timers.add(timer)
+        return timer
+
+    def get_stats(self):
+        timers = list(self.timers)
+        return {'created': self.created, 'alive': len(timers), 'active': sum(1 for timer in timers if timer.isActive())}
+
+
+class Runtime:
+    """Where the mascot gets the time, its timers and its random numbers from.
+
+    DesktopMascot, MascotLogic and EventHandler (and the timelines,
+    schedulers and bullet pools they create) take one of these instead of
+    calling time.time(), QTimer() and the random module directly (and
+    read the cursor and screen size through its InputSnapshot). Timers
+    are wrapped so their callbacks are measured in the MetricsRegistry. The
+    default runtime uses the real clock, real QTimers and the global random
+    module; core.virtual_time builds one on a simulated clock so hours of
+    behavior can be replayed in seconds.
+    """
+
+    def __init__(self, clock=None, timers=None, rng=None, network_enabled=True, snapshot=None, realtime=True):
+        self.clock = clock or RealClock()
+        self.timers = timers or QtTimerFactory()
+        self.random = rng or random
+        self.network_enabled = network_enabled  # False skips meme downloads
+        self.realtime = realtime  # False when the clock is simulated (no real-time watchdog)
+        self.snapshot = snapshot or InputSnapshot(self.clock)  # Shared cursor and screen samples
+        self.metrics = MetricsRegistry(self.clock, config.get_setting('performance', 'enable_metrics', True))
+
+    def create_timer(self, parent=None, name=None):
+        """Create a timer; name is what its callbacks are recorded as in the metrics (their own names by default)."""
+        timer = self.timers.create(parent)
+        if self.metrics.enabled:
+            return MeteredTimer(timer, self.metrics, name)
+        return timer
+
+
+_default_runtime = None
+
+def get_default_runtime():
+    """Get the shared real-time runtime."""
+    global _default_runtime
+    if _default_runtime is None:
+        _default_runtime = Runtime()
+    return _default_runtime
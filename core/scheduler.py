@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Task Scheduler - Cancellable delayed callbacks grouped by behavior scope
+"""
+
+from .runtime import get_default_runtime
+
+class ScheduledTask:
+    """Handle to a pending delayed callback."""
+
+    def __init__(self, scheduler, scope, generation, callback, name):
+        self.scheduler = scheduler
+        self.scope = scope
+        self.generation = generation  # Scope generation the task was scheduled in
+        self.callback = callback
+        self.name = name
+        self.timer = None
+        self.fired = False
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancel the task if it hasn't run yet."""
+        self.scheduler.cancel(self)
+
+    def is_pending(self):
+        return not self.fired and not self.cancelled
+
+
+class TaskScheduler:
+    """Replacement for QTimer.singleShot that hands out cancellable tasks.
+
+    Every task belongs to a scope (e.g. 'afk' or 'walking'). cancel_scope()
+    stops all of a scope's pending tasks and bumps the scope's generation,
+    so a callback from an older generation is dropped even if its timer
+    already fired. Counters: scheduled, fired, cancelled (stopped before
+    their timer fired) and suppressed (stale callbacks that were dropped,
+    cancelled ones included).
+    """
+
+    def __init__(self, runtime=None):
+        self.runtime = runtime or get_default_runtime()
+        self.generations = {}  # scope -> generation token
+        self.pending = {}      # scope -> set of pending tasks
+
+        self.scheduled_count = 0
+        self.fired_count = 0
+        self.cancelled_count = 0
+        self.suppressed_count = 0
+
+    def schedule(self, delay_ms, callback, scope='default', name=None):
+        """Run callback once after delay_ms; returns a ScheduledTask handle."""
+        task = ScheduledTask(self, scope, self.generations.get(scope, 0), callback,
+                             name or getattr(callback, '__name__', 'task'))
+        task.timer = self.runtime.create_timer(name=f"{scope}:{task.name}")
+        task.timer.setSingleShot(True)
+        task.timer.timeout.connect(lambda: self.fire(task))
+        self.pending.setdefault(scope, set()).add(task)
+        self.scheduled_count += 1
+        task.timer.start(int(delay_ms))
+        return task
+
+    def fire(self, task):
+        self.pending.get(task.scope, set()).discard(task)
+        task.timer = None
+        if task.cancelled or task.generation != self.generations.get(task.scope, 0):
+            # Scheduled before its scope was cancelled
+            task.cancelled = True
+            self.suppressed_count += 1
+            return
+        task.fired = True
+        self.fired_count += 1
+        task.callback()
+
+    def cancel(self, task):
+        """Cancel one task."""
+        if not task.is_pending():
+            return
+        task.cancelled = True
+        if task.timer:
+            task.timer.stop()
+            task.timer = None
+        self.pending.get(task.scope, set()).discard(task)
+        self.cancelled_count += 1
+        self.suppressed_count += 1
+
+    def cancel_scope(self, scope):
+        """Cancel every pending task of a scope and invalidate older callbacks."""
+        self.generations[scope] = self.generations.get(scope, 0) + 1
+        for task in list(self.pending.get(scope, ())):
+            self.cancel(task)
+
+    def cancel_scopes(self, scopes):
+        for scope in scopes:
+            self.cancel_scope(scope)
+
+    def pending_count(self, scope=None):
+        if scope is not None:
+            return len(self.pending.get(scope, ()))
+        return sum(len(tasks) for tasks in self.pending.values())
+
+    def get_stats(self):
+        """Get scheduler counters."""
+        return {
+            'scheduled': self.scheduled_count,
+            'fired': self.fired_count,
+            'cancelled': self.cancelled_count,
+            'suppressed': self.suppressed_count,
+            'pending': self.pending_count()
+        }
@@ -13,12 +13,15 @@ import config
 class AFKBehaviorSettingsDialog(QDialog):
     """Dialog for configuring which AFK behaviors are enabled."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, behavior_costs=None):
         super().__init__(parent)
         self.setWindowTitle("AFK Behavior Settings")
         self.setModal(True)
         self.resize(400, 500)
         
+        # Measured cost of each AFK behavior so far (see BehaviorCostAccounting)
+        self.behavior_costs = behavior_costs or {}
+        
         # Store original settings for cancel functionality
         self.original_settings = {}
         for key in config.AFK_BEHAVIOR_SETTINGS:
@@ -45,6 +48,12 @@ class AFKBehaviorSettingsDialog(QDialog):
         desc_label.setStyleSheet("margin: 5px 10px; color: #666;")
         layout.addWidget(desc_label)
         
+        if self.behavior_costs:
+            cost_label = QLabel("Under each behavior: its average cost while running, measured since Clover started.")
+            cost_label.setWordWrap(True)
+            cost_label.setStyleSheet("margin: 0px 10px 5px 10px; color: #666; font-size: 11px;")
+            layout.addWidget(cost_label)
+        
         # Scroll area for checkboxes
         scroll_area = QScrollArea()
         scroll_widget = QWidget()
@@ -93,18 +102,22 @@ class AFKBehaviorSettingsDialog(QDialog):
         self.walking_cb = QCheckBox("Walking & Running")
         self.walking_cb.setToolTip("Clover will randomly walk and run around the screen")
         group_layout.addWidget(self.walking_cb)
+        self.add_cost_label(group_layout, 'walk')
         
         self.mouse_following_cb = QCheckBox("Mouse Following")
         self.mouse_following_cb.setToolTip("Clover will briefly follow the mouse cursor")
         group_layout.addWidget(self.mouse_following_cb)
+        self.add_cost_label(group_layout, 'follow_mouse')
         
         self.cart_rides_cb = QCheckBox("Cart Rides")
         self.cart_rides_cb.setToolTip("Clover will ride in carts across the screen")
         group_layout.addWidget(self.cart_rides_cb)
+        self.add_cost_label(group_layout, 'cart')
         
         self.whale_mail_cb = QCheckBox("Whale Mail Delivery")
         self.whale_mail_cb.setToolTip("Clover will deliver mail via whale")
         group_layout.addWidget(self.whale_mail_cb)
+        self.add_cost_label(group_layout, 'whale_mail')
         
         layout.addWidget(group)
     
@@ -116,18 +129,22 @@ class AFKBehaviorSettingsDialog(QDialog):
         self.sitting_cb = QCheckBox("Sitting Animations")
         self.sitting_cb.setToolTip("Clover will sit in various poses")
         group_layout.addWidget(self.sitting_cb)
+        self.add_cost_label(group_layout, 'sit')
         
         self.dancing_cb = QCheckBox("Dancing")
         self.dancing_cb.setToolTip("Clover will perform dance animations")
         group_layout.addWidget(self.dancing_cb)
+        self.add_cost_label(group_layout, 'dance')
         
         self.sleeping_cb = QCheckBox("Sleeping")
         self.sleeping_cb.setToolTip("Clover will lie down and sleep with ZZZ animations")
         group_layout.addWidget(self.sleeping_cb)
+        self.add_cost_label(group_layout, 'sleep')
         
         self.falling_cb = QCheckBox("Falling")
         self.falling_cb.setToolTip("Clover will fall down and get back up")
         group_layout.addWidget(self.falling_cb)
+        self.add_cost_label(group_layout, 'fall')
         
         layout.addWidget(group)
     
@@ -139,10 +156,12 @@ class AFKBehaviorSettingsDialog(QDialog):
         self.character_interactions_cb = QCheckBox("Character Interactions")
         self.character_interactions_cb.setToolTip("Clover will interact with other characters")
         group_layout.addWidget(self.character_interactions_cb)
+        self.add_cost_label(group_layout, 'character')
         
         self.minigames_cb = QCheckBox("Minigames")
         self.minigames_cb.setToolTip("Clover will play various minigames")
         group_layout.addWidget(self.minigames_cb)
+        self.add_cost_label(group_layout, 'minigame')
         
         layout.addWidget(group)
     
@@ -159,6 +178,20 @@ class AFKBehaviorSettingsDialog(QDialog):
         
         layout.addWidget(group)
     
+    def add_cost_label(self, layout, behavior_name):
+        """Show what an AFK behavior has cost on average (nothing if costs weren't passed in)."""
+        if not self.behavior_costs:
+            return
+        cost = self.behavior_costs.get(behavior_name)
+        if not cost or not cost['runs']:
+            text = "Not measured yet"
+        else:
+            text = (f"~{cost['cpu_ms_per_minute']:.0f} ms CPU/min, {cost['wakeups_per_second']:.1f} wakeups/s, "
+                    f"{cost['fps']:.1f} fps ({cost['runs']} runs, {cost['cpu_ms_per_run']:.0f} ms CPU each)")
+        label = QLabel(text)
+        label.setStyleSheet("margin-left: 22px; color: #888; font-size: 11px;")
+        layout.addWidget(label)
+    
     def load_current_settings(self):
         """Load current settings into the checkboxes."""
         self.walking_cb.setChecked(config.get_setting('afk_behavior', 'enable_walking', True))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Showdown Simulation - Fixed-timestep heart bullet simulation on NumPy arrays
+"""
+
+import numpy as np
+
+# Bullet speeds and animation frames are defined per 30 ms step; a tick may catch up on a few late steps
+SIMULATION_STEP_MS = 30
+MAX_CATCHUP_STEPS = 5
+
+def swept_circle_hits(start, end, radius):
+    """Segment-vs-circle test for many moving points against a circle at the origin.
+
+    start and end are (n, 2) arrays of positions relative to the circle's
+    center at the start and end of a step. Returns a boolean mask of the
+    segments that come within radius of the center at any point, so fast
+    bullets cannot skip over the cursor between two samples.
+    """
+    segment = end - start
+    length_squared = np.einsum('ij,ij->i', segment, segment)
+    # Parameter of the closest point on each segment, clamped to the segment
+    t = -np.einsum('ij,ij->i', start, segment) / np.where(length_squared > 0, length_squared, 1.0)
+    np.clip(t, 0.0, 1.0, out=t)
+    closest = start + segment * t[:, None]
+    return np.einsum('ij,ij->i', closest, closest) <= radius * radius
+
+def interpolate_point(start, end, start_time, end_time, at_time):
+    """Linearly interpolate an (x, y) sample pair at a time between their timestamps."""
+    if end_time <= start_time:
+        return end
+    t = min(1.0, max(0.0, (at_time - start_time) / (end_time - start_time)))
+    return (start[0] + (end[0] - start[0]) * t, start[1] + (end[1] - start[1]) * t)
+
+class ShowdownStepResult:
+    """Outcome of one simulation step (arrays of bullet slot indices)."""
+
+    def __init__(self, moved, hits, culled, frame_changed):
+        self.moved = moved                  # Slots that were alive and moved this step
+        self.hits = hits                    # Slots whose bullet hit the cursor
+        self.culled = culled                # Slots removed for going off screen or too far
+        self.frame_changed = frame_changed  # Slots whose animation frame advanced
+
+
+class ShowdownSimulation:
+    """Holds every heart bullet in flat NumPy arrays and advances them all at once.
+
+    Positions, velocities, animation frames and travelled distances live in
+    parallel arrays indexed by slot. One step moves all live bullets, culls
+    those off screen or past their range and tests them against the cursor
+    using squared distances, so the per-tick cost grows slowly with the
+    number of bullets instead of one timer and closure per bullet.
+
+    The cursor test is swept: each bullet's path during the step is checked
+    against the cursor's path, so hits stay exact however long a step is.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.free_slots = []
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Grow the entity arrays to hold at least capacity bullets."""
+        old_capacity = self.capacity
+        if capacity <= old_capacity:
+            return
+
+        def grow(array, shape, dtype, fill=0):
+            grown = np.full(shape, fill, dtype=dtype)
+            if array is not None:
+                grown[:old_capacity] = array
+            return grown
+
+        self.position = grow(getattr(self, 'position', None), (capacity, 2), np.float64)
+        self.velocity = grow(getattr(self, 'velocity', None), (capacity, 2), np.float64)
+        self.half_size = grow(getattr(self, 'half_size', None), (capacity, 2), np.float64)
+        self.speed = grow(getattr(self, 'speed', None), capacity, np.float64)
+        self.travelled = grow(getattr(self, 'travelled', None), capacity, np.float64)
+        self.max_distance = grow(getattr(self, 'max_distance', None), capacity, np.float64)
+        self.frame = grow(getattr(self, 'frame', None), capacity, np.int32)
+        self.frame_time = grow(getattr(self, 'frame_time', None), capacity, np.float64)
+        self.last_frame = grow(getattr(self, 'last_frame', None), capacity, np.int32)
+        self.alive = grow(getattr(self, 'alive', None), capacity, np.bool_, False)
+
+        # Hand out low slots first
+        self.free_slots.extend(range(capacity - 1, old_capacity - 1, -1))
+        self.capacity = capacity
+
+    def spawn(self, x, y, velocity_x, velocity_y, max_distance, width, height, frame_count):
+        """Add a bullet and return its slot index."""
+        if not self.free_slots:
+            self.allocate(max(1, self.capacity * 2))
+        slot = self.free_slots.pop()
+
+        self.position[slot] = (x, y)
+        self.velocity[slot] = (velocity_x, velocity_y)
+        self.half_size[slot] = (width // 2, height // 2)
+        self.speed[slot] = (velocity_x * velocity_x + velocity_y * velocity_y) ** 0.5
+        self.travelled[slot] = 0.0
+        self.max_distance[slot] = max_distance
+        self.frame[slot] = 0
+        self.frame_time[slot] = 0.0
+        self.last_frame[slot] = max(0, frame_count - 1)
+        self.alive[slot] = True
+        return slot
+
+    def kill(self, slot):
+        """Remove a bullet from the simulation."""
+        if self.alive[slot]:
+            self.alive[slot] = False
+            self.free_slots.append(slot)
+
+    def clear(self):
+        """Remove every bullet."""
+        for slot in np.flatnonzero(self.alive).tolist():
+            self.kill(slot)
+
+    def active_slots(self):
+        """Get the slots of all live bullets."""
+        return np.flatnonzero(self.alive)
+
+    def active_count(self):
+        return self.capacity - len(self.free_slots)
+
+    def step(self, cursor_start, cursor_end, bounds, hit_radius, dt=1.0):
+        """Advance every live bullet by one step of dt base steps (30 ms each).
+
+        cursor_start and cursor_end are the cursor positions at the start and
+        end of the step; the cursor is assumed to move in a straight line in
+        between. bounds is (left, top, right, bottom); bullets whose top-left
+        corner leaves it are culled, like bullets that travelled past
+        max_distance. A bullet hits when its center passes within hit_radius
+        of the cursor at any time during the step.
+        """
+        moved = np.flatnonzero(self.alive)
+        if moved.size == 0:
+            empty = moved
+            return ShowdownStepResult(empty, empty, empty, empty)
+
+        # Animation frames play once (one frame per base step) and then stay on the last frame
+        self.frame_time[moved] += dt
+        frames = np.minimum(self.frame_time[moved].astype(np.int32), self.last_frame[moved])
+        frame_changed = moved[frames != self.frame[moved]]
+        self.frame[moved] = frames
+
+        # Movement
+        centers_before = self.position[moved] + self.half_size[moved]
+        self.position[moved] += self.velocity[moved] * dt
+        self.travelled[moved] += self.speed[moved] * dt
+        position = self.position[moved]
+
+        # Swept cursor hit test, in the cursor's frame of reference
+        relative_start = centers_before - cursor_start
+        relative_end = position + self.half_size[moved] - cursor_end
+        hit_mask = swept_circle_hits(relative_start, relative_end, hit_radius)
+        hits = moved[hit_mask]
+
+        # Off-screen and range culling
+        left, top, right, bottom = bounds
+        out_mask = ((self.travelled[moved] > self.max_distance[moved]) |
+                    (position[:, 0] < left) | (position[:, 0] > right) |
+                    (position[:, 1] < top) | (position[:, 1] > bottom))
+        culled = moved[out_mask & ~hit_mask]
+
+        for slot in hits.tolist():
+            self.kill(slot)
+        for slot in culled.tolist():
+            self.kill(slot)
+
+        return ShowdownStepResult(moved, hits, culled, frame_changed)
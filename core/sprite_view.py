@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Sprite View - Paints the mascot sprite and repaints only what changed
+"""
+
+import time
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter
+
+class SpriteView(QWidget):
+    """Widget that draws a single pixmap, supporting partial (dirty rectangle) repaints."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pixmap = None
+        
+        # Statistics about how much of the sprite is actually repainted
+        self.full_repaints = 0
+        self.partial_repaints = 0
+        self.skipped_repaints = 0
+        self.paint_count = 0
+        self.paint_time = 0.0  # Seconds spent in paintEvent
+    
+    def pixmap(self):
+        """Get the currently displayed pixmap."""
+        return self._pixmap
+    
+    def setPixmap(self, pixmap, dirty_rect=None):
+        """Display a pixmap.
+        
+        If dirty_rect is given and the sprite keeps its size, only that area is
+        repainted; an empty rect means the new frame is identical to the old one.
+        """
+        previous = self._pixmap
+        self._pixmap = pixmap
+        
+        same_size = (previous is not None and
+                     previous.size() == pixmap.size() and
+                     previous.devicePixelRatio() == pixmap.devicePixelRatio())
+        
+        if dirty_rect is None or not same_size:
+            self.full_repaints += 1
+            self.update()
+        elif dirty_rect.isEmpty():
+            self.skipped_repaints += 1
+        else:
+            self.partial_repaints += 1
+            self.update(dirty_rect)
+    
+    def paintEvent(self, event):
+        """Draw the pixmap; Qt clips painting to the dirty region."""
+        if self._pixmap is None or self._pixmap.isNull():
+            return
+        started = time.perf_counter()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+        self.paint_count += 1
+        self.paint_time += time.perf_counter() - started
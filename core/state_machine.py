@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+State Machine - The mascot's current mode, its allowed transitions and the timers each mode owns
+"""
+
+import time
+from enum import Enum
+import config
+from utils import log, trace
+
+class MascotState(Enum):
+    """Everything the mascot can be doing; IDLE is the only state AFK behaviors run in."""
+    IDLE = 'idle'
+    FOLLOWING_MOUSE = 'following_mouse'
+    SLEEPING = 'sleeping'
+    FALLING = 'falling'
+    ETERNAL_DANCE = 'eternal_dance'
+    TIMED_DANCE = 'timed_dance'
+    CHARACTER_INTERACTION = 'character_interaction'
+    RIDING = 'riding'              # Cart, meme cart and whale mail
+    HIDE_SEEK = 'hide_seek'
+    SHOWDOWN = 'showdown'
+    EDWARD = 'edward'
+    DYING = 'dying'
+
+
+# Modes that any other mode (or the user) may interrupt
+MODE_STATES = frozenset([
+    MascotState.FOLLOWING_MOUSE, MascotState.SLEEPING, MascotState.FALLING,
+    MascotState.ETERNAL_DANCE, MascotState.TIMED_DANCE, MascotState.CHARACTER_INTERACTION
+])
+
+# Scripted sequences: they run until they end themselves (or the app exits)
+SEQUENCE_STATES = frozenset([
+    MascotState.RIDING, MascotState.HIDE_SEEK, MascotState.SHOWDOWN, MascotState.EDWARD
+])
+
+# Allowed transitions: state -> states it may change to
+TRANSITIONS = {MascotState.IDLE: frozenset(MascotState)}
+for _state in MODE_STATES:
+    TRANSITIONS[_state] = frozenset(MascotState)
+for _state in SEQUENCE_STATES:
+    TRANSITIONS[_state] = frozenset([MascotState.IDLE, MascotState.DYING])
+TRANSITIONS[MascotState.DYING] = frozenset()
+
+
+class MascotStateMachine:
+    """Single source of truth for what the mascot is doing.
+
+    Replaces the old is_sleeping / is_following_mouse / in_*_sequence /
+    *_dance_mode flags. Changing state runs the old state's exit hooks and
+    stops the timers it owns, then runs the new state's enter hooks, so a
+    mode's timers can't keep running after the mode has ended. Whether the
+    mascot is busy (any state but IDLE, or being dragged) is kept up to date
+    on every change, so guard checks are a single attribute lookup.
+    """
+
+    def __init__(self):
+        self.state = MascotState.IDLE
+        self.dragging = False  # Dragging can happen in any state
+        self.busy = False
+
+        self.enter_hooks = {}   # state -> callbacks run after entering it
+        self.exit_hooks = {}    # state -> callbacks run before leaving it
+        self.owned_timers = {}  # state -> {name: QTimer} stopped when leaving it
+
+        self.transition_count = 0
+
+    # Hooks
+    def on_enter(self, states, callback):
+        """Run callback whenever one of states is entered."""
+        for state in self.as_states(states):
+            self.enter_hooks.setdefault(state, []).append(callback)
+
+    def on_exit(self, states, callback):
+        """Run callback whenever one of states is left."""
+        for state in self.as_states(states):
+            self.exit_hooks.setdefault(state, []).append(callback)
+
+    def own_timer(self, state, name, timer):
+        """Make state own a timer: it is stopped whenever state is left.
+
+        Registering a timer under a name that is already owned replaces the
+        old one, so timers that are recreated for each visit don't pile up.
+        """
+        self.owned_timers.setdefault(state, {})[name] = timer
+        return timer
+
+    def as_states(self, states):
+        return [states] if isinstance(states, MascotState) else states
+
+    # Transitions
+    def can_enter(self, new_state):
+        return new_state is self.state or new_state in TRANSITIONS[self.state]
+
+    def transition(self, new_state):
+        """Change to new_state; returns False (and changes nothing) if that isn't allowed."""
+        old_state = self.state
+        if new_state is old_state:
+            return True
+        if new_state not in TRANSITIONS[old_state]:
+            log.debug('state', "State: %s -> %s not allowed", old_state.value, new_state.value)
+            return False
+
+        tracer = trace.get_tracer()
+        recording = tracer.recording
+        if recording:
+            started = time.perf_counter()
+
+        for callback in self.exit_hooks.get(old_state, ()):
+            callback()
+        for timer in self.owned_timers.get(old_state, {}).values():
+            timer.stop()
+
+        self.state = new_state
+        self.busy = new_state is not MascotState.IDLE or self.dragging
+        self.transition_count += 1
+        if config.get_setting('debug', 'log_behavior_changes', False):
+            log.info('state', "State: %s -> %s", old_state.value, new_state.value)
+
+        for callback in self.enter_hooks.get(new_state, ()):
+            callback()
+
+        if recording:
+            # The transition (with its hooks) as a span, and each state as a slice on a 'state' track
+            tracer.complete('transition', 'state', started, time.perf_counter(),
+                            {'from': old_state.value, 'to': new_state.value})
+            tracer.async_end(old_state.value, 'state', 1)
+            tracer.async_begin(new_state.value, 'state', 1)
+        return True
+
+    def leave(self, state):
+        """Return to IDLE if currently in state (no-op otherwise)."""
+        if self.state is state:
+            return self.transition(MascotState.IDLE)
+        return False
+
+    def reset_mode(self):
+        """Return to IDLE from an interruptible mode; scripted sequences keep running."""
+        if self.state in MODE_STATES:
+            self.transition(MascotState.IDLE)
+
+    def set_dragging(self, dragging):
+        self.dragging = dragging
+        self.busy = self.state is not MascotState.IDLE or dragging
+
+    # Queries
+    def is_in(self, *states):
+        return self.state in states
+
+    def is_busy(self):
+        """True unless the mascot is idle and not being dragged."""
+        return self.busy
+
+    def get_state_name(self):
+        return self.state.value
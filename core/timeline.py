@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Timeline - Declarative multi-phase sequences (animation, move, wait, callback) run off one timer
+"""
+
+from utils import log
+from PyQt5.QtCore import Qt
+from .runtime import get_default_runtime
+
+class TimelineStep:
+    """One declared step of a timeline and its recorded timing."""
+
+    def __init__(self, kind, label, options):
+        self.kind = kind        # 'animation', 'move_to', 'wait' or 'call'
+        self.label = label
+        self.options = options
+
+        # Resolved by Timeline.compile()
+        self.animation_name = None
+        self.duration = None    # Planned length in ms (None = until the move arrives)
+        self.offset = None      # Planned start from the beginning of the timeline (None = after a move)
+
+        # Recorded while running
+        self.planned_start = None
+        self.started_at = None
+        self.finished_at = None
+
+        # Movement state
+        self.position = None
+        self.bounds = None
+
+
+class Timeline:
+    """A sequence declared as steps and compiled into one schedule.
+
+    Steps are declared with animation(), move_to(), wait() and call(), which
+    can be chained. start() resolves animation names and durations, then runs
+    the steps off a single timer: timed steps end exactly at their planned
+    boundary (each step starts where the previous one was scheduled to end,
+    so timer lateness doesn't pile up), and the timer only ticks periodically
+    while something has to move. A timeline can be paused, resumed and
+    cancelled, and records planned vs. actual timing for every step.
+
+    The host is the mascot: it provides animation_loader, start_animation()
+    and the geometry/move methods of a QWidget. Timing comes from the host's
+    runtime (its clock and timer factory).
+    """
+
+    def __init__(self, host, name):
+        self.host = host
+        self.name = name
+        self.steps = []
+        self.index = -1
+        self.on_finished = None
+
+        self.running = False
+        self.paused = False
+        self.cancelled = False
+        self.finished = False
+        self.started_at = None
+        self.paused_at = None
+
+        self.runtime = getattr(host, 'runtime', None) or get_default_runtime()
+        self.clock = self.runtime.clock
+        self.timer = self.runtime.create_timer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_timer)
+
+    # Declaration
+    def animation(self, names=None, category=None, loop=False, extra_ms=0, duration_ms=None,
+                  missing_ms=0, velocity=None, tick_ms=50, label=None):
+        """Play an animation for its frame_count * frame_rate plus extra_ms (or for duration_ms).
+
+        names may be one name or a list of candidates (the first that exists
+        is played); category plays the first animation of a category instead.
+        If nothing is found the step just waits missing_ms. With velocity
+        (dx, dy) the host also walks that many pixels per tick_ms while the
+        animation plays, as long as it stays on screen.
+        """
+        if isinstance(names, str):
+            names = [names]
+        return self.add('animation', label or (names[0] if names else category), {
+            'names': names or [], 'category': category, 'loop': loop, 'extra_ms': extra_ms,
+            'duration_ms': duration_ms, 'missing_ms': missing_ms, 'velocity': velocity, 'tick_ms': tick_ms
+        })
+
+    def move_to(self, target, speed, tick_ms=50, arrive_within=None, clamp_to_screen=True,
+                on_tick=None, label=None):
+        """Move the host towards target by speed pixels per tick_ms until it arrives.
+
+        target is an (x, y) tuple or a callable returning one, evaluated when
+        the step starts. The step ends once the host is within arrive_within
+        pixels (default: one tick of movement). on_tick is called after every
+        move, e.g. to switch walking animations or push windows aside.
+        """
+        return self.add('move_to', label or 'move_to', {
+            'target': target, 'speed': speed, 'tick_ms': tick_ms, 'arrive_within': arrive_within,
+            'clamp_to_screen': clamp_to_screen, 'on_tick': on_tick
+        })
+
+    def wait(self, ms, label=None):
+        """Do nothing for ms milliseconds."""
+        return self.add('wait', label or 'wait', {'ms': ms})
+
+    def call(self, callback, label=None):
+        """Run a callback and continue with the next step right away."""
+        return self.add('call', label or getattr(callback, '__name__', 'call'), {'callback': callback})
+
+    def add(self, kind, label, options):
+        self.steps.append(TimelineStep(kind, label, options))
+        return self
+
+    # Compilation
+    def compile(self):
+        """Resolve animation names and durations and plan each step's offset."""
+        loader = self.host.animation_loader
+        offset = 0
+        for step in self.steps:
+            if step.kind == 'animation':
+                options = step.options
+                name = None
+                if options['category']:
+                    candidates = loader.get_animations_by_category(options['category'])
+                    name = candidates[0] if candidates else None
+                else:
+                    for candidate in options['names']:
+                        if loader.animation_exists(candidate):
+                            name = candidate
+                            break
+                step.animation_name = name
+                info = loader.get_animation_info(name) if name else None
+                if name and options['duration_ms'] is not None:
+                    step.duration = options['duration_ms']
+                elif info:
+                    step.duration = info['frame_count'] * info['frame_rate'] + options['extra_ms']
+                else:
+                    step.duration = options['missing_ms']
+            elif step.kind == 'wait':
+                step.duration = step.options['ms']
+            elif step.kind == 'call':
+                step.duration = 0
+            else:
+                step.duration = None
+
+            step.offset = offset
+            offset = offset + step.duration if offset is not None and step.duration is not None else None
+        return self
+
+    def get_schedule(self):
+        """Get the compiled plan as (label, offset_ms, duration_ms) tuples; None means open-ended."""
+        return [(step.label, step.offset, step.duration) for step in self.steps]
+
+    # Running
+    def start(self):
+        """Compile and start the timeline from its first step."""
+        self.compile()
+        self.running = True
+        self.started_at = self.clock.perf_counter()
+        self.begin_step(0, self.started_at)
+        return self
+
+    def begin_step(self, index, planned_start):
+        """Enter steps from index on; instant steps run back to back without waiting for the timer."""
+        while self.running:
+            self.index = index
+            if index >= len(self.steps):
+                self.finish()
+                return
+
+            step = self.steps[index]
+            now = self.clock.perf_counter()
+            step.planned_start = planned_start
+            step.started_at = now
+
+            if step.kind == 'call':
+                step.options['callback']()
+                step.finished_at = self.clock.perf_counter()
+                index += 1
+                continue
+
+            if step.kind == 'animation' and step.animation_name:
+                self.host.start_animation(step.animation_name, loop=step.options['loop'])
+            elif step.kind == 'animation':
+                log.warning('timeline', "Timeline %s: Animation not found for step '%s'", self.name, step.label)
+
+            if step.kind == 'move_to' or (step.kind == 'animation' and step.options['velocity']):
+                step.position = [float(self.host.x()), float(self.host.y())]
+                screen = self.runtime.snapshot.screen_geometry()
+                step.bounds = (screen.width() - self.host.width(), screen.height() - self.host.height())
+                if step.kind == 'move_to':
+                    target = step.options['target']
+                    step.options['resolved_target'] = target() if callable(target) else target
+
+            if step.duration is not None and step.duration <= 0:
+                step.finished_at = now
+                index += 1
+                continue
+
+            self.schedule(step, now)
+            return
+
+    def schedule(self, step, now):
+        """Arm the single timer for the next tick or step boundary."""
+        if step.kind == 'move_to':
+            self.timer.start(step.options['tick_ms'])
+            return
+        remaining = self.step_deadline(step) - now
+        if step.kind == 'animation' and step.options['velocity']:
+            remaining = min(remaining, step.options['tick_ms'] / 1000)
+        self.timer.start(max(0, int(round(remaining * 1000))))
+
+    def step_deadline(self, step):
+        return step.planned_start + step.duration / 1000
+
+    def on_timer(self):
+        if not self.running or self.paused or self.index >= len(self.steps):
+            return
+        step = self.steps[self.index]
+        now = self.clock.perf_counter()
+
+        if step.kind == 'move_to':
+            if self.advance_move(step):
+                step.finished_at = now
+                self.begin_step(self.index + 1, now)
+            elif self.running:
+                self.schedule(step, now)
+            return
+
+        if step.kind == 'animation' and step.options['velocity']:
+            self.advance_walk(step)
+
+        deadline = self.step_deadline(step)
+        if now >= deadline - 0.001:
+            step.finished_at = now
+            # Next step starts at the exact planned boundary, not when the timer happened to fire
+            self.begin_step(self.index + 1, deadline)
+        else:
+            self.schedule(step, now)
+
+    def advance_move(self, step):
+        """Move one tick towards the target; returns True once arrived."""
+        options = step.options
+        target_x, target_y = options['resolved_target']
+        dx = target_x - step.position[0]
+        dy = target_y - step.position[1]
+        distance = (dx**2 + dy**2)**0.5
+        arrive_within = options['arrive_within'] if options['arrive_within'] is not None else options['speed']
+        if distance <= arrive_within:
+            return True
+
+        step.position[0] += options['speed'] * dx / distance
+        step.position[1] += options['speed'] * dy / distance
+        if options['clamp_to_screen']:
+            step.position[0] = max(0, min(step.position[0], step.bounds[0]))
+            step.position[1] = max(0, min(step.position[1], step.bounds[1]))
+        self.host.move(int(step.position[0]), int(step.position[1]))
+
+        if options['on_tick']:
+            options['on_tick']()
+        return False
+
+    def advance_walk(self, step):
+        """Walk by the step's velocity, skipping moves that would leave the screen."""
+        velocity_x, velocity_y = step.options['velocity']
+        new_x = step.position[0] + velocity_x
+        new_y = step.position[1] + velocity_y
+        if 0 <= new_x <= step.bounds[0] and 0 <= new_y <= step.bounds[1]:
+            step.position = [new_x, new_y]
+            self.host.move(int(new_x), int(new_y))
+
+    def finish(self):
+        self.running = False
+        self.finished = True
+        self.timer.stop()
+        if log.is_enabled('timeline', log.INFO):
+            self.report_timings()
+        if self.on_finished:
+            self.on_finished()
+
+    # Control
+    def cancel(self):
+        """Stop the timeline; no further steps or callbacks run."""
+        if not self.running:
+            return
+        self.running = False
+        self.cancelled = True
+        self.timer.stop()
+
+    def pause(self):
+        if not self.running or self.paused:
+            return
+        self.paused = True
+        self.paused_at = self.clock.perf_counter()
+        self.timer.stop()
+
+    def resume(self):
+        if not self.running or not self.paused:
+            return
+        now = self.clock.perf_counter()
+        self.paused = False
+        step = self.steps[self.index]
+        # Shift the current step's boundary by the time spent paused
+        step.planned_start += now - self.paused_at
+        self.schedule(step, now)
+
+    def is_running(self):
+        return self.running
+
+    def current_label(self):
+        if self.running and 0 <= self.index < len(self.steps):
+            return self.steps[self.index].label
+        return None
+
+    # Timing report
+    def get_timings(self):
+        """Get planned vs. actual timing (ms) of every step that has started."""
+        timings = []
+        for step in self.steps:
+            if step.started_at is None:
+                continue
+            actual = (step.finished_at - step.started_at) * 1000 if step.finished_at is not None else None
+            timings.append({
+                'label': step.label,
+                'kind': step.kind,
+                'planned_ms': step.duration,
+                'actual_ms': actual,
+                'late_ms': (step.started_at - step.planned_start) * 1000
+            })
+        return timings
+
+    def report_timings(self):
+        """Log every step's planned and actual timing as one message."""
+        lines = []
+        for timing in self.get_timings():
+            planned = f"{timing['planned_ms']:.0f}ms" if timing['planned_ms'] is not None else "open"
+            actual = f"{timing['actual_ms']:.0f}ms" if timing['actual_ms'] is not None else "running"
+            lines.append(f"  {timing['label']:<40} planned {planned:>8}  actual {actual:>8}  late {timing['late_ms']:.1f}ms")
+        log.info('timeline', "Timeline %s: step timings\n%s", self.name, '\n'.join(lines))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Virtual Time - Simulated clock and timers for running the mascot faster than real time
+"""
+
+import heapq
+import random
+from .runtime import Runtime
+
+class VirtualClock:
+    """A clock that only moves when advanced.
+
+    time() starts at start_time (seconds since the epoch, like time.time())
+    and perf_counter() at 0.
+    """
+
+    def __init__(self, start_time=0.0):
+        self.start_time = start_time
+        self.now_ms = 0.0
+
+    def time(self):
+        return self.start_time + self.now_ms / 1000
+
+    def perf_counter(self):
+        return self.now_ms / 1000
+
+
+class VirtualSignal:
+    """Stand-in for QTimer.timeout: connect(), disconnect() and emit()."""
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self.slots = []
+        elif slot in self.slots:
+            self.slots.remove(slot)
+
+    def emit(self):
+        for slot in list(self.slots):
+            slot()
+
+
+class VirtualTimer:
+    """The part of the QTimer interface the mascot uses, driven by a VirtualTimerFactory."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.timeout = VirtualSignal()
+        self.interval_ms = 0
+        self.single_shot = False
+        self.active = False
+        self.deadline = None
+        self.generation = 0  # Bumped on every start/stop so stale heap entries are skipped
+
+    def setSingleShot(self, single_shot):
+        self.single_shot = single_shot
+
+    def isSingleShot(self):
+        return self.single_shot
+
+    def setInterval(self, interval_ms):
+        self.interval_ms = int(interval_ms)
+        if self.active:
+            self.start()
+
+    def interval(self):
+        return self.interval_ms
+
+    def setTimerType(self, timer_type):
+        pass
+
+    def start(self, interval_ms=None):
+        if interval_ms is not None:
+            self.interval_ms = int(interval_ms)
+        self.factory.arm(self)
+
+    def stop(self):
+        if self.active:
+            self.factory.disarm(self)
+
+    def isActive(self):
+        return self.active
+
+    def remainingTime(self):
+        if not self.active:
+            return -1
+        return max(0, int(self.deadline - self.factory.clock.now_ms))
+
+
+class VirtualTimerFactory:
+    """Creates VirtualTimers and fires them in deadline order as the clock is advanced."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.queue = []  # (deadline, sequence, generation, timer)
+        self.sequence = 0
+        self.active_timers = set()
+
+        self.created_count = 0
+        self.fired_count = 0
+
+    def create(self, parent=None):
+        self.created_count += 1
+        return VirtualTimer(self)
+
+    def arm(self, timer):
+        timer.generation += 1
+        timer.active = True
+        # Like Qt, a 0 ms repeating timer fires on every pass; give it 1 ms so time moves on
+        interval = timer.interval_ms if timer.single_shot else max(1, timer.interval_ms)
+        timer.deadline = self.clock.now_ms + interval
+        self.active_timers.add(timer)
+        self.sequence += 1
+        heapq.heappush(self.queue, (timer.deadline, self.sequence, timer.generation, timer))
+
+    def disarm(self, timer):
+        timer.generation += 1
+        timer.active = False
+        timer.deadline = None
+        self.active_timers.discard(timer)
+
+    def next_deadline(self):
+        """Get the earliest pending deadline (ms), dropping stale entries."""
+        while self.queue:
+            deadline, _, generation, timer = self.queue[0]
+            if generation == timer.generation and timer.active:
+                return deadline
+            heapq.heappop(self.queue)
+        return None
+
+    def advance(self, ms, between_timers=None):
+        """Move the clock forward ms milliseconds, firing every timer that comes due on the way.
+
+        between_timers is called after each fired timer (e.g. to let Qt
+        process posted events).
+        """
+        target = self.clock.now_ms + ms
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            _, _, _, timer = heapq.heappop(self.queue)
+            self.clock.now_ms = max(self.clock.now_ms, deadline)
+            if timer.single_shot:
+                self.disarm(timer)
+            else:
+                self.arm(timer)
+            self.fired_count += 1
+            timer.timeout.emit()
+            if between_timers:
+                between_timers()
+        self.clock.now_ms = target
+
+    def get_stats(self):
+        return {
+            'created': self.created_count,
+            'active': len(self.active_timers),
+            'fired': self.fired_count,
+            'queued': len(self.queue)
+        }
+
+
+def create_virtual_runtime(seed=None, start_time=0.0):
+    """Build a Runtime on a virtual clock with a seeded random generator (no network access)."""
+    clock = VirtualClock(start_time)
+    return Runtime(clock=clock, timers=VirtualTimerFactory(clock),
+                   rng=random.Random(seed), network_enabled=False, realtime=False)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Walk Region - Where the mascot can walk across all monitors, and paths between any two places
+"""
+
+from collections import deque
+
+class WalkableRegion:
+    """Index of the positions (window top-left corners) the mascot can walk to.
+
+    Built from every screen's available geometry (so taskbars and docks are
+    excluded) for one mascot size. Each screen gives a rectangle of
+    positions where the whole mascot fits inside it with a margin; where two
+    screens share an edge a bridge rectangle, running from one screen's
+    rectangle to the other's, lets the mascot straddle the seam. Rectangles
+    are convex, so moving in a straight line between two points of the same
+    rectangle never leaves the region, and a path between rectangles goes
+    through the middle of their overlaps.
+    """
+
+    def __init__(self, screen_rects, width, height, margin=20):
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.rects = []  # (x1, y1, x2, y2) inclusive, in window top-left coordinates
+
+        for rect in screen_rects:
+            self.add_rect(rect.left() + margin, rect.top() + margin,
+                          rect.left() + rect.width() - width - margin,
+                          rect.top() + rect.height() - height - margin)
+        self.add_bridges(screen_rects)
+
+        # Rectangles that overlap or touch are neighbours
+        self.neighbours = [[j for j in range(len(self.rects)) if j != i and self.overlap(i, j)]
+                           for i in range(len(self.rects))]
+        self.areas = [(x2 - x1 + 1) * (y2 - y1 + 1) for x1, y1, x2, y2 in self.rects]
+        self.total_area = sum(self.areas)
+
+    def add_rect(self, x1, y1, x2, y2):
+        if x1 <= x2 and y1 <= y2:
+            self.rects.append((x1, y1, x2, y2))
+
+    def add_bridges(self, screen_rects):
+        """Add a rectangle across every seam where two screens touch."""
+        w, h, m = self.width, self.height, self.margin
+        edges = [(r.left(), r.top(), r.left() + r.width(), r.top() + r.height()) for r in screen_rects]
+        for i, (ax1, ay1, ax2, ay2) in enumerate(edges):
+            for bx1, by1, bx2, by2 in edges[i + 1:]:
+                if ax2 == bx1 or bx2 == ax1:
+                    # Side by side: the seam is vertical
+                    seam = ax2 if ax2 == bx1 else ax1
+                    top, bottom = max(ay1, by1), min(ay2, by2)
+                    self.add_rect(seam - w - m, top + m, seam + m, bottom - h - m)
+                if ay2 == by1 or by2 == ay1:
+                    # Stacked: the seam is horizontal
+                    seam = ay2 if ay2 == by1 else ay1
+                    left, right = max(ax1, bx1), min(ax2, bx2)
+                    self.add_rect(left + m, seam - h - m, right - w - m, seam + m)
+
+    def overlap(self, i, j):
+        ax1, ay1, ax2, ay2 = self.rects[i]
+        bx1, by1, bx2, by2 = self.rects[j]
+        return ax1 <= bx2 and bx1 <= ax2 and ay1 <= by2 and by1 <= ay2
+
+    # Lookups
+    def is_empty(self):
+        return not self.rects
+
+    def find(self, x, y):
+        """Index of the first rectangle containing (x, y), or None."""
+        for index, (x1, y1, x2, y2) in enumerate(self.rects):
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return index
+        return None
+
+    def contains(self, x, y):
+        return self.find(x, y) is not None
+
+    def nearest(self, x, y):
+        """Get the walkable position closest to (x, y) and the rectangle it is in."""
+        best = None
+        for index, (x1, y1, x2, y2) in enumerate(self.rects):
+            px, py = min(max(x, x1), x2), min(max(y, y1), y2)
+            distance = (px - x) ** 2 + (py - y) ** 2
+            if best is None or distance < best[0]:
+                best = (distance, (px, py), index)
+        return (best[1], best[2]) if best else (None, None)
+
+    def random_point(self, rng):
+        """Pick a walkable position uniformly by area."""
+        if not self.rects:
+            return None
+        pick = rng.uniform(0, self.total_area)
+        for area, (x1, y1, x2, y2) in zip(self.areas, self.rects):
+            if pick <= area:
+                break
+            pick -= area
+        return rng.randint(x1, x2), rng.randint(y1, y2)
+
+    # Paths
+    def find_path(self, start, goal):
+        """Get waypoints from start to goal (goal last) that stay inside the region.
+
+        A start outside the region (dragged off screen, screen removed)
+        first heads to the nearest walkable position. Returns [] if the goal
+        can't be reached.
+        """
+        goal_index = self.find(*goal)
+        if goal_index is None:
+            return []
+        path = []
+        start_index = self.find(*start)
+        if start_index is None:
+            start, start_index = self.nearest(*start)
+            if start is None:
+                return []
+            path.append(start)
+        if start_index == goal_index:
+            return path + [goal]
+
+        # Breadth-first search over the rectangles
+        previous = {start_index: None}
+        queue = deque([start_index])
+        while queue and goal_index not in previous:
+            index = queue.popleft()
+            for neighbour in self.neighbours[index]:
+                if neighbour not in previous:
+                    previous[neighbour] = index
+                    queue.append(neighbour)
+        if goal_index not in previous:
+            return []
+
+        chain = [goal_index]
+        while previous[chain[-1]] is not None:
+            chain.append(previous[chain[-1]])
+        chain.reverse()
+
+        # Cross from one rectangle to the next through the middle of their overlap
+        for a, b in zip(chain, chain[1:]):
+            ax1, ay1, ax2, ay2 = self.rects[a]
+            bx1, by1, bx2, by2 = self.rects[b]
+            path.append(((max(ax1, bx1) + min(ax2, bx2)) // 2, (max(ay1, by1) + min(ay2, by2)) // 2))
+        return path + [goal]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Stall Watchdog - Detects the GUI thread blocking the event loop and records where it was stuck
+"""
+
+import sys
+import time
+import threading
+import traceback
+import config
+from utils import log, trace
+
+class StallWatchdog:
+    """Heartbeat on the GUI thread, checked by a monitor thread.
+
+    A timer stamps a heartbeat every watchdog_heartbeat_interval ms. The
+    monitor thread wakes a few times per threshold; once the heartbeat is
+    more than watchdog_threshold ms overdue the event loop is blocked, so it
+    captures the GUI thread's stack (sys._current_frames) and logs it right
+    away, which also catches hangs that never end. When the heartbeat
+    resumes, the GUI thread measures how long the stall really was and
+    records it (with the captured stack) in the metrics registry, the log
+    and, while one is recording, the trace.
+    """
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.metrics = runtime.metrics
+        self.interval = config.get_setting('debug', 'watchdog_heartbeat_interval', 100) / 1000
+        self.threshold = config.get_setting('debug', 'watchdog_threshold', 250) / 1000
+        self.stack_depth = config.get_setting('debug', 'watchdog_stack_depth', 12)
+
+        self.last_beat = None
+        self.gui_thread_id = None
+        self.pending = None        # (heartbeat the stall followed, stack) captured by the monitor
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        self.timer = runtime.create_timer(name='StallWatchdog.beat')
+        self.timer.timeout.connect(self.beat)
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.gui_thread_id = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.timer.start(int(self.interval * 1000))
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.monitor, name='stall-watchdog', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.timer.stop()
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+    # GUI thread
+    def beat(self):
+        now = time.perf_counter()
+        previous, self.last_beat = self.last_beat, now
+        stalled = now - previous - self.interval
+        if stalled >= self.threshold:
+            self.record(previous, now, stalled)
+
+    def record(self, previous_beat, now, stalled):
+        pending, self.pending = self.pending, None
+        stack = pending[1] if pending and pending[0] == previous_beat else None
+        self.metrics.record_stall(stalled, stack)
+        log.warning('watchdog', "GUI thread was blocked for at least %.0f ms", stalled * 1000)
+        trace.get_tracer().complete('stall', 'watchdog', previous_beat + self.interval, now,
+                                    {'stack': stack} if stack else None)
+
+    # Monitor thread
+    def monitor(self):
+        reported = None  # Heartbeat whose stall was already captured
+        while not self.stop_event.wait(self.threshold / 4):
+            beat = self.last_beat
+            blocked = time.perf_counter() - beat - self.interval
+            if blocked < self.threshold or beat == reported:
+                continue
+            reported = beat
+            frame = sys._current_frames().get(self.gui_thread_id)
+            if frame is None:
+                return  # The GUI thread is gone
+            stack = ''.join(traceback.format_stack(frame)[-self.stack_depth:])
+            frame = None
+            self.pending = (beat, stack)
+            log.warning('watchdog', "GUI thread blocked for over %.0f ms in:\n%s", blocked * 1000, stack.rstrip())
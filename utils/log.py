@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Log - Leveled, rate-limited logging written to the console and a rotating file off the GUI thread
+"""
+
+import os
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+import config
+from utils.path_helper import get_config_path
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+class Logger:
+    """Leveled logging by category, driven by DEBUG_SETTINGS.
+
+    Call sites pass a category ('afk', 'walk', 'showdown', ...), a message
+    template and its arguments: log.debug('showdown', "Fired shot at (%d, %d)", x, y).
+
+    - Each category has a level (log_level, overridden per category by
+      log_category_levels; enable_debug_output turns everything to DEBUG).
+      A message below every level returns after one integer comparison,
+      before anything is formatted.
+    - Each call site (category and template) may log at most
+      log_rate_limit messages per second; the rest are counted and the
+      count is added to the next message that gets through.
+    - Messages go into a ring buffer (a bounded deque, so appending needs
+      no lock and a flood drops the oldest) and a background thread
+      formats them and writes them to the console, if there is one, and to
+      a rotating file in the config directory. The GUI thread never
+      blocks on a console or disk write.
+    """
+
+    def __init__(self):
+        self.buffer = deque(maxlen=config.get_setting('debug', 'log_buffer_size', 4096))
+        self.recent = deque(maxlen=200)  # Last formatted lines, for showing in the app
+        self.wakeup = threading.Event()
+        self.write_lock = threading.Lock()  # Only between the writer thread and flush()
+        self.thread = None
+        self.file = None
+        self.file_path = None
+        self.console_override = None
+        self.file_override = None
+
+        self.sites = {}  # (category, template) -> [window start, count in window, suppressed]
+        self.settings_version = None
+        self.default_level = INFO
+        self.category_levels = {}
+        self.min_level = INFO
+
+        self.stats = {'logged': 0, 'filtered': 0, 'suppressed': 0, 'dropped': 0, 'written': 0, 'rotations': 0}
+        self.load_settings()
+
+    # Settings
+    def load_settings(self):
+        self.settings_version = config.get_settings_version()
+        if config.get_setting('debug', 'enable_debug_output', False):
+            self.default_level = DEBUG
+        else:
+            self.default_level = LEVELS.get(str(config.get_setting('debug', 'log_level', 'INFO')).upper(), INFO)
+        self.category_levels = {}
+        for category, level in config.get_setting('debug', 'log_category_levels', {}).items():
+            self.category_levels[category] = LEVELS.get(str(level).upper(), self.default_level)
+        self.min_level = min([self.default_level] + list(self.category_levels.values()))
+        self.rate_limit = config.get_setting('debug', 'log_rate_limit', 5)
+        self.flush_interval = config.get_setting('debug', 'log_flush_interval', 250) / 1000
+        self.max_bytes = config.get_setting('debug', 'log_file_max_bytes', 1024 * 1024)
+        self.backups = config.get_setting('debug', 'log_file_backups', 3)
+
+    def configure(self, console=None, file=None):
+        """Override whether the console and the file get messages (None follows DEBUG_SETTINGS)."""
+        self.console_override = console
+        self.file_override = file
+
+    def is_enabled(self, category, level):
+        if self.settings_version != config.get_settings_version():
+            self.load_settings()
+        return level >= self.category_levels.get(category, self.default_level)
+
+    # Logging
+    def log(self, level, category, message, args):
+        if level < self.min_level and self.settings_version == config.get_settings_version():
+            return
+        if not self.is_enabled(category, level):
+            self.stats['filtered'] += 1
+            return
+
+        # Per call site rate limit
+        now = time.time()
+        site = self.sites.get((category, message))
+        if site is None:
+            site = self.sites[(category, message)] = [now, 0, 0]
+        if now - site[0] >= 1.0:
+            site[0] = now
+            site[1] = 0
+        if self.rate_limit and site[1] >= self.rate_limit and level < ERROR:
+            site[2] += 1
+            self.stats['suppressed'] += 1
+            return
+        site[1] += 1
+        suppressed = site[2]
+        site[2] = 0
+
+        if len(self.buffer) == self.buffer.maxlen:
+            self.stats['dropped'] += 1
+        self.buffer.append((now, level, category, message, args, suppressed))
+        self.stats['logged'] += 1
+        self.start_thread()
+        self.wakeup.set()
+
+    def start_thread(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='log-writer', daemon=True)
+            self.thread.start()
+            atexit.register(self.flush)
+
+    # Writer thread
+    def run(self):
+        while True:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            time.sleep(self.flush_interval)  # Let a burst collect so it's written in one go
+            self.drain()
+
+    def drain(self):
+        """Format and write everything buffered (also called on exit)."""
+        with self.write_lock:
+            self.write_buffered()
+
+    def write_buffered(self):
+        lines = []
+        while self.buffer:
+            try:
+                lines.append(self.format(*self.buffer.popleft()))
+            except IndexError:
+                break
+        if not lines:
+            return
+        self.recent.extend(lines)
+        text = '\n'.join(lines) + '\n'
+
+        if self.console_override if self.console_override is not None else config.get_setting('debug', 'log_to_console', True):
+            stream = sys.stdout
+            if stream is not None:  # None in a windowed build
+                try:
+                    stream.write(text)
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+        if self.file_override if self.file_override is not None else config.get_setting('debug', 'log_to_file', True):
+            self.write_file(text)
+        self.stats['written'] += len(lines)
+
+    def format(self, created, level, category, message, args, suppressed):
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        line = f"{time.strftime('%H:%M:%S', time.localtime(created))}.{int(created * 1000) % 1000:03d} {LEVEL_NAMES.get(level, level):<7} [{category}] {message}"
+        if suppressed:
+            line += f" ({suppressed} similar suppressed)"
+        return line
+
+    def write_file(self, text):
+        try:
+            if self.file is None:
+                self.file_path = os.path.join(get_config_path(), 'mascot.log')
+                self.file = open(self.file_path, 'a', encoding='utf-8')
+            self.file.write(text)
+            self.file.flush()
+            if self.file.tell() >= self.max_bytes:
+                self.rotate()
+        except OSError:
+            self.file = None
+
+    def rotate(self):
+        """mascot.log -> mascot.log.1 -> ... -> mascot.log.<backups>, dropping the oldest."""
+        self.file.close()
+        self.file = None
+        for index in range(self.backups, 0, -1):
+            source = self.file_path if index == 1 else f"{self.file_path}.{index - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.file_path}.{index}")
+        self.stats['rotations'] += 1
+
+    # Inspection
+    def flush(self):
+        """Write everything buffered now, on the calling thread."""
+        self.drain()
+
+    def get_recent(self, count=50):
+        return list(self.recent)[-count:]
+
+    def get_stats(self):
+        return dict(self.stats, buffered=len(self.buffer))
+
+
+_logger = None
+
+def get_logger():
+    """Get the shared logger."""
+    global _logger
+    if _logger is None:
+        _logger = Logger()
+    return _logger
+
+def debug(category, message, *args):
+    get_logger().log(DEBUG, category, message, args)
+
+def info(category, message, *args):
+    get_logger().log(INFO, category, message, args)
+
+def warning(category, message, *args):
+    get_logger().log(WARNING, category, message, args)
+
+def error(category, message, *args):
+    get_logger().log(ERROR, category, message, args)
+
+def is_enabled(category, level=DEBUG):
+    """Check before building an expensive message."""
+    return get_logger().is_enabled(category, level)
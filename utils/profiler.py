@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Profiler - cProfile capture and a low-overhead sampling profiler of the GUI thread, saved as collapsed stacks
+"""
+
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import threading
+import config
+from utils import log
+from utils.path_helper import get_config_path
+
+class SessionProfiler:
+    """Profiles everything the GUI thread runs between start() and stop().
+
+    cProfile is enabled from inside the event loop, so every slot, timer
+    callback and event handler Qt calls into Python while it is on is
+    profiled (time spent waiting in the event loop is not Python code and
+    doesn't show up). stop() writes, to the config directory:
+
+    - profile-<time>.pstats, for pstats, snakeviz and friends,
+    - profile-<time>.folded, collapsed stacks ("a;b;c microseconds") for
+      flamegraph.pl, speedscope or inferno,
+
+    and logs the top profile_top_n functions. Everything is stdlib, so it
+    works in the frozen build.
+    """
+
+    MIN_FOLDED_US = 1  # Stacks below this many microseconds are left out of the flamegraph
+
+    def __init__(self):
+        self.profile = None
+        self.started_at = None
+
+    def is_running(self):
+        return self.profile is not None
+
+    def start(self):
+        if self.profile is not None:
+            return
+        self.profile = cProfile.Profile()
+        self.started_at = time.time()
+        self.profile.enable()
+        log.info('profile', "Profiling started")
+
+    def stop(self):
+        """Stop profiling and write the results; returns (pstats path, folded path) or None."""
+        if self.profile is None:
+            return None
+        profile = self.profile
+        profile.disable()
+        self.profile = None
+        seconds = time.time() - self.started_at
+
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at))
+        base = os.path.join(get_config_path(), f"profile-{stamp}")
+        stats = pstats.Stats(profile)
+        stats.dump_stats(base + '.pstats')
+        with open(base + '.folded', 'w', encoding='utf-8') as f:
+            for stack, microseconds in sorted(self.collapse(stats).items()):
+                f.write(f"{stack} {microseconds}\n")
+
+        log.info('profile', "Profiled %.1fs, saved %s.pstats and %s.folded\n%s",
+                 seconds, base, base, self.summary(stats))
+        return base + '.pstats', base + '.folded'
+
+    def summary(self, stats):
+        """The top functions by cumulative time, as pstats prints them."""
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(config.get_setting('debug', 'profile_sort', 'cumulative'))
+        stats.print_stats(config.get_setting('debug', 'profile_top_n', 25))
+        stats.stream = None
+        return stream.getvalue().strip()
+
+    # Collapsed stacks
+    def collapse(self, stats):
+        """Rebuild call stacks from pstats' caller/callee edges.
+
+        cProfile only keeps, per function, the time spent in it and in each
+        of its callers' calls to it, not whole stacks. Each function's own
+        time is spread over the paths leading to it in proportion to how much
+        of its cumulative time each caller accounts for, which is exact for
+        functions with one caller and a fair estimate otherwise.
+        """
+        entries = stats.stats  # func -> (cc, nc, tt, ct, callers)
+        callees = {}
+        for func, (cc, nc, tt, ct, callers) in entries.items():
+            for caller, edge in callers.items():
+                callees.setdefault(caller, []).append((func, edge[3]))
+
+        folded = {}
+        roots = [func for func, entry in entries.items() if not entry[4]]
+        for root in roots:
+            self.collapse_from(root, [], 1.0, entries, callees, folded)
+        return folded
+
+    def collapse_from(self, func, stack, share, entries, callees, folded):
+        stack = stack + [self.label(func)]
+        cc, nc, tt, ct, callers = entries[func]
+        own = int(tt * share * 1e6)
+        if own >= self.MIN_FOLDED_US:
+            key = ';'.join(stack)
+            folded[key] = folded.get(key, 0) + own
+        for callee, edge_time in callees.get(func, ()):
+            callee_total = entries[callee][3]
+            if callee_total <= 0 or self.label(callee) in stack:
+                continue  # Recursion is folded into the outermost call
+            callee_share = share * edge_time / callee_total
+            if callee_share * callee_total * 1e6 >= self.MIN_FOLDED_US:
+                self.collapse_from(callee, stack, callee_share, entries, callees, folded)
+
+    def label(self, func):
+        return function_label(*func)
+
+
+def function_label(filename, line, name):
+    """How a function appears in collapsed stacks: "next_frame (mascot.py:384)"."""
+    if filename == '~':
+        return name  # Built-ins: "<method 'append' of 'list' objects>"
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class SamplingProfiler:
+    """Samples the GUI thread's Python stack from a background thread.
+
+    cProfile hooks every call, which inflates short callbacks (a bullet
+    update is mostly call overhead under cProfile). This instead looks at
+    the GUI thread's current stack every sampling_interval ms through
+    sys._current_frames() and counts how often each stack is seen, so the
+    cost is per sample, not per call, and the program runs unmodified in
+    between.
+
+    Overhead is bounded and measured: each sample is timed (the GUI thread
+    can't run Python while the sampler holds the GIL), and when sampling
+    takes more than sampling_max_overhead of the time the interval is
+    doubled, then halved again once it's cheap. At most sampling_max_stacks
+    distinct stacks of sampling_max_depth frames are kept (further new
+    stacks are only counted), so it can run for hours. Stacks are kept as
+    tuples of code objects and only turned into text by dump().
+    """
+
+    def __init__(self):
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()  # Between the sampler adding to stacks and dump() reading them
+        self.target_id = None
+        self.reset()
+
+    def reset(self):
+        self.stacks = {}         # tuple of code objects (root first) -> samples
+        self.samples = 0
+        self.overflow = 0        # Samples of new stacks after sampling_max_stacks was reached
+        self.sampling_time = 0.0
+        self.started_at = None
+        self.interval = config.get_setting('debug', 'sampling_interval', 10) / 1000
+        self.backoffs = 0
+
+    def is_running(self):
+        return self.thread is not None
+
+    def start(self, thread_id=None):
+        """Start sampling thread_id (the calling thread by default), keeping earlier samples."""
+        if self.thread is not None:
+            return
+        self.target_id = thread_id or threading.get_ident()
+        self.started_at = self.started_at or time.time()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name='sampling-profiler', daemon=True)
+        self.thread.start()
+        log.info('profile', "Sampling profiler started (every %.0f ms)", self.interval * 1000)
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        log.info('profile', "Sampling profiler stopped")
+
+    # Sampler thread
+    def run(self):
+        base_interval = config.get_setting('debug', 'sampling_interval', 10) / 1000
+        max_overhead = config.get_setting('debug', 'sampling_max_overhead', 0.01)
+        max_stacks = config.get_setting('debug', 'sampling_max_stacks', 20000)
+        max_depth = config.get_setting('debug', 'sampling_max_depth', 64)
+        self.interval = base_interval
+        smoothed = None  # Moving average of the cost of a sample
+
+        while not self.stop_event.wait(self.interval):
+            started = time.perf_counter()
+            frame = sys._current_frames().get(self.target_id)
+            if frame is None:
+                break  # The thread is gone
+            codes = []
+            while frame is not None and len(codes) < max_depth:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            frame = None
+            stack = tuple(reversed(codes))
+            with self.lock:
+                if stack in self.stacks:
+                    self.stacks[stack] += 1
+                elif len(self.stacks) < max_stacks:
+                    self.stacks[stack] = 1
+                else:
+                    self.overflow += 1
+                self.samples += 1
+            cost = time.perf_counter() - started
+            self.sampling_time += cost
+
+            # Keep the share of time spent sampling under max_overhead (judged on a smoothed
+            # cost, since one sample that had to wait for the GIL shouldn't slow sampling down)
+            smoothed = cost if smoothed is None else smoothed + (cost - smoothed) * 0.1
+            if smoothed > self.interval * max_overhead:
+                self.interval *= 2
+                self.backoffs += 1
+                smoothed = None
+            elif self.interval > base_interval and smoothed * 4 < self.interval * max_overhead:
+                self.interval = max(base_interval, self.interval / 2)
+
+    # Results
+    def get_stats(self):
+        elapsed = time.time() - self.started_at if self.started_at else 0.0
+        return {
+            'running': self.is_running(),
+            'samples': self.samples,
+            'stacks': len(self.stacks),
+            'overflow': self.overflow,
+            'interval_ms': self.interval * 1000,
+            'backoffs': self.backoffs,
+            'sample_cost_us': self.sampling_time / self.samples * 1e6 if self.samples else 0.0,
+            'overhead': self.sampling_time / elapsed if elapsed > 0 else 0.0
+        }
+
+    def collapse(self):
+        """Get the samples as collapsed stacks: {"a;b;c": samples}."""
+        with self.lock:
+            stacks = list(self.stacks.items())
+        folded = {}
+        for codes, count in stacks:
+            key = ';'.join(function_label(code.co_filename, code.co_firstlineno, code.co_name) for code in codes)
+            folded[key] = folded.get(key, 0) + count
+        return folded
+
+    def summary(self, folded, top=15):
+        """The functions seen most often on top of the stack (self) and anywhere in it (total)."""
+        own = {}
+        total = {}
+        for stack, count in folded.items():
+            frames = stack.split(';')
+            own[frames[-1]] = own.get(frames[-1], 0) + count
+            for label in set(frames):
+                total[label] = total.get(label, 0) + count
+        samples = max(1, sum(folded.values()))
+        lines = [f"{'self %':>7} {'total %':>7}  function"]
+        for label, count in sorted(own.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"{count / samples * 100:>6.1f}% {total[label] / samples * 100:>6.1f}%  {label}")
+        return '\n'.join(lines)
+
+    def dump(self, path=None):
+        """Write the collapsed stacks so far (samples-<time>.folded in the config directory) and log a summary."""
+        if path is None:
+            stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at or time.time()))
+            path = os.path.join(get_config_path(), f"samples-{stamp}.folded")
+        folded = self.collapse()
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(folded.items()):
+                f.write(f"{stack} {count}\n")
+        stats = self.get_stats()
+        log.info('profile', "Saved %d samples to %s (%.0f us per sample, %.2f%% overhead, %d stacks dropped)\n%s",
+                 stats['samples'], path, stats['sample_cost_us'], stats['overhead'] * 100, stats['overflow'],
+                 self.summary(folded, config.get_setting('debug', 'profile_top_n', 25)))
+        return path
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Trace - Records spans and events as a Chrome/Perfetto trace (chrome://tracing, ui.perfetto.dev)
+"""
+
+import os
+import json
+import time
+import threading
+from collections import deque
+import config
+from utils.path_helper import get_config_path
+
+class Span:
+    """Context manager timing one span: with trace.span('scale_frame', 'sprites', scale=2.0): ..."""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.complete(self.name, self.category, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class NullSpan:
+    """What span() returns while nothing is being recorded."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """Records a session as Chrome trace events while recording is on.
+
+    Events are kept as tuples in a bounded deque (trace_buffer_size,
+    oldest dropped first), so recording costs an append per event and a
+    forgotten recording can't grow without limit; appending from worker
+    threads needs no lock. They are turned into trace JSON only when the
+    recording is saved. Times come from time.perf_counter() and every event
+    carries the OS id of the thread it happened on.
+    """
+
+    def __init__(self):
+        self.events = deque(maxlen=config.get_setting('debug', 'trace_buffer_size', 200000))
+        self.recording = False
+        self.started_at = None
+        self.appended = 0
+        self.thread_names = {}  # OS thread id -> name
+        if config.get_setting('debug', 'trace_on_startup', False):
+            self.start()
+
+    # Recording
+    def start(self):
+        """Start a new recording (dropping whatever was recorded before)."""
+        self.events = deque(maxlen=config.get_setting('debug', 'trace_buffer_size', 200000))
+        self.appended = 0
+        self.started_at = time.time()
+        self.name_thread(threading.current_thread().name)
+        self.recording = True
+
+    def stop(self):
+        """Stop recording; the events stay until the next start()."""
+        self.recording = False
+
+    def complete(self, name, category, start, end, args=None):
+        """Record a span that ran from start to end (perf_counter seconds)."""
+        if self.recording:
+            self.events.append(('X', name, category, start, end - start, threading.get_native_id(), args))
+            self.appended += 1
+
+    def instant(self, name, category, args=None):
+        if self.recording:
+            self.events.append(('i', name, category, time.perf_counter(), 0, threading.get_native_id(), args))
+            self.appended += 1
+
+    def async_begin(self, name, category, track_id, args=None):
+        """Start a slice on its own track (e.g. the current state), which may overlap anything on the thread."""
+        if self.recording:
+            self.events.append(('b', name, category, time.perf_counter(), track_id, threading.get_native_id(), args))
+            self.appended += 1
+
+    def async_end(self, name, category, track_id):
+        if self.recording:
+            self.events.append(('e', name, category, time.perf_counter(), track_id, threading.get_native_id(), None))
+            self.appended += 1
+
+    def span(self, name, category, args=None):
+        return Span(self, name, category, args) if self.recording else NULL_SPAN
+
+    def name_thread(self, name):
+        """Name the calling thread in the trace (QThreads aren't known to the threading module)."""
+        self.thread_names[threading.get_native_id()] = name
+
+    # Saving
+    def to_chrome_events(self, events):
+        pid = os.getpid()
+        chrome_events = [{'ph': 'M', 'name': 'process_name', 'pid': pid, 'args': {'name': 'Clover Desktop Mascot'}}]
+        for tid, name in self.thread_names.items():
+            chrome_events.append({'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+        for phase, name, category, start, extra, tid, args in events:
+            event = {'ph': phase, 'name': name, 'cat': category, 'ts': start * 1e6, 'pid': pid, 'tid': tid}
+            if phase == 'X':
+                event['dur'] = extra * 1e6
+            elif phase == 'i':
+                event['s'] = 't'
+            else:
+                event['id'] = extra
+            if args:
+                event['args'] = args
+            chrome_events.append(event)
+        return chrome_events
+
+    def default_path(self):
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at or time.time()))
+        return os.path.join(get_config_path(), f"trace-{stamp}.json")
+
+    def save(self, path=None, events=None):
+        """Write the recorded events as trace JSON (trace-<time>.json in the config directory by default)."""
+        path = path or self.default_path()
+        if events is None:
+            events = list(self.events)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.to_chrome_events(events), 'displayTimeUnit': 'ms'}, f)
+        return path
+
+    def save_in_background(self, on_saved=None):
+        """Save on a worker thread so writing a large trace doesn't stall the GUI; returns the path."""
+        path = self.default_path()
+        events = list(self.events)  # Copied here, where events are appended, not on the writer thread
+
+        def write():
+            self.save(path, events)
+            if on_saved:
+                on_saved(path)
+
+        threading.Thread(target=write, name='trace-writer', daemon=True).start()
+        return path
+
+    def get_stats(self):
+        return {
+            'recording': self.recording,
+            'events': len(self.events),
+            'dropped': self.appended - len(self.events)
+        }
+
+
+_tracer = None
+
+def get_tracer():
+    """Get the shared tracer."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+def span(name, category, /, **args):
+    return get_tracer().span(name, category, args or None)
+
+def instant(name, category, /, **args):
+    get_tracer().instant(name, category, args or None)
+
+def is_recording():
+    return get_tracer().recording